@@ -72,5 +72,8 @@ setup(
         'zope.interface',
         'zope.publisher >= 4.2.2',
     ],
-    extras_require={'test': tests_require},
+    extras_require={
+        'test': tests_require,
+        'benchmark': tests_require + ['pyperf'],
+    },
 )
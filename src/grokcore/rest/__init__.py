@@ -11,18 +11,78 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
+"""The API of grokcore.rest, which includes the API of grokcore.component,
+grokcore.security and grokcore.view.
 
-from grokcore.component import *
-from grokcore.security import *
-from grokcore.view import *
-from zope.interface import moduleProvides
+The names are imported when they are first looked up, so importing
+``grokcore.rest`` or one of its modules does not import the whole
+component architecture.
+"""
+import importlib
+import sys
 
-from grokcore.rest.components import REST
-from grokcore.rest.directive import restskin
-from grokcore.rest.interfaces import IREST
-from grokcore.rest.interfaces import IRESTLayer
-from grokcore.rest.interfaces import IRESTSkinType
 
+# The packages whose API is part of ours, as by ``import *``.  Names are
+# taken from the last package defining them.
+_reexported = (
+    'grokcore.component',
+    'grokcore.security',
+    'grokcore.view',
+)
 
-moduleProvides(IREST)
-__all__ = list(IREST)
+# The names defined by grokcore.rest itself, by module.
+_exported = {
+    'REST': 'grokcore.rest.components',
+    'cors': 'grokcore.rest.directive',
+    'max_body_size': 'grokcore.rest.directive',
+    'responsecache': 'grokcore.rest.directive',
+    'restskin': 'grokcore.rest.directive',
+    'workpool': 'grokcore.rest.directive',
+    'IREST': 'grokcore.rest.interfaces',
+    'IRESTBatchLayer': 'grokcore.rest.interfaces',
+    'IRESTDeserializer': 'grokcore.rest.interfaces',
+    'IRESTLayer': 'grokcore.rest.interfaces',
+    'IRESTSerializer': 'grokcore.rest.interfaces',
+    'IRESTSkinSelector': 'grokcore.rest.interfaces',
+    'IRESTSkinType': 'grokcore.rest.interfaces',
+    'IRESTTimingSink': 'grokcore.rest.interfaces',
+    'StreamingResult': 'grokcore.rest.streaming',
+}
+
+# The names of `IREST`.
+__all__ = ['context', 'request']
+
+
+def __getattr__(name):
+    if name == '__provides__':
+        # The module provides `IREST`, which is declared once it is asked.
+        from zope.interface import directlyProvides
+
+        from grokcore.rest.interfaces import IREST
+        directlyProvides(sys.modules[__name__], IREST)
+        return globals()[name]
+    if name.startswith('_'):
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    module = _exported.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    else:
+        for module in reversed(_reexported):
+            module = importlib.import_module(module)
+            if name in module.__all__:
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(globals())
+    names.update(_exported)
+    for module in _reexported:
+        names.update(importlib.import_module(module).__all__)
+    return sorted(names)
@@ -0,0 +1,201 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Serving the publisher to ASGI servers.
+
+`ASGIApplication` wraps the WSGI application of the Zope publisher, such
+as the one made by `zope.app.wsgi.getWSGIApplication()`, so it can run
+under ASGI servers like uvicorn::
+
+  from zope.app.wsgi import getWSGIApplication
+  from grokcore.rest.asgi import ASGIApplication
+
+  application = ASGIApplication(getWSGIApplication('zope.conf'))
+
+Requests are published exactly as before: REST skins, the dispatch of
+HTTP methods to REST views and the answers to disallowed methods all
+remain the business of the publication.  Since publishing is
+synchronous and the database connections and the security interaction
+belong to a thread, every request is published in a thread of a pool.
+
+The request body is received on the event loop before the request is
+published, in memory up to `SPOOL_SIZE` bytes and in a temporary file
+beyond that, so slow uploads don't occupy a publishing thread.  The
+response is sent chunk by chunk as the publisher produces it, so
+streaming results reach the client while they are produced.  The
+publishing thread waits for every chunk to be taken by the server,
+which may be as slow as the client reading it: a thread of the pool is
+taken from the start of publishing until the last chunk was sent.
+
+"""
+import asyncio
+import concurrent.futures
+import sys
+import tempfile
+from urllib.parse import unquote_to_bytes
+
+
+# The size up to which request bodies are kept in memory.
+SPOOL_SIZE = 1024 * 1024
+
+
+async def receiveBody(receive, spool_size=SPOOL_SIZE):
+    """Receive the body of an ASGI request into a file.
+
+    Returns `None` if the client went away before sending all of it.
+    """
+    body = tempfile.SpooledTemporaryFile(spool_size)
+    more = True
+    while more:
+        message = await receive()
+        if message['type'] != 'http.request':
+            body.close()
+            return None
+        body.write(message.get('body', b''))
+        more = message.get('more_body', False)
+    body.seek(0)
+    return body
+
+
+def makeEnviron(scope, body):
+    """Return the WSGI environment of the ASGI HTTP `scope`."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    path = scope.get('raw_path')
+    if path is None:
+        path = scope['path'].encode('utf-8')
+    else:
+        # Unlike ``path``, ``raw_path`` is still percent-encoded.
+        path = unquote_to_bytes(path.split(b'?', 1)[0])
+    root_path = scope.get('root_path', '').encode('utf-8')
+    if path.startswith(root_path):
+        path = path[len(root_path):]
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.decode('latin-1'),
+        'PATH_INFO': path.decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', ()):
+        key = name.decode('latin-1').upper().replace('-', '_')
+        if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            key = 'HTTP_' + key
+        value = value.decode('latin-1')
+        if key in environ:
+            value = environ[key] + ',' + value
+        environ[key] = value
+    return environ
+
+
+class ASGIApplication:
+    """ASGI application publishing requests with a WSGI `application`.
+
+    Requests are published in a pool of `max_workers` threads, unless an
+    `executor` is given.
+    """
+
+    def __init__(self, application, max_workers=None, executor=None):
+        self.application = application
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers, thread_name_prefix='grokcore.rest')
+        self.executor = executor
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            await self.handle(scope, receive, send)
+        elif scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        else:
+            raise ValueError('Unsupported ASGI scope %r' % scope['type'])
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle(self, scope, receive, send):
+        body = await receiveBody(receive)
+        if body is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                self.executor, self.publish, makeEnviron(scope, body), send,
+                loop)
+        finally:
+            body.close()
+
+    def publish(self, environ, send, loop):
+        """Publish the request of `environ` and send its response.
+
+        This runs in a publishing thread.
+        """
+        started = []
+        sent = []
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None:
+                try:
+                    if sent:
+                        # Too late to send another response.
+                        raise exc_info[1].with_traceback(exc_info[2])
+                finally:
+                    exc_info = None
+            code = int(status.split(' ', 1)[0])
+            started[:] = [{
+                'type': 'http.response.start',
+                'status': code,
+                'headers': [
+                    (name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in headers],
+            }]
+
+        def emit(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def emitStart():
+            if started:
+                sent.append(True)
+                emit(started.pop())
+
+        result = self.application(environ, start_response)
+        try:
+            for chunk in result:
+                if not chunk:
+                    continue
+                emitStart()
+                emit({'type': 'http.response.body', 'body': chunk,
+                      'more_body': True})
+            emitStart()
+            emit({'type': 'http.response.body', 'body': b''})
+        finally:
+            close = getattr(result, 'close', None)
+            if close is not None:
+                close()
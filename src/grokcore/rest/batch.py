@@ -0,0 +1,202 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Batches of REST requests.
+
+Posting a list of operations to the ``++batch++`` namespace of an object
+in a REST skin publishes all of them in one request.  Only REST layers
+extending `IRESTBatchLayer` have the namespace::
+
+  class APILayer(grok.IRESTBatchLayer):
+      grok.restskin('api')
+
+Batches are then posted like this::
+
+  POST /++rest++api/herd/++batch++
+  Content-Type: application/json
+
+  [{"method": "GET", "path": "manfred"},
+   {"method": "PUT", "path": "ellie", "body": {"age": 12}}]
+
+The paths are relative to the object the batch was posted to.  Every
+operation may give `headers` and a `body`, which is sent as JSON unless
+it is a string.  The answer lists the `status`, `headers` and `body` of
+every operation, in order.  Bodies that are not UTF-8 text are encoded
+as base64, which is told by an `encoding` of ``base64``.
+
+Each operation is traversed and published like a request of its own,
+security checks included, but all of them share the interaction and the
+transaction of the batch request.  An operation that fails is rolled
+back to a savepoint and does not affect the others.  Conflict errors
+abort the whole batch, so the publisher can retry it.
+
+"""
+import base64
+import io
+import logging
+import urllib.parse
+
+import grokcore.component as grok
+import grokcore.view
+import transaction
+import zope.location
+from grokcore.component.interfaces import IContext
+from transaction.interfaces import TransientError
+from zope.interface import Interface
+from zope.interface import directlyProvidedBy
+from zope.interface import directlyProvides
+from zope.interface import implementer
+from zope.publisher.http import HTTPRequest
+from zope.publisher.interfaces import NotFound
+from zope.publisher.interfaces.http import MethodNotAllowed
+from zope.security.interfaces import Unauthorized
+from zope.traversing.interfaces import TraversalError
+from zope.traversing.namespace import SimpleHandler
+
+import grokcore.rest
+from grokcore.rest.publication import callRESTMethod
+from grokcore.rest.requestbody import MalformedRequestBody
+from grokcore.rest.requestbody import RequestBodyError
+from grokcore.rest.requestbody import RequestEntityTooLarge
+from grokcore.rest.serializers import dumpJSON
+from grokcore.rest.workpools import ServiceUnavailable
+
+
+logger = logging.getLogger(__name__)
+
+MAX_OPERATIONS = 100
+
+# Parts of the environment describing the request itself rather than
+# the client and the server.
+_request_keys = (
+    'CONTENT_LENGTH', 'CONTENT_TYPE', 'PATH_INFO', 'QUERY_STRING',
+    'REQUEST_METHOD', 'wsgi.input')
+
+
+class IBatch(Interface):
+    """The resource batches of REST requests are posted to."""
+
+
+@implementer(IBatch, IContext)
+class Batch(zope.location.Location):
+    """The resource batches of REST requests are posted to."""
+
+    def __init__(self, context):
+        self.__parent__ = context
+        self.__name__ = '++batch++'
+
+
+class batch(SimpleHandler):
+    """The ``++batch++`` traversal namespace of REST skins."""
+
+    def traverse(self, name, ignored):
+        return Batch(self.context)
+
+
+class BatchREST(grokcore.rest.REST):
+    """REST view publishing the operations posted to a batch."""
+    grokcore.view.layer(grokcore.rest.IRESTBatchLayer)
+    grok.context(IBatch)
+
+    def POST(self):
+        operations = self.parsed_body
+        if not isinstance(operations, list):
+            raise MalformedRequestBody(
+                self.context, self.request, 'A list of operations expected')
+        if len(operations) > MAX_OPERATIONS:
+            raise RequestEntityTooLarge(
+                self.context, self.request, MAX_OPERATIONS)
+        return [self._publish(operation) for operation in operations]
+
+    def _publish(self, operation):
+        """Publish one operation and return the outcome."""
+        try:
+            request = self._subrequest(operation)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return {'status': 400, 'headers': {}, 'body': 'Bad Request'}
+        try:
+            response = request.response
+            savepoint = transaction.savepoint(optimistic=True)
+            try:
+                ob = request.traverse(self.context.__parent__)
+                result = callRESTMethod(request, ob)
+                if result is not response:
+                    response.setResult(result)
+            except TransientError:
+                raise
+            except Exception as error:
+                savepoint.rollback()
+                return self._error(error)
+            return self._outcome(response)
+        finally:
+            request.close()
+
+    def _subrequest(self, operation):
+        """Return the request of an operation."""
+        method = operation['method'].upper()
+        path, _, query = operation['path'].lstrip('/').partition('?')
+        body = operation.get('body')
+        environ = {
+            key: value for key, value in self.request.environment.items()
+            if key not in _request_keys}
+        environ.update(
+            REQUEST_METHOD=method, PATH_INFO='/' + path, QUERY_STRING=query)
+        if body is not None:
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            else:
+                body = dumpJSON(body)
+                environ['CONTENT_TYPE'] = 'application/json'
+            environ['CONTENT_LENGTH'] = str(len(body))
+        for name, value in operation.get('headers', {}).items():
+            key = name.upper().replace('-', '_')
+            if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                key = 'HTTP_' + key
+            environ[key] = str(value)
+
+        request = HTTPRequest(io.BytesIO(body or b''), environ)
+        request.setPublication(self.request.publication)
+        request.setPrincipal(self.request.principal)
+        directlyProvides(request, directlyProvidedBy(self.request))
+        # URLs computed by the operation point to the batch's context.
+        base = urllib.parse.urlsplit(self.request.getURL(1)).path
+        request.setVirtualHostRoot([name for name in base.split('/') if name])
+        return request
+
+    def _outcome(self, response):
+        headers = {
+            name: value for name, value in response.getHeaders()
+            if name != 'X-Powered-By'}
+        headers.pop('Content-Length', None)
+        body = response.consumeBody()
+        outcome = {'status': response.getStatus(), 'headers': headers}
+        try:
+            outcome['body'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            outcome['body'] = base64.b64encode(body).decode('ascii')
+            outcome['encoding'] = 'base64'
+        return outcome
+
+    def _error(self, error):
+        if isinstance(error, MethodNotAllowed):
+            status, reason = 405, 'Method Not Allowed'
+        elif isinstance(error, Unauthorized):
+            status, reason = 403, 'Forbidden'
+        elif isinstance(error, (NotFound, TraversalError)):
+            status, reason = 404, 'Not Found'
+        elif isinstance(error, (RequestBodyError, ServiceUnavailable)):
+            status, reason = error.status, error.reason
+        else:
+            logger.exception('Operation of a REST batch failed')
+            status, reason = 500, 'Internal Server Error'
+        return {'status': status, 'headers': {}, 'body': reason}
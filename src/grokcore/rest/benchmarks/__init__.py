@@ -0,0 +1,52 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Benchmarks of the publication of REST requests.
+
+The benchmarks publish requests in-process through the WSGI application
+of the Zope publisher, configured like the functional tests, and
+measure how long each scenario takes.  They need `pyperf`, which comes
+with the ``benchmark`` extra of this package::
+
+  pip install -e '.[benchmark]'
+  python -m grokcore.rest.benchmarks -o bench.json
+  python -m pyperf stats bench.json
+
+`pyperf` runs every scenario in several worker processes and reports
+the mean time per request, from which the requests per second follow.
+``pyperf stats`` shows the percentiles of the latencies, and
+``pyperf compare_to`` tells whether a change made a difference.
+``--scenario`` runs only the named scenarios:
+
+``get``
+  a successful GET request,
+
+``put``
+  a successful PUT request with a small body,
+
+``not_allowed``
+  a DELETE request answered with 405 and an ``Allow:`` header,
+
+``forbidden``
+  a POST request refused by the security check,
+
+``large_body``
+  a PUT request with a body of a megabyte, read while it arrives,
+
+``many_skins``
+  a GET request in one of many REST skins with their own views,
+
+``deep``
+  a GET request to an object twenty containers deep.
+
+"""
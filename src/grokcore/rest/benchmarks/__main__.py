@@ -0,0 +1,136 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Run the benchmarks of the publication of REST requests.
+
+See `grokcore.rest.benchmarks` for the scenarios.
+"""
+import io
+import logging
+import time
+
+import pyperf
+import transaction
+import zope.app.wsgi.testlayer
+from zope.app.wsgi import WSGIPublisherApplication
+
+import grokcore.rest.benchmarks
+from grokcore.rest.benchmarks.fixtures import DEPTH
+from grokcore.rest.benchmarks.fixtures import SKINS
+from grokcore.rest.benchmarks.fixtures import setUpContent
+
+
+LARGE_BODY = b'x' * (1024 * 1024)
+
+# name: (method, path, body, expected status)
+SCENARIOS = {
+    'get': ('GET', '/++rest++bench/manfred', b'', 200),
+    'put': ('PUT', '/++rest++bench/manfred', b'Ellie', 200),
+    'not_allowed': ('DELETE', '/++rest++bench/manfred', b'', 405),
+    'forbidden': ('POST', '/++rest++bench/manfred', b'', 401),
+    'large_body': ('PUT', '/++rest++bench/manfred', LARGE_BODY, 200),
+    'many_skins': (
+        'GET', '/++rest++skin%d/manfred' % (SKINS - 1), b'', 200),
+    'deep': (
+        'GET', '/++rest++bench' + '/cave' * (DEPTH + 1) + '/manfred', b'',
+        200),
+}
+
+_application = []
+
+
+def getApplication():
+    """Return the WSGI application, setting it up on first use."""
+    if not _application:
+        # The error reporting utility logs the tracebacks of 405 answers.
+        logging.disable(logging.ERROR)
+        layer = zope.app.wsgi.testlayer.BrowserLayer(
+            grokcore.rest.benchmarks, 'benchmark.zcml', allowTearDown=True)
+        layer.setUp()
+        setUpContent(layer.getRootFolder())
+        transaction.commit()
+        _application.append(WSGIPublisherApplication(layer.db))
+    return _application[0]
+
+
+def makeEnviron(method, path, body):
+    return {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'CONTENT_LENGTH': str(len(body)),
+        'CONTENT_TYPE': 'application/octet-stream',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.url_scheme': 'http',
+    }
+
+
+def request(application, method, path, body):
+    """Publish one request and return its status."""
+    status = []
+
+    def start_response(value, headers, exc_info=None):
+        status.append(int(value.split(' ', 1)[0]))
+
+    result = application(makeEnviron(method, path, body), start_response)
+    try:
+        for chunk in result:
+            pass
+    finally:
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+    return status[0]
+
+
+def benchmark(name):
+    method, path, body, expected = SCENARIOS[name]
+
+    def run(loops):
+        application = getApplication()
+        status = request(application, method, path, body)
+        if status != expected:
+            raise AssertionError(
+                '{} answered {} instead of {}'.format(name, status, expected))
+        start = time.perf_counter()
+        for loop in range(loops):
+            request(application, method, path, body)
+        return time.perf_counter() - start
+
+    return run
+
+
+def addScenarios(cmd, args):
+    # Workers only run the scenarios asked for.
+    for name in args.scenario or ():
+        cmd.extend(('--scenario', name))
+
+
+def main():
+    runner = pyperf.Runner(
+        program_args=('-m', 'grokcore.rest.benchmarks'),
+        add_cmdline_args=addScenarios)
+    runner.argparser.add_argument(
+        '--scenario', action='append', choices=sorted(SCENARIOS),
+        help='Run only this scenario; may be given more than once.')
+    args = runner.parse_args()
+    for name in args.scenario or SCENARIOS:
+        runner.bench_time_func(name, benchmark(name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Content and REST views published by the benchmarks.
+
+Besides the ``bench`` skin, `SKINS` further REST skins are made, each
+with a view of its own for `Mammoth`, so the registry holds as many
+layers as a large application might.
+
+"""
+import grokcore.component as grok
+from zope.interface.interface import InterfaceClass
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+SKINS = 50
+DEPTH = 20
+
+
+class Mammoth(content.Model):
+
+    def __init__(self, name='Manfred'):
+        self.name = name
+
+
+class Cave(content.Container):
+    pass
+
+
+class BenchLayer(rest.IRESTLayer):
+    rest.restskin('bench')
+
+
+class MammothREST(rest.REST):
+    view.layer(BenchLayer)
+    grok.context(Mammoth)
+
+    def GET(self):
+        return self.context.name.encode('utf-8')
+
+    def PUT(self):
+        size = 0
+        for chunk in self.iter_body():
+            size += len(chunk)
+        return b'%d' % size
+
+    @security.require('zope.ManageServices')
+    def POST(self):
+        return b'Secret'
+
+
+class SkinREST(rest.REST):
+    """Base class of the views of the further skins."""
+    grok.baseclass()
+
+    def GET(self):
+        return self.context.name.encode('utf-8')
+
+
+def _makeSkins(namespace):
+    for number in range(SKINS):
+        layer = InterfaceClass(
+            'Skin%dLayer' % number, (rest.IRESTLayer,),
+            __module__=__name__)
+        rest.restskin.set(layer, 'skin%d' % number)
+        namespace[layer.__name__] = layer
+        factory = type('Mammoth%dREST' % number, (SkinREST,),
+                       {'__module__': __name__})
+        view.layer.set(factory, layer)
+        grok.context.set(factory, Mammoth)
+        namespace[factory.__name__] = factory
+
+
+_makeSkins(globals())
+
+
+def setUpContent(root):
+    """Add the objects the benchmarks request to `root`."""
+    root['manfred'] = Mammoth()
+    root['cave'] = cave = Cave()
+    for level in range(DEPTH):
+        cave['cave'] = cave = Cave()
+    cave['manfred'] = Mammoth()
@@ -0,0 +1,173 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Server-side caching of REST GET responses.
+
+GET methods of REST views opt into caching with the
+`grok.responsecache()` directive.  Responses are stored in the
+`IRESTResponseCache` utility, or in an in-process LRU cache if no such
+utility is registered.  Since the interface follows memcached, keys are
+strings and values are plain tuples that can be pickled.
+
+A response is only reused for the same view class and HTTP method, the
+same object in the same version, the same request layers and query
+string, the same serializer for returned data, and the same values of
+the headers the policy varies on.  The version is what the view's
+`etag()` method tells, or else the serial of a persistent object.
+Objects without either are only refreshed when their entries expire.
+
+"""
+import collections
+import hashlib
+import threading
+import time
+
+from zope import component
+from zope.interface import directlyProvidedBy
+from zope.interface import implementer
+
+from grokcore.rest.interfaces import IRESTResponseCache
+from grokcore.rest.serializers import negotiateMediaType
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+class ResponseCachePolicy:
+    """How the responses of a REST method are cached."""
+
+    def __init__(self, max_age, vary=(), shared=True):
+        self.max_age = max_age
+        self.vary = tuple(vary)
+        self.shared = shared
+
+    def key(self, view, etag):
+        """Return the cache key of the request to `view`.
+
+        `etag` is what the `etag()` method of the view returned.
+
+        """
+        request = view.request
+        context = view.context
+        oid = getattr(context, '_p_oid', None)
+        if oid is not None:
+            identity = oid.hex()
+        else:
+            identity = request.getURL()
+        version = etag
+        if version is None:
+            serial = getattr(context, '_p_serial', None)
+            version = serial.hex() if serial is not None else ''
+        parts = [
+            type(view).__module__, type(view).__name__, request.method,
+            identity, version, request.get('QUERY_STRING', ''),
+            negotiateMediaType(request),
+            ' '.join(sorted(
+                iface.__identifier__
+                for iface in directlyProvidedBy(request)))]
+        parts.extend(request.getHeader(name, '') for name in self.vary)
+        if not self.shared:
+            principal = getattr(request, 'principal', None)
+            parts.append(principal.id if principal is not None else '')
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+@implementer(IRESTResponseCache)
+class LRUResponseCache:
+    """An in-process cache dropping the least recently used entries."""
+
+    def __init__(self, maxsize=1024, clock=time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return None
+            if expires is not None and expires <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expire=0):
+        expires = self._clock() + expire if expire else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+defaultResponseCache = LRUResponseCache()
+
+addCleanUp(defaultResponseCache.clear)
+
+
+def getResponseCache():
+    """Return the cache REST responses are stored in."""
+    return component.queryUtility(
+        IRESTResponseCache, default=defaultResponseCache)
+
+
+def callCached(policy, view, func, args, etag):
+    """Answer the request to `view` from the cache, or call `func`.
+
+    Successful responses with a body of text or bytes are put into the
+    cache, along with the headers set by `func`.  Cookies are never
+    cached.  `etag` is what the `etag()` method of the view returned.
+
+    """
+    request = view.request
+    response = request.response
+    cache = getResponseCache()
+    key = policy.key(view, etag)
+    entry = cache.get(key)
+    if entry is not None:
+        headers, body = entry
+        for name, value in headers:
+            response.setHeader(name, value)
+        return body
+
+    before = set(response.getHeaders())
+    result = func(view, *args)
+    if not isinstance(result, (str, bytes)):
+        return result
+    response.setResult(result)
+    if response.getStatus() != 200:
+        return response
+    headers = [(name, value) for name, value in response.getHeaders()
+               if (name, value) not in before
+               and name.lower() not in ('content-length', 'set-cookie')]
+    cache.set(key, (headers, response.consumeBody()), policy.max_age)
+    return response
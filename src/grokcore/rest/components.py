@@ -22,7 +22,27 @@ import zope.location
 from grokcore.view import ViewSupport
 from zope import interface
 
+from grokcore.rest.cache import callCached
+from grokcore.rest.conditional import NotModified
+from grokcore.rest.conditional import handleConditionalRequest
+from grokcore.rest.coroutines import runCoroutine
+from grokcore.rest.deserializers import deserialize
+from grokcore.rest.instrumentation import endpointName
+from grokcore.rest.instrumentation import isInstrumentationEnabled
+from grokcore.rest.instrumentation import timing
 from grokcore.rest.interfaces import IREST
+from grokcore.rest.profiling import isProfilingEnabled
+from grokcore.rest.profiling import profile
+from grokcore.rest.profiling import shouldProfile
+from grokcore.rest.requestbody import RequestBodyReader
+from grokcore.rest.requestbody import checkBodySize
+from grokcore.rest.serializers import isSerializable
+from grokcore.rest.serializers import selectSerializer
+from grokcore.rest.serializers import serialize
+from grokcore.rest.streaming import StreamingResult
+from grokcore.rest.streaming import isStreamable
+from grokcore.rest.streaming import prepareStreamingResult
+from grokcore.rest.workpools import getWorkPool
 
 
 @interface.implementer(IREST)
@@ -32,3 +52,148 @@ class REST(zope.location.Location, ViewSupport):
     def __init__(self, context, request):
         self.context = self.__parent__ = context
         self.request = request
+
+    @property
+    def body_file(self):
+        """File-like object reading the request body as it arrives.
+
+        Unlike `body`, this does not keep the whole body in memory.
+        """
+        reader = self.__dict__.get('_body_file')
+        if reader is None:
+            reader = self.__dict__['_body_file'] = RequestBodyReader(self)
+        return reader
+
+    @property
+    def parsed_body(self):
+        """The request body, parsed according to its content type.
+
+        It is parsed when it is first accessed, see `deserializers`.
+        """
+        try:
+            return self.__dict__['_parsed_body']
+        except KeyError:
+            data = self.__dict__['_parsed_body'] = deserialize(self)
+            return data
+
+    def iter_body(self, chunk_size=65536):
+        """Iterate over the request body in chunks of bytes."""
+        return self.body_file.iterChunks(chunk_size)
+
+    def etag(self):
+        """Return the entity tag of the presented resource, or `None`.
+
+        Override this to answer conditional GET requests.
+        """
+        return None
+
+    def last_modified(self):
+        """Return when the presented resource was modified, or `None`.
+
+        The time is given as a `datetime` or a POSIX timestamp.  Override
+        this to answer conditional GET requests.
+        """
+        return None
+
+
+class RESTMethod:
+    """Descriptor for the methods answering HTTP requests on a REST view.
+
+    Getting the method from a view returns a `BoundRESTMethod`, which
+    publishes the request with the method.  It exposes the original
+    function as `__func__`, so `mapply()` still passes request
+    parameters to the method's arguments.  Data returned by the method
+    is serialized as the client asks for, and iterators and file-like
+    objects are sent as a `StreamingResult`.  `coroutine` tells that the
+    method is declared with ``async def``; its coroutine is then run on
+    the event loop of the publishing thread.
+
+    The settings made with directives for the method are kept here as
+    well: `cache` is the policy given by `grok.responsecache()`,
+    `max_body_size` the limit given by `grok.max_body_size()` and
+    `workpool` the name given by `grok.workpool()`.
+
+    """
+
+    def __init__(self, func, cache=None, max_body_size=None,
+                 coroutine=False, workpool=None):
+        self.__func__ = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+        self.cache = cache
+        self.max_body_size = max_body_size
+        self.coroutine = coroutine
+        self.workpool = workpool
+
+    def __get__(self, inst, cls=None):
+        if inst is None:
+            return self
+        return BoundRESTMethod(self, inst)
+
+
+class BoundRESTMethod:
+    """A method of a REST view, bound to the view.
+
+    If `headers_only` is true, the response gets the headers it would
+    get otherwise, but the body is neither serialized nor streamed.
+    """
+
+    def __init__(self, method, view, headers_only=False):
+        self.method = method
+        self.__func__ = method.__func__
+        self.__self__ = view
+        self.headers_only = headers_only
+
+    def headersOnly(self):
+        """Return the method publishing the headers of the response."""
+        return BoundRESTMethod(self.method, self.__self__, headers_only=True)
+
+    def __call__(self, *args):
+        view = self.__self__
+        if not (isInstrumentationEnabled() or isProfilingEnabled()):
+            return self._publish(view, args)
+        name = endpointName(view, self.method.__name__)
+        with timing('call', name):
+            if isProfilingEnabled() and shouldProfile(name):
+                return profile(name, self._publish, view, args)
+            return self._publish(view, args)
+
+    def _publish(self, view, args):
+        if self.method.max_body_size is not None:
+            checkBodySize(view, self.method.max_body_size)
+        method = view.request.method
+        # Both the conditions and the cache key depend on the entity tag.
+        etag = view.etag() if method in ('GET', 'HEAD') else None
+        if handleConditionalRequest(view, etag):
+            return NotModified()
+        if self.method.cache is not None and method == 'GET':
+            result = callCached(
+                self.method.cache, view, self._render, args, etag)
+        else:
+            result = self._render(view, *args)
+        if isinstance(result, StreamingResult) or isStreamable(result):
+            result = prepareStreamingResult(result, view.request)
+            if self.headers_only:
+                # The body is dropped, so it need not be produced at all.
+                result.close()
+                return b''
+        return result
+
+    def _render(self, view, *args):
+        if self.method.workpool is not None:
+            pool = getWorkPool(self.method.workpool)
+            result = pool.call(view, self._call, view, *args)
+        else:
+            result = self._call(view, *args)
+        if isSerializable(result):
+            if self.headers_only:
+                selectSerializer(view.request)
+                return b''
+            result = serialize(result, view.request)
+        return result
+
+    def _call(self, view, *args):
+        result = self.__func__(view, *args)
+        if self.method.coroutine:
+            result = runCoroutine(result)
+        return result
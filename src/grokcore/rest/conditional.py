@@ -0,0 +1,128 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Conditional GET requests for REST views.
+
+A `grok.REST` view can tell the entity tag and the modification time of
+the resource it presents by overriding its `etag()` and
+`last_modified()` methods.  These are sent as the ``ETag:`` and
+``Last-Modified:`` headers, and the ``If-None-Match:`` and
+``If-Modified-Since:`` headers of GET requests are evaluated against
+them before the request method is called.  If the client has a current
+copy already, the request is answered with 304 Not Modified and the
+method is not called at all.
+
+HEAD requests get the validators, but are always answered in full: the
+browser publication insists on a textual content type for the empty body
+it sets on HEAD responses, which a 304 response does not have.
+
+"""
+import calendar
+import datetime
+import email.utils
+
+from zope.interface import implementer
+from zope.publisher.interfaces.http import IResult
+
+
+@implementer(IResult)
+class NotModified:
+    """The empty body of a 304 Not Modified response."""
+
+    def __iter__(self):
+        return iter(())
+
+
+def quoteETag(etag):
+    """Return `etag` in the quoted form used by HTTP headers."""
+    if etag.startswith('"') or etag.startswith('W/"'):
+        return etag
+    return '"%s"' % etag
+
+
+def toTimestamp(value):
+    """Return the POSIX timestamp of a `datetime` or number.
+
+    Naive datetimes are taken to be in UTC.
+
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return calendar.timegm(value.timetuple())
+    return int(value)
+
+
+def _opaque(etag):
+    # Weak comparison, which is what If-None-Match asks for.
+    if etag.startswith('W/'):
+        return etag[2:]
+    return etag
+
+
+def isModified(request, etag=None, last_modified=None):
+    """Tell whether the request asks for a copy it does not have yet.
+
+    `etag` is a quoted entity tag, `last_modified` a timestamp.  Either
+    of them may be ``None`` if it is not known.
+
+    """
+    if_none_match = request.getHeader('If-None-Match')
+    if if_none_match is not None:
+        if etag is None:
+            return True
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if '*' in tags:
+            return False
+        return _opaque(etag) not in [_opaque(tag) for tag in tags]
+
+    if_modified_since = request.getHeader('If-Modified-Since')
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError):
+            # Invalid dates are to be ignored.
+            return True
+        return last_modified > toTimestamp(since)
+    return True
+
+
+def handleConditionalRequest(view, etag):
+    """Evaluate the conditions of the request to `view`.
+
+    `etag` is what the `etag()` method of the view returned.  The
+    validators of the view are set on the response.  If the request can
+    be answered with 304 Not Modified, the status is set and `True` is
+    returned.
+
+    """
+    request = view.request
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    last_modified = view.last_modified()
+    if etag is None and last_modified is None:
+        return False
+
+    response = request.response
+    if etag is not None:
+        etag = quoteETag(etag)
+        response.setHeader('ETag', etag)
+    if last_modified is not None:
+        last_modified = toTimestamp(last_modified)
+        response.setHeader(
+            'Last-Modified', email.utils.formatdate(last_modified,
+                                                    usegmt=True))
+    if request.method != 'GET' or isModified(request, etag, last_modified):
+        return False
+    response.setStatus(304)
+    return True
@@ -0,0 +1,70 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Running REST methods declared with ``async def``.
+
+The publisher calls views synchronously, so the coroutine of an ``async
+def`` REST method is driven to completion by `runCoroutine()` before
+the response is sent.  Every publishing thread keeps an event loop of
+its own for this, which lives as long as the thread: the waiting done
+by one request, say on several subprocesses gathered with
+`asyncio.gather()`, overlaps, and resources bound to the loop can be
+kept between requests.
+
+"""
+import asyncio
+import threading
+import weakref
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+_local = threading.local()
+
+
+class _EventLoop:
+    """The event loop of a thread, closed when the thread ends."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        # The thread-local data is dropped when its thread ends.
+        weakref.finalize(self, self.loop.close)
+
+
+def getEventLoop():
+    """Return the event loop REST methods of this thread run on."""
+    holder = getattr(_local, 'holder', None)
+    if holder is None or holder.loop.is_closed():
+        holder = _local.holder = _EventLoop()
+    return holder.loop
+
+
+def runCoroutine(coroutine):
+    """Run `coroutine` on the event loop of this thread.
+
+    Returns its result or raises its exception.
+    """
+    return getEventLoop().run_until_complete(coroutine)
+
+
+def _clear():
+    _local.__dict__.clear()
+
+
+addCleanUp(_clear)
@@ -0,0 +1,109 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cross-origin resource sharing (CORS) for REST layers.
+
+REST layers opt into cross-origin requests with the `grok.cors()`
+directive.  The policy of a request is found by looking at the layers
+the request provides, which only needs to be done once for every
+combination of them.
+
+"""
+from zope.interface import providedBy
+
+import grokcore.rest
+from grokcore.rest.dispatch import RegistryCache
+from grokcore.rest.serializers import addVaryHeader
+
+
+class CORSPolicy:
+    """Cross-origin settings of a REST layer."""
+
+    def __init__(self, origins='*', headers=(), max_age=None,
+                 credentials=False):
+        if isinstance(origins, str):
+            origins = (origins,)
+        self.origins = frozenset(origins)
+        self.headers = tuple(headers)
+        self.max_age = max_age
+        self.credentials = credentials
+
+    def allows(self, origin):
+        return '*' in self.origins or origin in self.origins
+
+    def responseHeaders(self, origin, methods=None):
+        """Return the CORS headers for a response to `origin`.
+
+        If the allowed `methods` are given, the headers answering a
+        preflight request are included as well.
+
+        """
+        if '*' in self.origins and not self.credentials:
+            headers = [('Access-Control-Allow-Origin', '*')]
+        else:
+            headers = [('Access-Control-Allow-Origin', origin),
+                       ('Vary', 'Origin')]
+        if self.credentials:
+            headers.append(('Access-Control-Allow-Credentials', 'true'))
+        if methods is not None:
+            headers.append(
+                ('Access-Control-Allow-Methods', ', '.join(methods)))
+            if self.headers:
+                headers.append(
+                    ('Access-Control-Allow-Headers', ', '.join(self.headers)))
+            if self.max_age is not None:
+                headers.append(
+                    ('Access-Control-Max-Age', str(self.max_age)))
+        return headers
+
+
+_policies = RegistryCache()
+
+
+def queryCORSPolicy(request):
+    """Return the CORS policy of the layers `request` provides, if any."""
+    table = _policies.get()
+    spec = providedBy(request)
+    try:
+        return table[spec]
+    except KeyError:
+        pass
+    get = grokcore.rest.cors.bind(default=None).get
+    policy = None
+    for iface in spec.__iro__:
+        policy = get(iface)
+        if policy is not None:
+            break
+    table[spec] = policy
+    return policy
+
+
+def setCORSHeaders(request, methods=None):
+    """Set the CORS headers of the response to a cross-origin request.
+
+    Nothing happens unless the request carries an ``Origin:`` header
+    allowed by the policy of its layers.
+
+    """
+    origin = request.getHeader('Origin')
+    if origin is None:
+        return
+    policy = queryCORSPolicy(request)
+    if policy is None or not policy.allows(origin):
+        return
+    response = request.response
+    for name, value in policy.responseHeaders(origin, methods):
+        if name == 'Vary':
+            addVaryHeader(response, value)
+        else:
+            response.setHeader(name, value)
@@ -0,0 +1,185 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Parsing of the bodies of requests to REST views.
+
+The `parsed_body` of a REST view holds the request body decoded
+according to its ``Content-Type:``.  It is parsed by an
+`IRESTDeserializer`, a named adapter of the request whose name is the
+media type it parses.  Structured syntax suffixes are understood, so
+``application/vnd.example+json`` is parsed as JSON unless a
+deserializer for that very type is registered.
+
+Nothing is parsed until `parsed_body` is accessed for the first time.
+Newline delimited JSON is not even parsed then: it gives an iterator
+which parses one line of the body after the other as they arrive.
+
+"""
+import codecs
+import io
+import json
+import urllib.parse
+
+import grokcore.component as grok
+from zope import component
+from zope.interface import implementer
+from zope.publisher.interfaces.http import IHTTPRequest
+
+from grokcore.rest.interfaces import IRESTDeserializer
+from grokcore.rest.requestbody import MalformedRequestBody
+from grokcore.rest.requestbody import UnsupportedMediaType
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+if orjson is not None:
+    loadJSON = orjson.loads
+else:  # pragma: no cover
+    loadJSON = json.loads
+
+
+def parseContentType(value):
+    """Return the media type and the parameters of a content type."""
+    media_type, _, rest = value.partition(';')
+    params = {}
+    for param in rest.split(';'):
+        name, _, param_value = param.partition('=')
+        if name.strip():
+            params[name.strip().lower()] = param_value.strip().strip('"')
+    return media_type.strip().lower(), params
+
+
+def queryDeserializer(request, media_type):
+    """Return the deserializer for `media_type`, or ``None``."""
+    deserializer = component.queryAdapter(
+        request, IRESTDeserializer, media_type)
+    if deserializer is None and '+' in media_type:
+        suffix = media_type.rsplit('+', 1)[1]
+        deserializer = component.queryAdapter(
+            request, IRESTDeserializer, 'application/' + suffix)
+    return deserializer
+
+
+def deserialize(view):
+    """Return the body of the request to `view` parsed.
+
+    ``None`` is returned for requests without a ``Content-Type:``.
+    Bodies in a charset Python does not know are unsupported.
+
+    """
+    request = view.request
+    content_type = request.getHeader('Content-Type')
+    if not content_type:
+        return None
+    media_type, params = parseContentType(content_type)
+    deserializer = queryDeserializer(request, media_type)
+    if deserializer is None:
+        raise UnsupportedMediaType(view.context, request, media_type)
+    if 'charset' in params:
+        try:
+            codecs.lookup(params['charset'])
+        except LookupError:
+            raise UnsupportedMediaType(view.context, request, content_type)
+    try:
+        return deserializer.deserialize(view.body_file)
+    except ValueError as e:
+        raise MalformedRequestBody(view.context, request, str(e))
+
+
+@implementer(IRESTDeserializer)
+class Deserializer(grok.Adapter):
+    """Base class of the deserializers defined here."""
+    grok.baseclass()
+    grok.context(IHTTPRequest)
+    grok.provides(IRESTDeserializer)
+
+    def __init__(self, request):
+        self.request = request
+
+    @property
+    def charset(self):
+        content_type = self.request.getHeader('Content-Type', '')
+        return parseContentType(content_type)[1].get('charset', 'utf-8')
+
+
+class JSONDeserializer(Deserializer):
+    grok.name('application/json')
+
+    def deserialize(self, stream):
+        data = stream.read()
+        if codecs.lookup(self.charset).name != 'utf-8':
+            data = data.decode(self.charset)
+        return loadJSON(data)
+
+
+class NDJSONDeserializer(Deserializer):
+    """Parses newline delimited JSON one line at a time.
+
+    The result is an iterator, which can only be consumed once.
+
+    """
+    grok.name('application/x-ndjson')
+
+    def deserialize(self, stream):
+        return self._lines(io.BufferedReader(stream))
+
+    def _lines(self, stream):
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield loadJSON(line)
+            except ValueError as e:
+                # Raised while the handler iterates, so deserialize()
+                # cannot translate it.
+                raise MalformedRequestBody(None, self.request, str(e))
+
+
+class FormDeserializer(Deserializer):
+    """Parses URL encoded forms.
+
+    Fields given once have a string as value, fields given more than once
+    a list of strings.
+
+    """
+    grok.name('application/x-www-form-urlencoded')
+
+    def deserialize(self, stream):
+        form = {}
+        pairs = urllib.parse.parse_qsl(
+            stream.read().decode(self.charset), keep_blank_values=True)
+        for name, value in pairs:
+            if name not in form:
+                form[name] = value
+            elif isinstance(form[name], list):
+                form[name].append(value)
+            else:
+                form[name] = [form[name], value]
+        return form
+
+
+if msgpack is not None:
+
+    class MessagePackDeserializer(Deserializer):
+        grok.name('application/msgpack')
+
+        def deserialize(self, stream):
+            return msgpack.unpackb(stream.read(), raw=False)
@@ -1,5 +1,50 @@
+import sys
+
 import martian
 from grokcore.view.directive import TaggedValueStoreOnce
+from martian.directive import StoreMultipleTimes
+from martian.error import GrokError
+from martian.error import GrokImportError
+
+from grokcore.rest.cache import ResponseCachePolicy
+from grokcore.rest.crossorigin import CORSPolicy
+
+
+class MethodDirectiveStore(StoreMultipleTimes):
+    """Store of directives that may also decorate methods.
+
+    This works just like the store of `grok.require()`: the value is
+    stored on the class, unless the directive is used as a decorator,
+    in which case it is moved to the decorated method.
+
+    """
+
+    def get(self, directive, component, default):
+        values = getattr(component, directive.dotted_name(), default)
+        if (values is default) or not values:
+            return default
+        if len(values) > 1:
+            raise GrokError(
+                '%s was called multiple times in %r. It may only be set '
+                'once for a class.' % (directive.name, component), component)
+        return values[0]
+
+    def pop(self, locals_, directive):
+        return locals_[directive.dotted_name()].pop()
+
+
+class MethodDirective(martian.Directive):
+    """Base class of directives for REST classes and their methods."""
+    scope = martian.CLASS
+    store = MethodDirectiveStore()
+
+    def __call__(self, func):
+        # Like grok.require, these directives can be used both on the
+        # class and as decorators for methods.
+        frame = sys._getframe(1)
+        value = self.store.pop(frame.f_locals, self)
+        self.set(func, [value])
+        return func
 
 
 class restskin(martian.Directive):
@@ -19,3 +64,88 @@ class restskin(martian.Directive):
 
     def factory(self, value=None):
         return value
+
+
+class cors(martian.Directive):
+    """The `grok.cors()` directive.
+
+    This directive is placed inside of `grok.IRESTLayer` subclasses to
+    answer cross-origin requests made to REST views in that layer.
+    ``grok.cors('https://example.com', headers=['Content-Type'],
+    max_age=600)``, for example, allows requests from pages served by
+    `https://example.com`, lets them send a ``Content-Type:`` header
+    and allows browsers to cache the answer to the preflight request
+    for ten minutes.  Without arguments, any origin is allowed.
+
+    """
+    scope = martian.CLASS
+    store = TaggedValueStoreOnce()
+
+    def factory(self, origins='*', headers=(), max_age=None,
+                credentials=False):
+        return CORSPolicy(origins, headers, max_age, credentials)
+
+
+class responsecache(MethodDirective):
+    """The `grok.responsecache()` directive.
+
+    This directive is used in `grok.REST` subclasses, or as a decorator
+    of their GET methods, to cache the responses on the server.
+    ``grok.responsecache(60, vary=['Accept'])``, for example, reuses a
+    response for a minute, for requests sending the same ``Accept:``
+    header.  Responses are shared by all users unless `shared` is false.
+    ``grok.responsecache(0)`` caches nothing, as for a method of a class
+    whose responses are cached otherwise.
+
+    """
+
+    def factory(self, max_age, vary=(), shared=True):
+        if max_age < 0:
+            raise GrokImportError(
+                'The maximum age of cached responses must not be '
+                'negative, not %r.' % (max_age,))
+        if not max_age:
+            # Caches would keep entries without an expiry time forever.
+            return None
+        return ResponseCachePolicy(max_age, vary, shared)
+
+
+class max_body_size(MethodDirective):
+    """The `grok.max_body_size()` directive.
+
+    This directive is used in `grok.REST` subclasses, or as a decorator
+    of their methods, to limit the size of the request bodies they
+    accept.  ``grok.max_body_size(10 * 1024 * 1024)``, for example,
+    answers requests with a body larger than ten megabytes with 413
+    Request Entity Too Large.  ``grok.max_body_size(None)`` sets no
+    limit.
+
+    """
+
+    def factory(self, size):
+        if size is not None and (
+                not isinstance(size, int) or isinstance(size, bool)
+                or size < 0):
+            raise GrokImportError(
+                'The maximum size of request bodies must be a number of '
+                'bytes or None, not %r.' % (size,))
+        return size
+
+
+class workpool(MethodDirective):
+    """The `grok.workpool()` directive.
+
+    This directive is used in `grok.REST` subclasses, or as a decorator
+    of their methods, to run expensive methods in a bounded pool.
+    ``grok.workpool('cpu')``, for example, runs no more of the methods
+    at the same time than there are processors, and answers the requests
+    beyond that with 503 Service Unavailable.
+    ``'io'`` is meant for methods waiting on other services, other
+    names for pools set up with
+    `grokcore.rest.workpools.configureWorkPool()`.
+
+    """
+    validate = martian.validateText
+
+    def factory(self, name):
+        return name
@@ -0,0 +1,187 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Dispatch of HTTP methods to REST views.
+
+Every REST request asks the component registry for the view that
+handles the request method on the traversed object, and then for the
+security checker of that view.  The answers only depend on the
+interfaces provided by the object and the request, so once the dispatch
+cache is enabled they are remembered in a table keyed on exactly that.
+
+The table is kept per adapter registry and is dropped whenever that
+registry, or one of the registries it is based on, changes.  Local site
+managers are therefore honoured, and new registrations take effect
+immediately.
+
+"""
+import weakref
+
+from zope import component
+from zope.interface import Interface
+from zope.interface import providedBy
+from zope.security.checker import Checker
+from zope.security.checker import getCheckerForInstancesOf
+from zope.security.checker import selectChecker
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+class RegistryCache:
+    """A memo of values that are derived from the component registry.
+
+    The memo is a plain dictionary.  A separate one is kept for every
+    adapter registry, and it is replaced by an empty one as soon as
+    the registry or any of its bases has changed.  `kind` tells which
+    registry of a site manager the memo is derived from, its
+    ``'adapters'`` or its ``'utilities'``.
+
+    """
+
+    def __init__(self, kind='adapters'):
+        self.kind = kind
+        self._data = weakref.WeakKeyDictionary()
+
+    def get(self, registry=None):
+        """Return the memo that is valid for `registry`.
+
+        If no registry is given, the current site manager is used.
+
+        """
+        if registry is None:
+            registry = component.getSiteManager()
+        adapters = getattr(registry, self.kind)
+        # Every registry bumps its generation on changes, which is
+        # what the verifying lookups of zope.interface rely on, too.
+        generations = [r._generation for r in adapters.ro]
+        entry = self._data.get(adapters)
+        if entry is None or entry[0] != generations:
+            entry = self._data[adapters] = (generations, {})
+        return entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def freeze(self):
+        """Keep the memos as they are, without adding values to them.
+
+        Values computed afterwards are returned but not remembered, so
+        the memos are not written to anymore.  Memos made after the
+        registry changed are not frozen.
+
+        """
+        for adapters, (generations, memo) in list(self._data.items()):
+            self._data[adapters] = (generations, FrozenMemo(memo))
+
+    def thaw(self):
+        """Let the memos remember values again."""
+        for adapters, (generations, memo) in list(self._data.items()):
+            self._data[adapters] = (generations, dict(memo))
+
+
+class FrozenMemo(dict):
+    """A memo ignoring the values stored in it."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+_dispatch_table = RegistryCache()
+_dispatch_cache_enabled = False
+
+# Marks table entries whose checker depends on the view instance.
+_select_checker = object()
+
+
+def setDispatchCacheEnabled(enabled):
+    """Switch the dispatch cache on or off."""
+    global _dispatch_cache_enabled
+    _dispatch_cache_enabled = bool(enabled)
+    _dispatch_table.clear()
+
+
+def isDispatchCacheEnabled():
+    """Tell whether the dispatch cache is used."""
+    return _dispatch_cache_enabled
+
+
+def queryMethodView(ob, request, name):
+    """Return the view handling the HTTP method `name` for `ob`.
+
+    The result is a tuple of the view and the security checker that
+    protects it.  Both are ``None`` when no view is registered.
+
+    """
+    if not _dispatch_cache_enabled:
+        view = component.queryMultiAdapter((ob, request), name=name)
+        return view, selectChecker(view)
+
+    table = _dispatch_table.get()
+    key = (providedBy(ob), providedBy(request), name)
+    try:
+        factory, checker = table[key]
+    except KeyError:
+        factory, checker = table[key] = _lookup(key)
+    if factory is None:
+        return None, None
+    view = factory(ob, request)
+    if view is None:
+        return None, None
+    if checker is _select_checker:
+        checker = selectChecker(view)
+    return view, checker
+
+
+def warmUpDispatch(context_spec, request_spec, name):
+    """Remember the view of `name` for the given interfaces.
+
+    The lookup is made even if the dispatch cache is disabled, which
+    fills the caches of the adapter registry.
+
+    """
+    key = (context_spec, request_spec, name)
+    if _dispatch_cache_enabled:
+        table = _dispatch_table.get()
+        if key not in table:
+            table[key] = _lookup(key)
+    else:
+        _lookup(key)
+
+
+def _lookup(key):
+    context_spec, request_spec, name = key
+    factory = component.getSiteManager().adapters.lookup(
+        (context_spec, request_spec), Interface, name=name)
+    if factory is None:
+        return None, None
+    checker = getCheckerForInstancesOf(factory)
+    if not isinstance(checker, Checker):
+        # Either no checker was defined for the view class, or it is a
+        # checker factory.  Both cases need the actual view instance.
+        checker = _select_checker
+    return factory, checker
+
+
+def _clear():
+    global _dispatch_cache_enabled
+    _dispatch_cache_enabled = False
+    _dispatch_table.clear()
+
+
+addCleanUp(_clear)
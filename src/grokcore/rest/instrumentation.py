@@ -0,0 +1,212 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Timing the stages of REST requests.
+
+When instrumentation is enabled with
+``setInstrumentationEnabled(True)``, the time spent in these stages is
+handed to every `IRESTTimingSink` utility:
+
+``traverse``
+  applying the skin of a ``++rest++`` step, keyed by the skin name,
+
+``lookup``
+  finding the REST view of a request and checking its permission,
+
+``call``
+  calling the REST method and preparing its result,
+
+``not_allowed``
+  answering a method that is not allowed, keyed by the HTTP method.
+
+Views are keyed by the dotted name of their REST class and the HTTP
+method, such as ``'zoo.rest.MammothREST.GET'``.  ``lookup`` is only
+timed for requests published by `GrokHTTPPublication`; browser requests
+look up their view while traversing.  While instrumentation is
+disabled, the stages only cost a test of a global flag.
+
+`PrometheusExporter` and `StatsDExporter` are sinks for the usual
+monitoring systems.
+
+"""
+import contextlib
+import os
+import tempfile
+import threading
+import time
+
+from zope import component
+from zope.interface import implementer
+
+from grokcore.rest.interfaces import IRESTTimingSink
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+_enabled = False
+_disabled = contextlib.nullcontext()
+
+clock = time.perf_counter
+
+
+def setInstrumentationEnabled(enabled=True):
+    """Enable or disable timing the stages of REST requests."""
+    global _enabled
+    _enabled = enabled
+
+
+def isInstrumentationEnabled():
+    return _enabled
+
+
+def endpointName(view, method):
+    """Return the name REST views are known by to timing sinks.
+
+    It is the dotted name of the REST class followed by the HTTP method.
+
+    """
+    cls = type(view)
+    return '{}.{}.{}'.format(cls.__module__, cls.__qualname__, method)
+
+
+def record(stage, name, duration):
+    """Hand the `duration` of `stage` for `name` to the timing sinks."""
+    for sink in component.getAllUtilitiesRegisteredFor(IRESTTimingSink):
+        sink.record(stage, name, duration)
+
+
+class _Timing:
+
+    __slots__ = ('stage', 'name', 'start')
+
+    def __init__(self, stage, name):
+        self.stage = stage
+        self.name = name
+
+    def __enter__(self):
+        self.start = clock()
+
+    def __exit__(self, *exc_info):
+        duration = clock() - self.start
+        name = self.name
+        if callable(name):
+            name = name()
+        record(self.stage, name, duration)
+
+
+def timing(stage, name):
+    """Return a context manager timing `stage` for `name`.
+
+    `name` may also be a callable returning the name, for stages whose
+    name is only known once they are over.  It is not called while
+    instrumentation is disabled.
+
+    """
+    if not _enabled:
+        return _disabled
+    return _Timing(stage, name)
+
+
+@implementer(IRESTTimingSink)
+class PrometheusExporter:
+    """Sums up timings as Prometheus metrics.
+
+    The metrics are written in the Prometheus text format to `path`,
+    for the textfile collector of the node exporter, at most every
+    `interval` seconds and when `write()` is called.
+
+    """
+
+    metric = 'grokcore_rest_stage_seconds'
+
+    def __init__(self, path, interval=10):
+        self.path = path
+        self.interval = interval
+        self._counts = {}
+        self._sums = {}
+        self._written = clock()
+        self._lock = threading.Lock()
+
+    def record(self, stage, name, duration):
+        key = (stage, name)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._sums[key] = self._sums.get(key, 0.0) + duration
+            due = clock() - self._written >= self.interval
+        if due:
+            self.write()
+
+    def render(self):
+        """Return the metrics in the Prometheus text format."""
+        lines = [
+            '# HELP {} Time spent in stages of REST requests.'.format(
+                self.metric),
+            '# TYPE {} summary'.format(self.metric),
+        ]
+        with self._lock:
+            counts = sorted(self._counts.items())
+            sums = dict(self._sums)
+        for key, count in counts:
+            labels = '{{stage="{}",endpoint="{}"}}'.format(
+                *(_escape(value) for value in key))
+            lines.append('{}_count{} {}'.format(self.metric, labels, count))
+            lines.append(
+                '{}_sum{} {!r}'.format(self.metric, labels, sums[key]))
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """Write the metrics to `path`, replacing it at once."""
+        text = self.render()
+        with self._lock:
+            self._written = clock()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as stream:
+            stream.write(text)
+        os.replace(temp, self.path)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+@implementer(IRESTTimingSink)
+class StatsDExporter:
+    """Writes timings as StatsD timer lines to `stream`.
+
+    Each timing becomes a line like
+    ``grokcore.rest.call.zoo.rest.MammothREST.GET:1.25|ms``.  `stream` is any
+    object with a ``write()`` method taking text, such as a pipe to a
+    local StatsD agent.
+
+    """
+
+    def __init__(self, stream, prefix='grokcore.rest'):
+        self.stream = stream
+        self.prefix = prefix
+        self._lock = threading.Lock()
+
+    def record(self, stage, name, duration):
+        line = '{}.{}.{}:{:.3f}|ms\n'.format(
+            self.prefix, stage, name, duration * 1000)
+        with self._lock:
+            self.stream.write(line)
+
+
+addCleanUp(lambda: setInstrumentationEnabled(False))
@@ -38,9 +38,21 @@ class IGrokcoreRestAPI(
 
     IRESTSkinType = interface.Attribute('The REST skin type')
 
+    StreamingResult = interface.Attribute(
+        "Response body of a REST view that is sent while it is produced.")
+
     body = interface.Attribute(
         """The text of the request body.""")
 
+    parsed_body = interface.Attribute(
+        """The request body, parsed according to its content type.""")
+
+    body_file = interface.Attribute(
+        """File-like object reading the request body as it arrives.""")
+
+    def iter_body(chunk_size=65536):
+        """Iterate over the request body in chunks of bytes."""
+
     context = interface.Attribute(
         "Object that the REST handler presents.")
 
@@ -62,6 +74,142 @@ class IRESTLayer(grokcore.traverser.interfaces.IRESTLayer):
     """
 
 
+class IRESTBatchLayer(IRESTLayer):
+    """REST layers accepting batches of requests.
+
+    REST layers extending this one get the ``++batch++`` namespace, see
+    `grokcore.rest.batch`.
+    """
+
+
 class IRESTSkinType(IInterface):
     """Skin type for REST requests.
     """
+
+
+class IRESTRoute(interface.Interface):
+    """A REST view registered for one HTTP method.
+
+    Routes are recorded by the grokker of `grok.REST` subclasses, one
+    for every method that is registered as a view.
+    """
+
+    layer = interface.Attribute("Layer the view is registered for.")
+
+    context = interface.Attribute(
+        "Interface or class the view is registered for.")
+
+    method = interface.Attribute("Name of the HTTP method.")
+
+    view = interface.Attribute("View class handling the HTTP method.")
+
+    permission = interface.Attribute(
+        "Id of the permission required to call the view.")
+
+    factory = interface.Attribute(
+        "The `grok.REST` subclass that defines the method.")
+
+
+class IRESTRouteIndex(interface.Interface):
+    """Index of all REST routes known from grokking."""
+
+    def get(layer, context, method, default=None):
+        """Return the route registered for exactly these arguments.
+
+        Return `default` if there is no such route.
+        """
+
+    def query(layer=None, context=None, method=None):
+        """Return a list of the routes matching all given arguments.
+
+        Arguments that are not given, match any route.  Matching is
+        exact, more general or more specific routes are not included.
+        """
+
+    def methods():
+        """Return a sorted tuple of the names of all routed methods."""
+
+    def dump(layer=None, context=None, method=None):
+        """Return a text listing of the matching routes, one per line."""
+
+    def __iter__():
+        """Iterate over all routes."""
+
+    def __len__():
+        """Return the number of routes."""
+
+
+class IRESTResponseCache(interface.Interface):
+    """Storage for cached REST responses.
+
+    The methods follow those of memcached clients, so such a client can
+    be registered as this utility directly.
+    """
+
+    def get(key):
+        """Return the value stored for the string `key`, or `None`."""
+
+    def set(key, value, expire=0):
+        """Store `value` for `key`, for at most `expire` seconds.
+
+        An `expire` of 0 means the value does not expire.
+        """
+
+    def delete(key):
+        """Remove the value stored for `key`, if any."""
+
+
+class IRESTSerializer(interface.Interface):
+    """Turns the data returned by REST methods into a response body.
+
+    Serializers are adapters of the request, named after the media type
+    they produce.  The one used is chosen by the ``Accept:`` header of
+    the request.
+    """
+
+    media_type = interface.Attribute(
+        "The value of the ``Content-Type:`` header of serialized data.")
+
+    def serialize(data):
+        """Return `data` as bytes."""
+
+
+class IRESTDeserializer(interface.Interface):
+    """Parses the body of requests to REST views.
+
+    Deserializers are adapters of the request, named after the media
+    type they parse.  The one used is chosen by the ``Content-Type:``
+    header of the request.
+    """
+
+    def deserialize(stream):
+        """Return the data read from the file-like `stream`.
+
+        A `ValueError` is raised if the data cannot be parsed.
+        """
+
+
+class IRESTSkinSelector(interface.Interface):
+    """Chooses the REST skin of requests from their headers.
+
+    If this utility is registered, it is asked at the start of every
+    request, so clients need not put ``++rest++`` into the URL.
+    """
+
+    def selectSkin(request):
+        """Return the name of the REST skin for `request`, or `None`."""
+
+
+class IRESTTimingSink(interface.Interface):
+    """Receives the time spent in the stages of REST requests.
+
+    All utilities providing this interface are called while the
+    instrumentation of `grokcore.rest.instrumentation` is enabled.
+    """
+
+    def record(stage, name, duration):
+        """Record that `stage` took `duration` seconds for `name`.
+
+        `name` is the REST view, like ``'zoo.rest.MammothREST.GET'``, or
+        the skin or HTTP method for stages without a view.
+        """
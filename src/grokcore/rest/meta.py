@@ -21,16 +21,25 @@ and available as `martian` recursively examines the packages and modules
 of a Grok-based web application.
 
 """
+import inspect
+
 import grokcore.component
 import grokcore.security
 import grokcore.view
 import martian
-from grokcore.view import make_checker
 from martian.error import GrokError
+from zope import component
 from zope import interface
 from zope.interface.interface import InterfaceClass
+from zope.security.checker import defineChecker
 
 import grokcore.rest
+from grokcore.rest.components import RESTMethod
+from grokcore.rest.rest import NotAllowedREST
+from grokcore.rest.rest import notAllowedMethod
+from grokcore.rest.routes import registerRoute
+from grokcore.rest.securitycache import restChecker
+from grokcore.rest.skins import registerRESTSkin
 
 
 class RESTGrokker(martian.MethodGrokker):
@@ -41,44 +50,162 @@ class RESTGrokker(martian.MethodGrokker):
     each of its methods separately, placing them each inside of a new
     class that we create on-the-fly by calling `type()`.  We make each
     method the `__call__()` method of its new class, since that is how
-    Zope always invokes views.  And it is this new class that is then
-    made the object of the two configuration actions that we schedule:
-    one to activate it as a REST adapter for the context, and the other
-    to prepare a security check for the adapter.
+    Zope always invokes views.  It is given the dotted name of the
+    `grok.REST` subclass, by which it is known to instrumentation and
+    response caches.  This new class is then activated as a
+    REST adapter for the context, protected by a security check, which
+    can be answered from the security cache, and recorded in the route
+    index, which can be queried through the `IRESTRouteIndex` utility.
+
+    Large applications define hundreds of REST methods, so these
+    registrations are not scheduled as configuration actions of their
+    own.  They are collected for every module and made in one pass by a
+    single action, see `registerRESTMethods()`; views requiring the same
+    permission share their checker.  The action of every view still
+    claims the discriminator of the adapter, and merely adds the view to
+    the batch, so conflicting registrations are reported as before, and
+    views overridden by others are not registered.
 
     This results in several registered views, typically with names like
     `GET`, `PUT`, and `POST` - one for each method that the `grok.REST`
-    subclass defines.
+    subclass defines.  Methods overriding the API of `grok.REST` itself,
+    such as `etag()`, are not registered.  The method is wrapped in a
+    `RESTMethod`, which evaluates conditional requests before calling
+    it and holds the settings made with directives such as
+    `grok.responsecache()`, `grok.max_body_size()` and
+    `grok.workpool()`.  Methods declared with ``async def`` are told
+    apart here, so their coroutines are run on an event loop when they
+    are called.
 
     """
     martian.component(grokcore.rest.REST)
     martian.directive(grokcore.component.context)
     martian.directive(grokcore.view.layer, default=grokcore.rest.IRESTLayer)
     martian.directive(grokcore.security.require, name='permission')
+    martian.directive(grokcore.rest.responsecache, name='cache')
+    martian.directive(grokcore.rest.max_body_size)
+    martian.directive(grokcore.rest.workpool)
 
     def execute(self, factory, method, config, permission, context,
-                layer, **kw):
-        name = method.__name__
+                layer, cache, max_body_size, workpool, **kw):
+        if hasattr(grokcore.rest.REST, method.__name__):
+            return False
+
+        scheduleRESTMethod(
+            config, factory, method, context, layer, permission,
+            cache=cache, max_body_size=max_body_size, workpool=workpool)
+        return True
 
-        method_view = type(
-            factory.__name__, (factory,),
-            {'__call__': method})
 
-        adapts = (context, layer)
-        config.action(
-            discriminator=('adapter', adapts, interface.Interface, name),
-            callable=grokcore.component.provideAdapter,
-            args=(method_view, adapts, interface.Interface, name),
-        )
+def scheduleRESTMethod(config, factory, method, context, layer, permission,
+                       cache=None, max_body_size=None, workpool=None):
+    """Schedule the registration of `method` of `factory` as a view."""
+    name = method.__name__
+    rest_method = RESTMethod(
+        method, cache=cache, max_body_size=max_body_size,
+        coroutine=inspect.iscoroutinefunction(method),
+        workpool=workpool)
+    method_view = type(
+        factory.__name__, (factory,),
+        {'__call__': rest_method, name: rest_method,
+         '__module__': factory.__module__,
+         '__qualname__': factory.__qualname__})
+
+    adapts = (context, layer)
+    config.action(
+        discriminator=('adapter', adapts, interface.Interface, name),
+        callable=addToBatch,
+        args=(_batch(config, factory.__module__),
+              (factory, method_view, context, layer, name, permission)))
+    config.action(
+        discriminator=('protectName', method_view, '__call__'))
+
+
+def addToBatch(batch, entry):
+    """Add a REST method to the `batch` registered together."""
+    batch.append(entry)
+
+
+# The REST methods of the module being grokked, by module name.
+_batches = {}
+
+
+def _batch(config, module):
+    """Return the REST methods of `module` waiting to be registered."""
+    actions, batch = _batches.get(module, (None, None))
+    if actions is not config.actions:
+        # The first REST method of this module in this configuration.
+        batch = []
+        _batches[module] = (config.actions, batch)
+        # It runs after the actions of the methods that were not dropped
+        # for conflicting with overrides have filled the batch.
         config.action(
-            discriminator=('protectName', method_view, '__call__'),
-            callable=make_checker,
-            args=(factory, method_view, permission),
-        )
-        return True
+            discriminator=None,
+            callable=registerRESTMethods,
+            args=(batch,),
+            order=1)
+    return batch
+
+
+class RESTBatchGrokker(martian.GlobalGrokker):
+    """Closes the batch of REST methods of a module.
+
+    It runs after the other grokkers of the module, so the next time the
+    module is grokked, its REST methods start a new batch.
+    """
+    martian.priority(-1000)
+
+    def grok(self, name, module, module_info, config, **kw):
+        _batches.pop(name, None)
+        return False
+
+
+def registerRESTMethods(batch):
+    """Register the views of REST methods collected by `RESTGrokker`.
+
+    HTTP methods for which there is no default view yet, such as
+    ``PATCH`` or extension methods, are given one refusing them.
+    """
+    registry = component.getSiteManager()
+    checkers = {}
+    names = set()
+    for factory, method_view, context, layer, name, permission in batch:
+        registry.registerAdapter(
+            method_view, (context, layer), interface.Interface, name,
+            event=False)
+        checker = checkers.get(permission)
+        if checker is None:
+            checker = checkers[permission] = restChecker(factory, permission)
+        defineChecker(method_view, checker)
+        registerRoute(layer, context, name, method_view, permission, factory)
+        names.add(name)
+    for name in sorted(names):
+        if name.isupper() and registry.adapters.registered(
+                _not_allowed_adapts, interface.Interface, name) is None:
+            registerNotAllowed(registry, name)
+
+
+_not_allowed_adapts = (interface.Interface, grokcore.rest.IRESTLayer)
+
+
+def registerNotAllowed(registry, name):
+    """Register the default view refusing the HTTP method `name`."""
+    rest_method = RESTMethod(notAllowedMethod(name))
+    method_view = type(
+        NotAllowedREST.__name__, (NotAllowedREST,),
+        {'__call__': rest_method, name: rest_method,
+         '__module__': NotAllowedREST.__module__,
+         '__qualname__': NotAllowedREST.__qualname__})
+    registry.registerAdapter(
+        method_view, _not_allowed_adapts, interface.Interface, name,
+        event=False)
+    defineChecker(method_view, restChecker(NotAllowedREST, None))
+    registerRoute(grokcore.rest.IRESTLayer, interface.Interface, name,
+                  method_view, None, NotAllowedREST)
 
 
 _restskin_not_used = object()
+_restskin_tag = grokcore.rest.restskin.dotted_name()
 
 
 class RestskinInterfaceDirectiveGrokker(martian.InstanceGrokker):
@@ -87,7 +214,8 @@ class RestskinInterfaceDirectiveGrokker(martian.InstanceGrokker):
     Applications create REST skins by subclassing `grok.IRESTLayer`
     and providing the subclass with a `grok.restskin()` directive giving
     the prefix string which distinguishes that REST layers from others.
-    This grokker registers those skins.
+    This grokker registers those skins, as `IRESTSkinType` utilities and
+    in the table used to look them up during traversal.
 
     """
     martian.component(InterfaceClass)
@@ -97,9 +225,11 @@ class RestskinInterfaceDirectiveGrokker(martian.InstanceGrokker):
         # `InterfaceClass` - that is, for every interface defined in an
         # application module!  So we have to do our own filtering, by
         # checking whether each interface includes the `grok.restskin()`
-        # directive, and skipping those that do not.
-        restskin = grokcore.rest.restskin.bind(default=_restskin_not_used
-                                               ).get(interface)
+        # directive, and skipping those that do not.  The directive
+        # stores its value as a tagged value, which is read directly
+        # rather than through a bound directive.
+        restskin = interface.queryTaggedValue(
+            _restskin_tag, _restskin_not_used)
         if restskin is _restskin_not_used:
             # The restskin directive is not actually used on the found
             # interface.
@@ -115,9 +245,13 @@ class RestskinInterfaceDirectiveGrokker(martian.InstanceGrokker):
                 % (interface.__identifier__, interface.__identifier__),
                 interface)
 
-        config.action(
-            discriminator=('restprotocol', restskin),
-            callable=grokcore.component.provideInterface,
-            args=(restskin, interface, grokcore.rest.IRESTSkinType))
-
+        scheduleRESTSkin(config, restskin, interface)
         return True
+
+
+def scheduleRESTSkin(config, restskin, interface):
+    """Schedule the registration of `interface` as a REST skin."""
+    config.action(
+        discriminator=('restprotocol', restskin),
+        callable=registerRESTSkin,
+        args=(restskin, interface))
@@ -0,0 +1,164 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Profiling samples of the requests to REST views.
+
+Profiling is switched on for a running process with::
+
+  setProfilingEnabled(
+      True, '/var/profiles', {'zoo.rest.MammothREST.GET': 0.05})
+
+which runs five percent of the calls of the ``GET`` method of
+``zoo.rest.MammothREST`` under `cProfile`.  The samples of every view
+are added up and written as a `pstats` file named after the view to
+the directory, such as ``zoo.rest.MammothREST.GET.pstats``.  Views are
+named as for instrumentation, see
+`grokcore.rest.instrumentation.endpointName()`.  `rates` may give
+``'*'`` for the views not named.  Only one request is profiled at a
+time; requests sampled while another one is profiled are run as usual.
+
+Users with the ``zope.ManageServices`` permission can fetch the profiles
+from the ``++profiles++`` namespace of REST skins, see
+`grokcore.rest.rest.ProfilesREST`.
+
+"""
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+_enabled = False
+_directory = None
+_rates = {}
+_samples = {}
+_lock = threading.Lock()
+_profiling = threading.Lock()
+
+
+def setProfilingEnabled(enabled=True, directory=None, rates=None):
+    """Enable or disable profiling samples of REST views.
+
+    `directory` receives the profiles; `rates` maps the names of views
+    to the fraction of their calls to profile.  The profiles gathered
+    can still be read after profiling was disabled.
+    """
+    global _enabled, _directory, _rates
+    if enabled:
+        if directory is None:
+            raise ValueError('A directory for the profiles is needed.')
+        os.makedirs(directory, exist_ok=True)
+        with _lock:
+            if directory != _directory:
+                _samples.clear()
+            _directory = directory
+    _rates = dict(rates or {})
+    _enabled = enabled
+
+
+def isProfilingEnabled():
+    return _enabled
+
+
+def shouldProfile(name):
+    """Tell whether this call of the view called `name` is profiled."""
+    rate = _rates.get(name)
+    if rate is None:
+        rate = _rates.get('*', 0)
+    return rate > 0 and random.random() < rate
+
+
+def profilePath(name):
+    return os.path.join(_directory, name + '.pstats')
+
+
+def profile(name, func, *args):
+    """Call `func` with `args` and add its profile to that of `name`."""
+    if not _profiling.acquire(blocking=False):
+        return func(*args)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        _profiling.release()
+        _addSample(name, profiler)
+
+
+def _addSample(name, profiler):
+    with _lock:
+        path = profilePath(name)
+        stats = pstats.Stats(profiler)
+        if os.path.exists(path):
+            stats.add(path)
+        stats.dump_stats(path)
+        _samples[name] = _samples.get(name, 0) + 1
+
+
+def listProfiles():
+    """Return the number of samples profiled for every view."""
+    with _lock:
+        return dict(_samples)
+
+
+def readProfile(name):
+    """Return the `pstats` file of the view called `name`, or `None`."""
+    with _lock:
+        if name not in _samples:
+            return None
+        with open(profilePath(name), 'rb') as stream:
+            return stream.read()
+
+
+def reportProfile(name, limit=50):
+    """Return the `limit` most expensive functions of the view `name`.
+
+    The report is the text printed by `pstats`, sorted by cumulative
+    time.  Returns `None` if the view was not profiled.
+    """
+    with _lock:
+        if name not in _samples:
+            return None
+        output = io.StringIO()
+        stats = pstats.Stats(profilePath(name), stream=output)
+        stats.sort_stats('cumulative').print_stats(limit)
+        return output.getvalue()
+
+
+def clearProfiles():
+    """Discard the profiles gathered so far."""
+    with _lock:
+        for name in _samples:
+            path = profilePath(name)
+            if os.path.exists(path):
+                os.remove(path)
+        _samples.clear()
+
+
+def _clear():
+    global _directory
+    setProfilingEnabled(False)
+    _directory = None
+    _samples.clear()
+
+
+addCleanUp(_clear)
@@ -24,13 +24,14 @@ object.
 
 """
 from grokcore.view.publication import ZopePublicationSansProxy
-from zope import component
 from zope.app.publication.http import HTTPPublication
 from zope.app.publication.requestpublicationfactories import HTTPFactory
 from zope.publisher.interfaces.http import IHTTPException
 from zope.publisher.publish import mapply
-from zope.security.checker import selectChecker
 
+from grokcore.rest.dispatch import queryMethodView
+from grokcore.rest.instrumentation import endpointName
+from grokcore.rest.instrumentation import timing
 from grokcore.rest.rest import GrokMethodNotAllowed
 
 
@@ -47,20 +48,36 @@ class GrokHTTPPublication(ZopePublicationSansProxy, HTTPPublication):
     permitted, and finally passes the bare object to the view that will
     render it.
 
+    The view and its checker are obtained through `queryMethodView()`,
+    which can answer from the dispatch cache instead of searching the
+    component registry.  The call itself is made by `callRESTMethod()`,
+    which publishes the operations of batch requests as well.
+
     """
 
     def callObject(self, request, ob):
-        orig = ob
-        if not IHTTPException.providedBy(ob):
-            ob = component.queryMultiAdapter((ob, request),
-                                             name=request.method)
-            checker = selectChecker(ob)
+        return callRESTMethod(request, ob)
+
+
+def callRESTMethod(request, ob):
+    """Call the REST view handling the method of `request` on `ob`.
+
+    This is what `GrokHTTPPublication` does to publish an object.  The
+    security check of the view is made first.  Both are timed as the
+    ``lookup`` stage when instrumentation is enabled.
+
+    """
+    orig = ob
+    if not IHTTPException.providedBy(ob):
+        # The name is taken once the view has been found.
+        with timing('lookup', lambda: endpointName(ob, request.method)):
+            ob, checker = queryMethodView(ob, request, request.method)
             if checker is not None:
                 checker.check(ob, '__call__')
-            ob = getattr(ob, request.method, None)
-            if ob is None:
-                raise GrokMethodNotAllowed(orig, request)
-        return mapply(ob, request.getPositionalArguments(), request)
+        ob = getattr(ob, request.method, None)
+        if ob is None:
+            raise GrokMethodNotAllowed(orig, request)
+    return mapply(ob, request.getPositionalArguments(), request)
 
 
 class GrokHTTPFactory(HTTPFactory):
@@ -0,0 +1,271 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""A cache of the REST registrations made by grokking a package.
+
+Every process grokking a package scans all of its modules with
+`martian`, only to make the same registrations as the process before.
+`grokPackage()` groks a package once and writes the REST views and
+skins found by `RESTGrokker` and `RestskinInterfaceDirectiveGrokker` to
+a file; later processes read them from there and schedule the same
+configuration actions, without scanning the modules.  In ZCML, this is::
+
+  <grok:grokcached package="." directory="var/restcache" />
+
+The file holds the dotted names of the classes and interfaces, and the
+settings of the methods, as JSON.  It is keyed on the size and
+modification time of the modules of the package, and the versions of
+Python, ``grokcore.rest`` and the packages it groks with.  When anything
+changed, or the file cannot be read, the package is grokked again and
+the file is written anew.
+
+Only packages defining nothing but REST views and skins can be cached:
+if grokking a package makes other registrations, no file is written and
+the package is grokked every time.
+
+"""
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from importlib import metadata
+
+from grokcore.component.zcml import do_grok
+from grokcore.view import templatereg
+
+from grokcore.rest.cache import ResponseCachePolicy
+from grokcore.rest.meta import _batches
+from grokcore.rest.meta import addToBatch
+from grokcore.rest.meta import registerRESTMethods
+from grokcore.rest.meta import scheduleRESTMethod
+from grokcore.rest.meta import scheduleRESTSkin
+from grokcore.rest.skins import registerRESTSkin
+
+
+logger = logging.getLogger(__name__)
+
+# The distributions whose versions invalidate the cache.
+DISTRIBUTIONS = (
+    'grokcore.component',
+    'grokcore.rest',
+    'grokcore.security',
+    'grokcore.view',
+    'martian',
+)
+
+# The discriminators of the actions of REST methods without a callable.
+_REST_DISCRIMINATORS = ('protectName',)
+
+# Grokking any module looks for templates, which REST views do not use.
+_TEMPLATE_ACTIONS = (
+    templatereg.register_directory,
+    templatereg.check_unassociated,
+)
+
+
+def grokPackage(dotted_name, config, directory, exclude=None):
+    """Grok the package `dotted_name`, using the cache in `directory`.
+
+    Returns whether the registrations were read from the cache.
+    """
+    key = cacheKey(dotted_name, exclude)
+    path = cachePath(directory, dotted_name)
+    registrations = _load(path, key)
+    if registrations is not None:
+        methods, skins = registrations
+        for restskin, interface in skins:
+            scheduleRESTSkin(config, restskin, interface)
+        for factory, method, context, layer, permission, settings in methods:
+            scheduleRESTMethod(
+                config, factory, method, context, layer, permission,
+                **settings)
+        # Close the batches, as `RESTBatchGrokker` does after grokking.
+        for module in {method[0].__module__ for method in methods}:
+            _batches.pop(module, None)
+        return True
+
+    start = len(config.actions)
+    do_grok(dotted_name, config, extra_exclude=exclude)
+    registrations = _registrations(config.actions[start:])
+    if registrations is None:
+        logger.info(
+            'Not caching the registrations of %s, which are not all REST '
+            'views and skins.', dotted_name)
+    else:
+        _dump(path, key, *registrations)
+    return False
+
+
+def cachePath(directory, dotted_name):
+    return os.path.join(directory, dotted_name + '.json')
+
+
+def cacheKey(dotted_name, exclude=None):
+    """Return the key of the cached registrations of `dotted_name`."""
+    module = importlib.import_module(dotted_name)
+    files = []
+    for path in _files(module):
+        stat = os.stat(path)
+        files.append((path, stat.st_size, stat.st_mtime_ns))
+    versions = [(name, _version(name)) for name in DISTRIBUTIONS]
+    key = repr((dotted_name, sorted(exclude or ()), sys.version, versions,
+                sorted(files)))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _files(module):
+    paths = getattr(module, '__path__', None)
+    if paths is None:
+        yield module.__file__
+        return
+    for path in paths:
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [name for name in dirnames
+                           if name != '__pycache__']
+            for filename in filenames:
+                if filename.endswith('.py'):
+                    yield os.path.join(dirpath, filename)
+
+
+def _version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _registrations(actions):
+    """Return the REST views and skins registered by `actions`.
+
+    Returns `None` if the actions make other registrations, or refer to
+    objects which cannot be imported by name.
+    """
+    methods = []
+    skins = []
+    for action in actions:
+        callable = action['callable']
+        if callable is addToBatch:
+            (factory, method_view, context, layer, name,
+             permission) = action['args'][1]
+            rest_method = method_view.__dict__['__call__']
+            if getattr(factory, name, None) is not rest_method.__func__:
+                return None
+            methods.append(
+                (factory, name, context, layer, permission, rest_method))
+        elif callable is registerRESTMethods:
+            continue
+        elif callable is registerRESTSkin:
+            skins.append(action['args'])
+        elif callable in _TEMPLATE_ACTIONS:
+            continue
+        elif (callable is not None
+              or action['discriminator'] is None
+              or action['discriminator'][0] not in _REST_DISCRIMINATORS):
+            return None
+    try:
+        methods = [
+            {'factory': _reference(factory),
+             'name': name,
+             'context': _reference(context),
+             'layer': _reference(layer),
+             'permission': permission,
+             'settings': _settings(rest_method)}
+            for factory, name, context, layer, permission, rest_method
+            in methods]
+        skins = [{'name': restskin, 'interface': _reference(interface)}
+                 for restskin, interface in skins]
+    except LookupError:
+        return None
+    return methods, skins
+
+
+def _settings(rest_method):
+    """Return the settings of `rest_method` made with directives."""
+    cache = rest_method.cache
+    if cache is not None:
+        if type(cache) is not ResponseCachePolicy:
+            raise LookupError(cache)
+        cache = {'max_age': cache.max_age, 'vary': list(cache.vary),
+                 'shared': cache.shared}
+    return {'cache': cache,
+            'max_body_size': rest_method.max_body_size,
+            'workpool': rest_method.workpool}
+
+
+def _reference(ob):
+    """Return the dotted name `ob` can be imported by."""
+    reference = '{}:{}'.format(
+        ob.__module__, getattr(ob, '__qualname__', ob.__name__))
+    try:
+        found = _resolve(reference)
+    except (ImportError, AttributeError):
+        found = None
+    if found is not ob:
+        raise LookupError(ob)
+    return reference
+
+
+def _resolve(reference):
+    module, name = reference.split(':')
+    ob = importlib.import_module(module)
+    for part in name.split('.'):
+        ob = getattr(ob, part)
+    return ob
+
+
+def _dump(path, key, methods, skins):
+    try:
+        text = json.dumps({'key': key, 'methods': methods, 'skins': skins})
+    except (TypeError, ValueError):
+        # The settings of a method are not plain data.
+        logger.info('Cannot cache the REST registrations in %s.', path,
+                    exc_info=True)
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as stream:
+        stream.write(text)
+    os.replace(temp, path)
+
+
+def _load(path, key):
+    """Return the registrations cached in `path` under `key`, or `None`."""
+    try:
+        with open(path, encoding='utf-8') as stream:
+            data = json.load(stream)
+        if data['key'] != key:
+            return None
+        methods = []
+        for method in data['methods']:
+            factory = _resolve(method['factory'])
+            settings = dict(method['settings'])
+            if settings['cache'] is not None:
+                settings['cache'] = ResponseCachePolicy(**settings['cache'])
+            methods.append(
+                (factory, getattr(factory, method['name']),
+                 _resolve(method['context']), _resolve(method['layer']),
+                 method['permission'], settings))
+        skins = [(skin['name'], _resolve(skin['interface']))
+                 for skin in data['skins']]
+    except FileNotFoundError:
+        return None
+    except (OSError, ImportError, AttributeError, KeyError, TypeError,
+            ValueError):
+        logger.warning('Cannot read the REST registrations cached in %s.',
+                       path, exc_info=True)
+        return None
+    return methods, skins
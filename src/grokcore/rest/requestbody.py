@@ -0,0 +1,146 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Streaming access to the body of REST requests.
+
+The `body` of a REST view holds the complete request body in memory.
+`RequestBodyReader` instead reads the body from the request's input
+stream while the handler consumes it.  The input stream of
+zope.publisher keeps what is read for retrying the request, in memory
+for small bodies and in a temporary file for large ones, so streaming
+does not interfere with conflict retries.
+
+The size of request bodies can be limited with the
+`grok.max_body_size()` directive.  Requests announcing a larger body are
+refused before it is read; bodies without a ``Content-Length:`` are cut
+off as soon as they exceed the limit while they are read.
+
+"""
+import io
+
+
+MAX_BODY_SIZE_KEY = 'grokcore.rest.max_body_size'
+
+
+class RequestBodyError(Exception):
+    """The REST view cannot handle the request body.
+
+    `status` and `reason` give the HTTP status of the response.
+
+    """
+    status = 400
+    reason = 'Bad Request'
+
+    def __init__(self, object, request, detail=None):
+        self.object = object
+        self.request = request
+        self.detail = detail
+
+    def __str__(self):
+        return '{!r}, {!r}, {}'.format(self.object, self.request, self.detail)
+
+
+class RequestEntityTooLarge(RequestBodyError):
+    """The request body is larger than the REST view accepts.
+
+    `detail` is the limit in bytes.
+
+    """
+    status = 413
+    reason = 'Request Entity Too Large'
+
+    @property
+    def limit(self):
+        return self.detail
+
+
+class UnsupportedMediaType(RequestBodyError):
+    """The request body has a content type that cannot be parsed."""
+    status = 415
+    reason = 'Unsupported Media Type'
+
+
+class MalformedRequestBody(RequestBodyError):
+    """The request body cannot be parsed as its content type says."""
+
+
+def _contentLength(request):
+    size = request.getHeader('Content-Length')
+    if not size:
+        return None
+    try:
+        return int(size)
+    except ValueError:
+        return None
+
+
+def checkBodySize(view, limit):
+    """Refuse the request to `view` if its body exceeds `limit` bytes."""
+    request = view.request
+    size = _contentLength(request)
+    if size is not None and size > limit:
+        raise RequestEntityTooLarge(view.context, request, limit)
+    request.annotations[MAX_BODY_SIZE_KEY] = limit
+
+
+class RequestBodyReader(io.RawIOBase):
+    """File-like object reading the body of a request as it arrives.
+
+    Data that was read from the request before, for instance by the
+    `body` of a REST view, is replayed first.
+
+    """
+
+    def __init__(self, view):
+        self.view = view
+        request = view.request
+        self._stream = request.bodyStream
+        self._size = _contentLength(request)
+        self._limit = request.annotations.get(MAX_BODY_SIZE_KEY)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        want = len(buffer)
+        if self._size is not None:
+            want = min(want, self._size - self._pos)
+        if want <= 0:
+            return 0
+
+        data = b''
+        cache = getattr(self._stream, 'cacheStream', None)
+        if cache is not None:
+            end = cache.seek(0, io.SEEK_END)
+            if self._pos < end:
+                cache.seek(self._pos)
+                data = cache.read(min(want, end - self._pos))
+                cache.seek(end)
+        if not data:
+            data = self._stream.read(want)
+
+        self._pos += len(data)
+        if self._limit is not None and self._pos > self._limit:
+            raise RequestEntityTooLarge(
+                self.view.context, self.view.request, self._limit)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def iterChunks(self, chunk_size=65536):
+        """Iterate over the rest of the body in chunks of bytes."""
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -2,24 +2,92 @@
 
 The views provided by this module get invoked when an object receives an
 HTTP request in a REST skin for which no more-specific REST behavior has
-been defined.  These all return the HTTP response Method Not Allowed.
+been defined.  These all return the HTTP response Method Not Allowed,
+except for HEAD, which is answered by the GET view, and OPTIONS, which
+is answered with the methods that are allowed.  The profiles of REST
+views are available from the ``++profiles++`` namespace.
 
 """
 import grokcore.component as grok
+import grokcore.security
 import grokcore.view
+import zope.location
+from grokcore.component.interfaces import IContext
+from grokcore.view.interfaces import IAfterTraversalEvent
 from zope import component
 from zope.browser.interfaces import IView
 from zope.interface import Interface
 from zope.interface import implementer
-from zope.interface.interfaces import ComponentLookupError
-from zope.publisher.browser import applySkin
+from zope.interface import providedBy
+from zope.publisher.interfaces import IStartRequestEvent
+from zope.publisher.interfaces import NotFound
 from zope.publisher.interfaces.http import IHTTPRequest
 from zope.publisher.interfaces.http import MethodNotAllowed
+from zope.publisher.publish import mapply
 from zope.traversing.interfaces import TraversalError
+from zope.traversing.namespace import SimpleHandler
 from zope.traversing.namespace import view
 
 import grokcore.rest
-from grokcore.rest.interfaces import IRESTSkinType
+from grokcore.rest.components import BoundRESTMethod
+from grokcore.rest.crossorigin import setCORSHeaders
+from grokcore.rest.dispatch import RegistryCache
+from grokcore.rest.dispatch import queryMethodView
+from grokcore.rest.instrumentation import timing
+from grokcore.rest.interfaces import IRESTLayer
+from grokcore.rest.profiling import clearProfiles
+from grokcore.rest.profiling import listProfiles
+from grokcore.rest.profiling import readProfile
+from grokcore.rest.profiling import reportProfile
+from grokcore.rest.requestbody import RequestBodyError
+from grokcore.rest.skins import applyRESTSkin
+from grokcore.rest.skins import queryRESTSkin
+from grokcore.rest.skins import selectRESTSkin
+from grokcore.rest.workpools import ServiceUnavailable
+
+
+_allowed_methods = RegistryCache()
+
+
+def getAllowedMethods(context, request):
+    """Return the HTTP methods that REST views accept for `context`.
+
+    The answer only depends on the interfaces provided by `context` and
+    `request`, so it is computed once for every combination of them and
+    remembered until the component registry changes.
+
+    """
+    return queryAllowedMethods(providedBy(context), providedBy(request))
+
+
+def queryAllowedMethods(context_spec, request_spec):
+    """Return the HTTP methods accepted for the given interfaces."""
+    table = _allowed_methods.get()
+    key = (context_spec, request_spec)
+    allow = table.get(key)
+    if allow is None:
+        allow = table[key] = _computeAllowedMethods(*key)
+    return allow
+
+
+def _computeAllowedMethods(context_spec, request_spec):
+    adapters = component.getSiteManager().adapters
+    factories = dict(adapters.lookupAll((context_spec, request_spec),
+                                        Interface))
+    allow = []
+    # The HTTP methods of all views, including those registered with
+    # ZCML or in local sites, listed in the "Allow:" header in
+    # alphabetical order.
+    for method in sorted(factories):
+        if not method.isupper():
+            continue
+        is_not_allowed = getattr(factories[method], 'is_not_allowed', False)
+        if not is_not_allowed:
+            allow.append(method)
+        elif method == 'HEAD' and 'GET' in allow:
+            # The default HEAD view answers with the GET view.
+            allow.append(method)
+    return tuple(allow)
 
 
 class GrokMethodNotAllowed(MethodNotAllowed):
@@ -36,7 +104,9 @@ class MethodNotAllowedView(grok.MultiAdapter):
     that can, in fact, succeed.  It constructs this list by testing the
     current object to see which methods it supports; if none of the
     standard methods succeed, then the ``Allow:`` header is still
-    provided, but its value will be empty.
+    provided, but its value will be empty.  The outcome of this test is
+    shared by all objects providing the same interfaces, see
+    `getAllowedMethods()`.
 
     """
     grok.adapts(GrokMethodNotAllowed, IHTTPRequest)
@@ -45,21 +115,12 @@ class MethodNotAllowedView(grok.MultiAdapter):
     def __init__(self, context, request):
         self.context = context
         self.request = request
-        self.allow = self._getAllow()
+        with timing('not_allowed', request.method):
+            self.allow = self._getAllow()
 
     def _getAllow(self):
-        allow = []
-        # List methods here in the same order that they should appear in
-        # the "Allow:" header.
-        for method in 'DELETE', 'GET', 'POST', 'PUT':
-            view = component.queryMultiAdapter(
-                (self.context.object, self.context.request),
-                name=method)
-            if view is not None:
-                is_not_allowed = getattr(view, 'is_not_allowed', False)
-                if not is_not_allowed:
-                    allow.append(method)
-        return allow
+        return list(getAllowedMethods(
+            self.context.object, self.context.request))
 
     def __call__(self):
         self.request.response.setHeader('Allow', ', '.join(self.allow))
@@ -69,24 +130,123 @@ class MethodNotAllowedView(grok.MultiAdapter):
         return 'Method Not Allowed'
 
 
+@implementer(IView)
+class RequestBodyErrorView(grok.MultiAdapter):
+    """View rendering a REST RequestBodyError exception over HTTP.
+
+    The request is answered with the HTTP status of the exception, such
+    as 413 (Request Entity Too Large) or 415 (Unsupported Media Type),
+    and a simple text message as the document body.
+
+    """
+    grok.adapts(RequestBodyError, IHTTPRequest)
+    grok.name('index.html')
+
+    def __init__(self, context, request):
+        self.context = context
+        self.request = request
+
+    def __call__(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        self.request.response.setStatus(self.context.status)
+        return self.context.reason
+
+
+@implementer(IView)
+class ServiceUnavailableView(grok.MultiAdapter):
+    """View rendering a REST ServiceUnavailable exception over HTTP.
+
+    The request is answered with 503 (Service Unavailable) and a
+    ``Retry-After:`` header telling the client when to try again.
+
+    """
+    grok.adapts(ServiceUnavailable, IHTTPRequest)
+    grok.name('index.html')
+
+    def __init__(self, context, request):
+        self.context = context
+        self.request = request
+
+    def __call__(self):
+        response = self.request.response
+        response.setHeader('Retry-After', str(self.context.retry_after))
+        response.setHeader('Content-Type', 'text/plain;charset=utf-8')
+        response.setStatus(self.context.status)
+        return self.context.reason
+
+
 class rest_skin(view):
     """A rest skin.
 
     This used to be supported by zope.traversing but the change was
-    backed out.  We need it for our REST support.
+    backed out.  We need it for our REST support.  Skins are looked up
+    and applied through the tables of `grokcore.rest.skins`.
 
     """
 
     def traverse(self, name, ignored):
-        self.request.shiftNameToApplication()
-        try:
-            skin = component.getUtility(IRESTSkinType, name)
-        except ComponentLookupError:
-            raise TraversalError("++rest++%s" % name)
-        applySkin(self.request, skin)
+        with timing('traverse', name):
+            self.request.shiftNameToApplication()
+            skin = queryRESTSkin(name)
+            if skin is None:
+                raise TraversalError("++rest++%s" % name)
+            applyRESTSkin(self.request, skin)
         return self.context
 
 
+class IProfiles(Interface):
+    """The resource giving access to the profiles of REST views."""
+
+
+@implementer(IProfiles, IContext)
+class Profiles(zope.location.Location):
+    """The resource giving access to the profiles of REST views."""
+
+    def __init__(self, context):
+        self.__parent__ = context
+        self.__name__ = '++profiles++'
+
+
+class profiles(SimpleHandler):
+    """The ``++profiles++`` traversal namespace of REST skins."""
+
+    def traverse(self, name, ignored):
+        return Profiles(self.context)
+
+
+class ProfilesREST(grokcore.rest.REST):
+    """REST view handing out the profiles of REST views.
+
+    GET lists the profiled views and their number of samples.  Given the
+    name of a view as `endpoint`, it returns its `pstats` file instead,
+    or a text report if `report` is ``text``.  DELETE discards the
+    profiles.  See `grokcore.rest.profiling`.
+
+    """
+    grokcore.view.layer(grokcore.rest.IRESTLayer)
+    grok.context(IProfiles)
+    grokcore.security.require('zope.ManageServices')
+
+    def GET(self, endpoint=None, report=None):
+        if endpoint is None:
+            return listProfiles()
+        if report == 'text':
+            body = reportProfile(endpoint)
+            content_type = 'text/plain;charset=utf-8'
+        else:
+            body = readProfile(endpoint)
+            content_type = 'application/octet-stream'
+        if body is None:
+            raise NotFound(self.context, endpoint, self.request)
+        self.request.response.setHeader('Content-Type', content_type)
+        return body
+
+    def DELETE(self):
+        clearProfiles()
+        return b''
+
+
 class NotAllowedREST(grokcore.rest.REST):
     """Default REST view, whose methods all raise Not Allowed errors.
 
@@ -96,6 +256,9 @@ class NotAllowedREST(grokcore.rest.REST):
     that such objects can at least return attractive refusals when
     clients attempt to assail them with unwanted HTTP methods.
 
+    Other HTTP methods, such as ``PATCH``, are refused the same way as
+    soon as a REST view defines them, see `notAllowedMethod()`.
+
     """
     grokcore.view.layer(grokcore.rest.IRESTLayer)
     grok.context(Interface)
@@ -113,3 +276,73 @@ class NotAllowedREST(grokcore.rest.REST):
 
     def DELETE(self):
         raise GrokMethodNotAllowed(self.context, self.request)
+
+
+def notAllowedMethod(name):
+    """Return a method of `NotAllowedREST` refusing the HTTP method `name`.
+    """
+    def method(self):
+        raise GrokMethodNotAllowed(self.context, self.request)
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
+class HeadREST(grokcore.rest.REST):
+    """Default REST view for HEAD requests.
+
+    HEAD is answered by calling the GET view for the object, security
+    checks included.  The data returned by REST methods is not
+    serialized and streaming results are not produced; the publication
+    sends the headers of the response but drops any body.  More specific
+    REST views can define HEAD themselves.
+
+    """
+    grokcore.view.layer(grokcore.rest.IRESTLayer)
+    grok.context(Interface)
+
+    # HEAD is allowed exactly when GET is; `getAllowedMethods()` takes
+    # care of that.
+    is_not_allowed = True
+
+    def HEAD(self):
+        view, checker = queryMethodView(self.context, self.request, 'GET')
+        if view is None:
+            raise GrokMethodNotAllowed(self.context, self.request)
+        if checker is not None:
+            checker.check(view, '__call__')
+        call = view.__call__
+        if isinstance(call, BoundRESTMethod):
+            call = call.headersOnly()
+        return mapply(
+            call, self.request.getPositionalArguments(), self.request)
+
+
+class OptionsREST(grokcore.rest.REST):
+    """Default REST view for OPTIONS requests.
+
+    The ``Allow:`` header lists the methods the object supports, and
+    cross-origin preflight requests are answered according to the
+    `grok.cors()` policy of the layer.  No application code is called.
+
+    """
+    grokcore.view.layer(grokcore.rest.IRESTLayer)
+    grok.context(Interface)
+
+    def OPTIONS(self):
+        allow = getAllowedMethods(self.context, self.request)
+        self.request.response.setHeader('Allow', ', '.join(allow))
+        setCORSHeaders(self.request, allow)
+        return b''
+
+
+@grok.subscribe(IStartRequestEvent)
+def selectRESTSkinForRequest(event):
+    """Choose the REST skin from the request headers, if configured."""
+    selectRESTSkin(event.request)
+
+
+@grok.subscribe(IAfterTraversalEvent)
+def setCORSHeadersForREST(event):
+    """Allow cross-origin requests to REST views as the layer says."""
+    if IRESTLayer.providedBy(event.request):
+        setCORSHeaders(event.request)
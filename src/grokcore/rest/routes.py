@@ -0,0 +1,115 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Index of the REST routes registered by grokking.
+
+`RESTGrokker` turns every method of a `grok.REST` subclass into a view
+of its own.  Besides registering these views with the component
+registry, it records them here, so the complete set of REST routes can
+be inspected without going through the adapter registry.  The index is
+available as an `IRESTRouteIndex` utility.
+
+"""
+from zope.interface import implementer
+
+from grokcore.rest.interfaces import IRESTRoute
+from grokcore.rest.interfaces import IRESTRouteIndex
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+def _dotted(ob):
+    return '{}.{}'.format(ob.__module__, ob.__name__)
+
+
+@implementer(IRESTRoute)
+class Route:
+    """A REST view registered for one HTTP method."""
+
+    def __init__(self, layer, context, method, view, permission, factory):
+        self.layer = layer
+        self.context = context
+        self.method = method
+        self.view = view
+        self.permission = permission
+        self.factory = factory
+
+    def __repr__(self):
+        return '<{} {} {} on {}>'.format(
+            self.__class__.__name__, self.method,
+            _dotted(self.context), _dotted(self.layer))
+
+
+@implementer(IRESTRouteIndex)
+class RESTRouteIndex:
+    """Index of REST routes keyed on layer, context and method."""
+
+    def __init__(self):
+        self._routes = {}
+        self._methods = None
+
+    def add(self, route):
+        self._routes[route.layer, route.context, route.method] = route
+        self._methods = None
+
+    def clear(self):
+        self._routes.clear()
+        self._methods = None
+
+    def get(self, layer, context, method, default=None):
+        return self._routes.get((layer, context, method), default)
+
+    def query(self, layer=None, context=None, method=None):
+        return [route for route in self._routes.values()
+                if (layer is None or route.layer is layer)
+                and (context is None or route.context is context)
+                and (method is None or route.method == method)]
+
+    def methods(self):
+        if self._methods is None:
+            self._methods = tuple(sorted(
+                {route.method for route in self._routes.values()}))
+        return self._methods
+
+    def dump(self, layer=None, context=None, method=None):
+        lines = sorted(
+            (_dotted(route.layer), _dotted(route.context), route.method,
+             _dotted(route.factory), route.permission)
+            for route in self.query(layer, context, method))
+        return '\n'.join(
+            '{} {} {} -> {} ({})'.format(*line) for line in lines)
+
+    def __iter__(self):
+        return iter(list(self._routes.values()))
+
+    def __len__(self):
+        return len(self._routes)
+
+
+routeIndex = RESTRouteIndex()
+
+
+def registerRoute(layer, context, method, view, permission, factory):
+    """Record a route in the global route index."""
+    if permission is None:
+        permission = 'zope.Public'
+    routeIndex.add(Route(layer, context, method, view, permission, factory))
+
+
+addCleanUp(routeIndex.clear)
@@ -0,0 +1,187 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Caching of the security checks of REST views.
+
+Every request to a protected REST view asks the security policy whether
+the principal has the permission of the view on its context.  With
+`zope.securitypolicy`, answering this means looking for local grants on
+the context and on every one of its parents.  The policy remembers its
+answers only for the duration of a request.
+
+Once the security cache is enabled, the decisions are remembered for a
+number of seconds, keyed on the principals of the interaction, the
+permission and the chain of persistent objects from the context up to
+the root.  Objects without an oid are never cached, since their
+identity cannot be told apart reliably.
+
+Changes of grants and role assignments are only eventually consistent.
+`zope.securitypolicy` sends no events when they change, and other
+processes sharing the database would not see them anyway, so the cache
+cannot notice them.  A principal whose permission was revoked keeps it
+for up to `ttl` seconds, and one who was given a permission is refused
+for as long.  Code changing grants at runtime should call
+`invalidateSecurityCache()`, which clears the cache of the process it
+runs in only.  The `ttl` is therefore the longest time a revoked
+permission may still be honoured.
+
+"""
+import threading
+import time
+
+from grokcore.security.util import check_permission
+from zope.security.checker import Checker
+from zope.security.checker import CheckerPublic
+from zope.security.interfaces import Unauthorized
+from zope.security.management import queryInteraction
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+DEFAULT_TTL = 5.0
+
+
+class SecurityDecisionCache:
+    """Decisions of the security policy that expire after `ttl` seconds.
+
+    At most `maxsize` decisions are kept; when there are more, all of
+    them are dropped.
+
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, maxsize=10000, clock=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, allowed = entry
+        if expires <= self._clock():
+            return None
+        return allowed
+
+    def set(self, key, allowed):
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (self._clock() + self.ttl, allowed)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_decisions = None
+
+
+def setSecurityCacheEnabled(enabled, ttl=DEFAULT_TTL):
+    """Switch the security cache on or off.
+
+    Decisions are remembered for `ttl` seconds, which is also how long
+    changes of grants may go unnoticed, see the module documentation.
+
+    """
+    global _decisions
+    _decisions = SecurityDecisionCache(ttl) if enabled else None
+
+
+def isSecurityCacheEnabled():
+    """Tell whether the security cache is used."""
+    return _decisions is not None
+
+
+def invalidateSecurityCache():
+    """Forget all decisions of this process, after grants changed."""
+    if _decisions is not None:
+        _decisions.clear()
+
+
+addCleanUp(invalidateSecurityCache)
+
+
+def decisionKey(permission, view):
+    """Return the cache key of checking `permission` on `view`.
+
+    ``None`` is returned when the decision must not be cached.
+
+    """
+    interaction = queryInteraction()
+    if interaction is None:
+        return None
+    principals = tuple(
+        participation.principal.id
+        for participation in interaction.participations
+        if participation.principal is not None)
+    chain = []
+    ob = getattr(view, '__parent__', None)
+    while ob is not None:
+        oid = getattr(ob, '_p_oid', None)
+        if oid is None:
+            return None
+        chain.append(oid)
+        ob = getattr(ob, '__parent__', None)
+    return (principals, permission, tuple(chain))
+
+
+class RESTChecker(Checker):
+    """Checker of REST views, which consults the security cache."""
+
+    def check(self, object, name):
+        decisions = _decisions
+        permission = self.get_permissions.get(name)
+        if (decisions is None or permission is None
+                or permission is CheckerPublic):
+            return Checker.check(self, object, name)
+
+        key = decisionKey(permission, object)
+        if key is None:
+            return Checker.check(self, object, name)
+        allowed = decisions.get(key)
+        if allowed is None:
+            try:
+                Checker.check(self, object, name)
+            except Unauthorized:
+                decisions.set(key, False)
+                raise
+            decisions.set(key, True)
+        elif not allowed:
+            raise Unauthorized(object, name, permission)
+
+
+def restChecker(factory, permission):
+    """Return a `RESTChecker` requiring `permission` for calling views.
+
+    Checkers hold no state of their own, so views requiring the same
+    permission can share them.  `factory` is the class named in errors
+    about unknown permissions.
+
+    """
+    if permission is not None:
+        check_permission(factory, permission)
+    if permission is None or permission == 'zope.Public':
+        permission = CheckerPublic
+    return RESTChecker({'__call__': permission})
@@ -0,0 +1,257 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Serialization of the data returned by REST methods.
+
+A REST method can return plain Python data - dictionaries, lists,
+tuples, numbers and booleans - instead of a string.  The data is turned
+into the response body by an `IRESTSerializer`, which is a named adapter
+of the request.  Its name is the media type it produces, and the
+``Accept:`` header of the request chooses among the registered ones.
+JSON is used when the client does not ask for anything else, or for
+nothing that is available.
+
+Applications add serializers by registering more adapters, and replace
+the built-in ones by registering adapters with the same name for a more
+specific request type, such as their REST layer.
+
+JSON is encoded with `orjson` or `ujson` if either is installed, and
+with the `json` module of the standard library otherwise, or for data
+they cannot encode.  The
+MessagePack serializer is only available if `msgpack` is installed.
+
+"""
+import csv
+import io
+import json
+
+import grokcore.component as grok
+from zope import component
+from zope.interface import implementer
+from zope.interface import providedBy
+from zope.publisher.interfaces.http import IHTTPRequest
+
+from grokcore.rest.dispatch import RegistryCache
+from grokcore.rest.interfaces import IRESTSerializer
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+def _dumpJSON(data):
+    return json.dumps(
+        data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+if orjson is not None:
+    def dumpJSON(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Such as integers of more than 64 bits.
+            return _dumpJSON(data)
+elif ujson is not None:  # pragma: no cover
+    def dumpJSON(data):
+        try:
+            return ujson.dumps(data, ensure_ascii=False).encode('utf-8')
+        except OverflowError:
+            return _dumpJSON(data)
+else:  # pragma: no cover
+    dumpJSON = _dumpJSON
+
+
+DEFAULT_MEDIA_TYPE = 'application/json'
+
+# Negotiation results are remembered per request type and ``Accept:``
+# header; clients sending ever new headers must not fill the memory.
+MAX_NEGOTIATIONS = 1000
+
+_negotiations = RegistryCache()
+
+
+def isSerializable(result):
+    """Tell whether `result` is data to be serialized."""
+    return isinstance(result, (dict, list, tuple, int, float))
+
+
+def _parseAccept(accept):
+    ranges = []
+    for position, item in enumerate(accept.split(',')):
+        params = item.split(';')
+        media_range = params[0].strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params[1:]:
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            # Higher quality first, then more specific ranges, then the
+            # order of the header.
+            specificity = 2 - media_range.count('*')
+            ranges.append((-quality, -specificity, position, media_range))
+    ranges.sort()
+    return [media_range for _, _, _, media_range in ranges]
+
+
+def _match(media_range, available):
+    if media_range in available:
+        return media_range
+    if media_range == '*/*':
+        prefix = ''
+    elif media_range.endswith('/*'):
+        prefix = media_range[:-1]
+    else:
+        return None
+    if DEFAULT_MEDIA_TYPE.startswith(prefix) and \
+            DEFAULT_MEDIA_TYPE in available:
+        return DEFAULT_MEDIA_TYPE
+    for media_type in sorted(available):
+        if media_type.startswith(prefix):
+            return media_type
+    return None
+
+
+def negotiateMediaType(request):
+    """Return the name of the serializer to use for `request`."""
+    accept = request.getHeader('Accept', '')
+    table = _negotiations.get()
+    key = (providedBy(request), accept)
+    media_type = table.get(key)
+    if media_type is None:
+        available = set(
+            name for name, factory in _serializersFor(request))
+        media_type = DEFAULT_MEDIA_TYPE
+        for media_range in _parseAccept(accept):
+            match = _match(media_range, available)
+            if match is not None:
+                media_type = match
+                break
+        if len(table) < MAX_NEGOTIATIONS:
+            table[key] = media_type
+    return media_type
+
+
+def _serializersFor(request):
+    return component.getSiteManager().adapters.lookupAll(
+        (providedBy(request),), IRESTSerializer)
+
+
+def serialize(data, request):
+    """Return `data` serialized as the client of `request` prefers.
+
+    The ``Content-Type:`` header of the response is set accordingly.
+
+    """
+    return selectSerializer(request).serialize(data)
+
+
+def selectSerializer(request):
+    """Return the serializer the client of `request` prefers.
+
+    The headers of the response are set as for its serialized data.
+
+    """
+    media_type = negotiateMediaType(request)
+    serializer = component.queryAdapter(request, IRESTSerializer, media_type)
+    if serializer is None:
+        serializer = component.getAdapter(
+            request, IRESTSerializer, DEFAULT_MEDIA_TYPE)
+    response = request.response
+    response.setHeader('Content-Type', serializer.media_type)
+    addVaryHeader(response, 'Accept')
+    return serializer
+
+
+def addVaryHeader(response, name):
+    """Add `name` to the ``Vary:`` header of `response`."""
+    vary = response.getHeader('Vary')
+    names = [value.strip() for value in vary.split(',')] if vary else []
+    if name not in names:
+        names.append(name)
+        response.setHeader('Vary', ', '.join(names))
+
+
+@implementer(IRESTSerializer)
+class Serializer(grok.Adapter):
+    """Base class of the serializers defined here."""
+    grok.baseclass()
+    grok.context(IHTTPRequest)
+    grok.provides(IRESTSerializer)
+
+    media_type = None
+
+    def __init__(self, request):
+        self.request = request
+
+
+class JSONSerializer(Serializer):
+    grok.name('application/json')
+
+    media_type = 'application/json'
+
+    def serialize(self, data):
+        return dumpJSON(data)
+
+
+class CSVSerializer(Serializer):
+    """Serializes rows given as sequences or as dictionaries.
+
+    The keys of the first dictionary are used as the header row.
+
+    """
+    grok.name('text/csv')
+
+    media_type = 'text/csv;charset=utf-8'
+
+    def serialize(self, data):
+        out = io.StringIO()
+        rows = iter(data)
+        first = next(rows, None)
+        if isinstance(first, dict):
+            writer = csv.DictWriter(out, fieldnames=list(first))
+            writer.writeheader()
+        else:
+            writer = csv.writer(out)
+        if first is not None:
+            writer.writerow(first)
+            writer.writerows(rows)
+        return out.getvalue().encode('utf-8')
+
+
+if msgpack is not None:
+
+    class MessagePackSerializer(Serializer):
+        grok.name('application/msgpack')
+
+        media_type = 'application/msgpack'
+
+        def serialize(self, data):
+            return msgpack.packb(data, use_bin_type=True)
@@ -0,0 +1,166 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Lookup and application of REST skins.
+
+Every REST request names its skin, and applying a skin means replacing
+the skin declarations directly provided by the request.  Both are done
+here with plain dictionaries: the `IRESTSkinType` utilities found by
+name are remembered for every registry until it changes, so skins
+registered in local sites are found as before, and the declaration a
+request ends up with after applying a skin is remembered for the
+declaration it had before.
+
+Instead of a ``++rest++`` step in the URL, the skin can be chosen by an
+`IRESTSkinSelector` utility when the request starts.  `RESTSkinSelector`
+picks it from a request header, a vendor media type in the ``Accept:``
+header, or the host name.
+
+"""
+import zope.event
+from grokcore.component import provideInterface
+from zope import component
+from zope.interface import implementer
+from zope.interface import providedBy
+from zope.publisher.skinnable import SkinChangedEvent
+from zope.publisher.skinnable import applySkin
+
+from grokcore.rest.dispatch import FrozenMemo
+from grokcore.rest.dispatch import RegistryCache
+from grokcore.rest.interfaces import IRESTSkinSelector
+from grokcore.rest.interfaces import IRESTSkinType
+from grokcore.rest.serializers import addVaryHeader
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+_skins = RegistryCache('utilities')
+_skinned = {}
+
+
+def registerRESTSkin(name, skin):
+    """Register `skin` as the REST skin called `name`."""
+    provideInterface(name, skin, IRESTSkinType)
+    _skinned.clear()
+
+
+def queryRESTSkin(name, default=None):
+    """Return the REST skin called `name`."""
+    table = _skins.get()
+    skin = table.get(name)
+    if skin is None:
+        skin = component.queryUtility(IRESTSkinType, name)
+        if skin is None:
+            # Clients can make up any number of names, which are not
+            # remembered.
+            return default
+        table[name] = skin
+    return skin
+
+
+def applyRESTSkin(request, skin):
+    """Apply `skin` to `request`, like `applySkin()` does."""
+    key = (providedBy(request), skin)
+    provides = _skinned.get(key)
+    if provides is None:
+        applySkin(request, skin)
+        _skinned[key] = request.__provides__
+    else:
+        request.__provides__ = provides
+        zope.event.notify(SkinChangedEvent(request))
+
+
+@implementer(IRESTSkinSelector)
+class RESTSkinSelector:
+    """Chooses the REST skin by request header, media type or host.
+
+    `header` names a request header giving the name of the skin, such as
+    ``X-API-Skin``.  `vendor` is the start of vendor media types in the
+    ``Accept:`` header: with ``'application/vnd.example.'``, a request
+    accepting ``application/vnd.example.v2+json`` is given the skin
+    ``v2``.  `hosts` maps host names to skin names.  They are tried in
+    this order.
+
+    """
+
+    def __init__(self, header=None, vendor=None, hosts=None):
+        self.header = header
+        self.vendor = vendor
+        self.hosts = dict(hosts or {})
+
+    def selectSkin(self, request):
+        response = request.response
+        if self.header is not None:
+            addVaryHeader(response, self.header)
+            name = request.getHeader(self.header)
+            if name:
+                return name.strip()
+        if self.vendor is not None:
+            addVaryHeader(response, 'Accept')
+            name = self._vendorSkin(request.getHeader('Accept', ''))
+            if name:
+                return name
+        if self.hosts:
+            host = request.get('HTTP_HOST', '').rsplit(':', 1)[0]
+            return self.hosts.get(host.lower())
+        return None
+
+    def _vendorSkin(self, accept):
+        for media_range in accept.split(','):
+            media_type = media_range.split(';', 1)[0].strip().lower()
+            if media_type.startswith(self.vendor):
+                return media_type[len(self.vendor):].split('+', 1)[0]
+        return None
+
+
+def selectRESTSkin(request):
+    """Apply the skin the `IRESTSkinSelector` chooses for `request`."""
+    selector = component.queryUtility(IRESTSkinSelector)
+    if selector is None:
+        return
+    name = selector.selectSkin(request)
+    if not name:
+        return
+    skin = queryRESTSkin(name)
+    if skin is not None:
+        applyRESTSkin(request, skin)
+
+
+def setSkinTableFrozen(frozen):
+    """Keep the skins found and the declarations of skinned requests.
+
+    While the table is frozen, declarations are still computed for
+    requests not seen before, but they are no longer remembered.
+
+    """
+    global _skinned
+    _skinned = FrozenMemo(_skinned) if frozen else dict(_skinned)
+    if frozen:
+        _skins.freeze()
+    else:
+        _skins.thaw()
+
+
+def _clear():
+    setSkinTableFrozen(False)
+    _skins.clear()
+    _skinned.clear()
+
+
+addCleanUp(_clear)
@@ -0,0 +1,138 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Streaming responses of REST views.
+
+A REST method can return an iterator, a generator or a file-like object
+instead of a string.  It is wrapped in a `StreamingResult`, which the
+publisher hands to the WSGI server as the response iterable, so the body
+is sent while it is produced.  Since no ``Content-Length:`` is known,
+HTTP/1.1 servers send the body with chunked transfer encoding.
+
+The body is produced after the publisher has finished the request: the
+transaction is committed by then.  The database connection of the
+request is kept open until the body was sent, so generators can read
+persistent objects while they run; what they change is aborted.
+
+"""
+from zope.interface import implementer
+from zope.publisher.http import getCharsetUsingRequest
+from zope.publisher.interfaces import IHeld
+from zope.publisher.interfaces.http import IResult
+
+
+@implementer(IResult)
+class StreamingResult:
+    """A response body that is sent while it is produced.
+
+    `body` is an iterable of bytes or text, or a file-like object, which
+    is read in chunks of `chunk_size` bytes.  Text is encoded with
+    `encoding`.  If `content_type` is given, it is set on the response
+    when the result is returned from a REST method.
+
+    """
+
+    def __init__(self, body, content_type=None, chunk_size=65536,
+                 encoding='utf-8'):
+        self.body = body
+        self.content_type = content_type
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self._connection = None
+        self._held = []
+
+    def __iter__(self):
+        body = self.body
+        if hasattr(body, 'read'):
+            read = body.read
+            body = iter(lambda: read(self.chunk_size), read(0))
+        try:
+            for chunk in body:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(self.encoding)
+                if chunk:
+                    yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        # WSGI servers call this when they are done with the body, also
+        # if the client went away.  Middleware iterating over the body
+        # may not, so it is closed when the iteration ends as well.
+        try:
+            close = getattr(self.body, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._release()
+
+    def _release(self):
+        # Release what the request would have released when it was
+        # closed, like its database connection.
+        held, self._held = self._held, []
+        if not held:
+            return
+        try:
+            if self._connection is not None:
+                self._connection.transaction_manager.abort()
+        finally:
+            for ob in held:
+                ob.release()
+
+
+@implementer(IHeld)
+class _DeferredRelease:
+    """An object held by a request which may be released by its result.
+
+    When the request is closed with `result` as the body of its
+    response, `result` releases `held` once it was sent.  Otherwise, as
+    when the request failed, `held` is released right away.
+    """
+
+    def __init__(self, held, request, result):
+        self.held = held
+        self.request = request
+        self.result = result
+
+    def release(self):
+        held, result = self.held, self.result
+        response = self.request.response
+        self.held = self.request = self.result = None
+        if response.consumeBodyIter() is result:
+            result._held.append(held)
+        else:
+            held.release()
+
+
+def isStreamable(result):
+    """Tell whether `result` is to be sent as a `StreamingResult`."""
+    if isinstance(result, (str, bytes)):
+        return False
+    return hasattr(result, '__next__') or hasattr(result, 'read')
+
+
+def prepareStreamingResult(result, request):
+    """Return the `StreamingResult` sending `result` for `request`."""
+    if not isinstance(result, StreamingResult):
+        result = StreamingResult(
+            result, encoding=getCharsetUsingRequest(request) or 'utf-8')
+    if result.content_type is not None:
+        request.response.setHeader('Content-Type', result.content_type)
+    result._connection = request.annotations.get(
+        'ZODB.interfaces.IConnection')
+    # `request.close()` releases the objects held by the request, which
+    # must outlive the request while the result is sent.
+    request._held = tuple(
+        _DeferredRelease(ob, request, result) if IHeld.providedBy(ob) else ob
+        for ob in request._held)
+    return result
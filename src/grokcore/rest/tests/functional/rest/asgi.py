@@ -0,0 +1,173 @@
+"""
+The publisher can be served to ASGI servers by wrapping its WSGI
+application in an `ASGIApplication`:
+
+  >>> from grokcore.rest.asgi import ASGIApplication
+  >>> app = ASGIApplication(wsgi_app(), max_workers=2)
+
+  >>> root = getRootFolder()
+  >>> root['kite'] = Kite()
+  >>> import transaction
+  >>> transaction.commit()
+
+REST requests are answered as they would be through WSGI:
+
+  >>> start, *body = asgi_call(app, 'GET', '/++rest++sky/kite')
+  >>> start['status']
+  200
+  >>> start['headers']
+  [(b'content-length', b'6'), (b'content-type', b'text/plain;charset=utf-8')]
+  >>> for message in body:
+  ...     print(message)
+  {'type': 'http.response.body', 'body': b'Flying', 'more_body': True}
+  {'type': 'http.response.body', 'body': b''}
+
+The path is taken from the raw path the client sent, when the server
+gives it, and decoded like WSGI servers do:
+
+  >>> root['red kite'] = Kite()
+  >>> transaction.commit()
+  >>> asgi_call(app, 'GET', '/++rest++sky/red kite',
+  ...           raw_path=b'/++rest++sky/red%20kite')[0]['status']
+  200
+
+  >>> import io
+  >>> from grokcore.rest.asgi import makeEnviron
+  >>> environ = makeEnviron(
+  ...     {'method': 'GET', 'path': '/caf\xe9 au lait',
+  ...      'raw_path': b'/caf%C3%A9%20au%20lait?sugar'}, io.BytesIO())
+  >>> environ['PATH_INFO'] == '/caf\xe9 au lait'.encode().decode('latin-1')
+  True
+
+and so are methods that are not allowed:
+
+  >>> asgi_call(app, 'DELETE', '/++rest++sky/kite')[0]['status']
+  405
+
+The request body is received before the request is published, so a
+slow client does not keep a publishing thread waiting:
+
+  >>> messages = asgi_call(app, 'PUT', '/++rest++sky/kite',
+  ...                      body=[b'Up ', b'and ', b'away'],
+  ...                      headers=[(b'content-length', b'11')])
+  >>> messages[1]['body']
+  b'Got 11 bytes'
+
+Large bodies are kept in a temporary file instead of memory:
+
+  >>> from grokcore.rest.asgi import receiveBody
+  >>> async def receive_body(chunks, spool_size):
+  ...     async def receive():
+  ...         chunk = chunks.pop(0)
+  ...         return {'type': 'http.request', 'body': chunk,
+  ...                 'more_body': bool(chunks)}
+  ...     return await receiveBody(receive, spool_size)
+  >>> body = asyncio.run(receive_body([b'Up ', b'and ', b'away'], 5))
+  >>> body._rolled, body.read()
+  (True, b'Up and away')
+  >>> body.close()
+
+Nothing is published when the client goes away before sending the whole
+body:
+
+  >>> asgi_call(app, 'PUT', '/++rest++sky/kite', body=[])
+  []
+
+and streaming results are sent chunk by chunk:
+
+  >>> for message in asgi_call(app, 'POST', '/++rest++sky/kite')[1:]:
+  ...     print(message)
+  {'type': 'http.response.body', 'body': b'one ', 'more_body': True}
+  {'type': 'http.response.body', 'body': b'two ', 'more_body': True}
+  {'type': 'http.response.body', 'body': b'three', 'more_body': True}
+  {'type': 'http.response.body', 'body': b''}
+
+An error after the response was started cannot be answered with
+another response, so it is raised again, as the WSGI specification
+asks:
+
+  >>> import sys
+  >>> def failing(environ, start_response):
+  ...     start_response('200 Ok', [])
+  ...     yield b'Half'
+  ...     try:
+  ...         raise ValueError('Broken')
+  ...     except ValueError:
+  ...         start_response('500 Error', [], sys.exc_info())
+  >>> asgi_call(ASGIApplication(failing), 'GET', '/')
+  Traceback (most recent call last):
+  ValueError: Broken
+
+The thread pool is shut down with the server:
+
+  >>> async def lifespan():
+  ...     messages = [{'type': 'lifespan.startup'},
+  ...                 {'type': 'lifespan.shutdown'}]
+  ...     async def receive():
+  ...         return messages.pop(0)
+  ...     async def send(message):
+  ...         print(message)
+  ...     await app({'type': 'lifespan'}, receive, send)
+  >>> asyncio.run(lifespan())
+  {'type': 'lifespan.startup.complete'}
+  {'type': 'lifespan.shutdown.complete'}
+
+"""
+import asyncio
+
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+def asgi_call(app, method, path, body=(b'',), headers=(), raw_path=None):
+    """Call the ASGI `app` and return the messages it sends."""
+    scope = {
+        'type': 'http', 'http_version': '1.1', 'method': method,
+        'scheme': 'http', 'path': path, 'query_string': b'',
+        'root_path': '', 'headers': list(headers),
+        'server': ('localhost', 80), 'client': ('127.0.0.1', 4711),
+    }
+    if raw_path is not None:
+        scope['raw_path'] = raw_path
+    chunks = list(body)
+    messages = []
+
+    async def receive():
+        if not chunks:
+            return {'type': 'http.disconnect'}
+        chunk = chunks.pop(0)
+        return {'type': 'http.request', 'body': chunk,
+                'more_body': bool(chunks)}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+class Kite(content.Model):
+    pass
+
+
+class SkyLayer(rest.IRESTLayer):
+    rest.restskin('sky')
+
+
+class KiteRest(rest.REST):
+    view.layer(SkyLayer)
+    grok.context(Kite)
+
+    def GET(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return 'Flying'
+
+    def PUT(self):
+        return b'Got %d bytes' % len(self.body_file.read())
+
+    def POST(self):
+        return rest.StreamingResult(iter(['one ', 'two ', 'three']))
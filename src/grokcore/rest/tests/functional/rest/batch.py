@@ -0,0 +1,152 @@
+"""
+Several REST requests can be made at once by posting them to the
+``++batch++`` namespace of an object:
+
+  >>> import json
+  >>> root = getRootFolder()
+  >>> root['pen'] = pen = Pen()
+  >>> pen['lenny'] = Goat('Lenny')
+  >>> pen['molly'] = Goat('Molly')
+
+  >>> def batch(operations, path='/++rest++batch/pen/++batch++'):
+  ...     response = http_call(wsgi_app(), 'POST', path,
+  ...                          data=json.dumps(operations),
+  ...                          **{'Content-Type': 'application/json'})
+  ...     print(response.getStatus())
+  ...     return json.loads(response.getBody())
+
+  >>> for outcome in batch([{'method': 'GET', 'path': 'lenny'},
+  ...                        {'method': 'GET', 'path': '/molly'}]):
+  ...     print(outcome['status'], outcome['headers'])
+  ...     print(outcome['body'])
+  200
+  200 {'Content-Type': 'text/plain;charset=utf-8'}
+  Hello Lenny at http://localhost/++rest++batch/pen/lenny
+  200 {'Content-Type': 'text/plain;charset=utf-8'}
+  Hello Molly at http://localhost/++rest++batch/pen/molly
+
+Operations can send a body and headers.  They share the transaction of
+the batch request:
+
+  >>> result = batch([{'method': 'PUT', 'path': 'lenny',
+  ...                  'body': {'name': 'Leonard'}},
+  ...                 {'method': 'GET', 'path': 'lenny',
+  ...                  'headers': {'X-Greeting': 'Howdy'}}])
+  200
+  >>> result[1]['body']
+  'Howdy Leonard at http://localhost/++rest++batch/pen/lenny'
+
+Failed operations are reported, and their changes are undone without
+affecting the other operations:
+
+  >>> result = batch([{'method': 'PUT', 'path': 'molly',
+  ...                  'body': {'name': 'Molly', 'fail': True}},
+  ...                 {'method': 'DELETE', 'path': 'molly'},
+  ...                 {'method': 'GET', 'path': 'dolly'},
+  ...                 {'method': 'POST', 'path': 'lenny'},
+  ...                 {'method': 'PUT', 'path': 'lenny', 'body': 'Lenny',
+  ...                  'headers': {'Content-Type': 'text/plain'}},
+  ...                 {'method': 'PUT', 'path': 'lenny', 'body': '{',
+  ...                  'headers': {'Content-Type': 'application/json'}},
+  ...                 {'path': 'lenny'}])
+  200
+  >>> [(op['status'], op['body']) for op in result]
+  [(500, 'Internal Server Error'), (403, 'Forbidden'), (404, 'Not Found'),
+   (405, 'Method Not Allowed'), (415, 'Unsupported Media Type'),
+   (400, 'Bad Request'), (400, 'Bad Request')]
+  >>> pen['molly'].name
+  'Molly'
+  >>> pen['lenny'].name
+  'Leonard'
+
+The request of every operation is closed once it was published, which
+releases what it holds:
+
+  >>> batch([{'method': 'PATCH', 'path': 'lenny'}])
+  200
+  [{'status': 200, 'headers': {}, 'body': ''}]
+  >>> released
+  ['Leonard']
+
+Only REST layers extending `IRESTBatchLayer` accept batches:
+
+  >>> print(http_call(wsgi_app(), 'POST', '/++rest++paddock/pen/++batch++',
+  ...                 data='[]', handle_errors=True,
+  ...                 **{'Content-Type': 'application/json'}).getStatus())
+  404
+
+Batches must be lists of operations:
+
+  >>> batch({'method': 'GET'})
+  Traceback (most recent call last):
+  ...
+  grokcore.rest.requestbody.MalformedRequestBody: ...
+
+"""
+import grokcore.component as grok
+from zope.interface import implementer
+from zope.publisher.interfaces import IHeld
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Pen(content.Container):
+    pass
+
+
+class Goat(content.Model):
+
+    def __init__(self, name):
+        self.name = name
+
+
+released = []
+
+
+@implementer(IHeld)
+class Tether:
+
+    def __init__(self, name):
+        self.name = name
+
+    def release(self):
+        released.append(self.name)
+
+
+class BatchLayer(rest.IRESTBatchLayer):
+    rest.restskin('batch')
+
+
+class PaddockLayer(rest.IRESTLayer):
+    rest.restskin('paddock')
+
+
+class GoatRest(rest.REST):
+    view.layer(BatchLayer)
+    grok.context(Goat)
+
+    def GET(self):
+        greeting = self.request.getHeader('X-Greeting', 'Hello')
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return '%s %s at %s' % (
+            greeting, self.context.name, self.request.getURL())
+
+    def PUT(self):
+        data = self.parsed_body
+        self.context.name = data['name']
+        if data.get('fail'):
+            raise ValueError('The goat ate the request')
+        return b''
+
+    @security.require('zope.ManageContent')
+    def DELETE(self):
+        del self.context.__parent__[self.context.__name__]
+        return b''
+
+    def PATCH(self):
+        self.request.hold(Tether(self.context.name))
+        return b''
@@ -0,0 +1,215 @@
+"""
+GET methods of REST views can have their responses cached on the
+server:
+
+  >>> import transaction
+  >>> root = getRootFolder()
+  >>> root['tablet'] = tablet = Tablet()
+  >>> tablet.text = 'Ugh'
+  >>> transaction.commit()
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++cached/tablet'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  X-Carved: 1
+  <BLANKLINE>
+  Ugh
+
+The second request is answered from the cache, the method is not called
+again:
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++cached/tablet'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  X-Carved: 1
+  <BLANKLINE>
+  Ugh
+
+Other query strings and other values of the headers the cache varies on
+are different requests:
+
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++cached/tablet?shout=1').getBody())
+  b'UGH'
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++cached/tablet',
+  ...                 **{'Accept-Language': 'de'}).getHeader('X-Carved'))
+  3
+
+A new version of the object is not answered from the cache:
+
+  >>> tablet.text = 'Grr'
+  >>> transaction.commit()
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++cached/tablet'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  X-Carved: 4
+  <BLANKLINE>
+  Grr
+
+Methods without the directive are not cached:
+
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++uncached/tablet').getBody())
+  b'5'
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++uncached/tablet').getBody())
+  b'6'
+
+A maximum age of 0 turns caching off, here for the GET method of a
+class whose responses are cached otherwise:
+
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++fresh/tablet').getBody())
+  b'7'
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++fresh/tablet').getBody())
+  b'8'
+
+The version of views telling their entity tag is taken from it.  It is
+computed once for the conditions of the request and the cache key:
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++tagged/tablet'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  Etag: "Grr"
+  <BLANKLINE>
+  Grr
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++tagged/tablet'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  Etag: "Grr"
+  <BLANKLINE>
+  Grr
+  >>> tagged
+  ['Grr', 'Grr']
+
+Negative ages are refused:
+
+  >>> class BrokenTabletRest(rest.REST):
+  ...     rest.responsecache(-1)
+  Traceback (most recent call last):
+  martian.error.GrokImportError: The maximum age of cached responses must
+  not be negative, not -1.
+
+Responses are kept in an LRU cache by default.  It drops the least
+recently used and the expired entries:
+
+  >>> from grokcore.rest.cache import LRUResponseCache
+  >>> now = [0]
+  >>> cache = LRUResponseCache(maxsize=2, clock=lambda: now[0])
+  >>> cache.set('a', 1)
+  >>> cache.set('b', 2, 10)
+  >>> cache.get('a')
+  1
+  >>> cache.set('c', 3)
+  >>> cache.get('b') is None
+  True
+  >>> cache.set('d', 4, 10)
+  >>> now[0] = 10
+  >>> cache.get('d') is None
+  True
+  >>> cache.get('c')
+  3
+
+Another cache, for instance a memcached client, can be used by
+registering it as an `IRESTResponseCache` utility:
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from grokcore.rest.interfaces import IRESTResponseCache
+  >>> from grokcore.rest.cache import getResponseCache
+  >>> getGlobalSiteManager().registerUtility(cache, IRESTResponseCache)
+  >>> getResponseCache() is cache
+  True
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++cached/tablet',
+  ...                 **{'Accept-Language': 'fr'}).getBody())
+  b'Grr'
+  >>> len(cache)
+  2
+  >>> getGlobalSiteManager().unregisterUtility(cache, IRESTResponseCache)
+  True
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+carved = []
+tagged = []
+
+
+class Tablet(content.Model):
+    pass
+
+
+class CachedLayer(rest.IRESTLayer):
+    rest.restskin('cached')
+
+
+class UncachedLayer(rest.IRESTLayer):
+    rest.restskin('uncached')
+
+
+class FreshLayer(rest.IRESTLayer):
+    rest.restskin('fresh')
+
+
+class TaggedLayer(rest.IRESTLayer):
+    rest.restskin('tagged')
+
+
+class TabletRest(rest.REST):
+    view.layer(CachedLayer)
+    grok.context(Tablet)
+
+    @rest.responsecache(60, vary=['Accept-Language'])
+    def GET(self, shout=False):
+        carved.append(self.context.text)
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        self.request.response.setHeader('X-Carved', str(len(carved)))
+        if shout:
+            return self.context.text.upper()
+        return self.context.text
+
+
+class UncachedTabletRest(rest.REST):
+    view.layer(UncachedLayer)
+    grok.context(Tablet)
+
+    def GET(self):
+        carved.append(self.context.text)
+        return str(len(carved)).encode()
+
+
+class FreshTabletRest(rest.REST):
+    view.layer(FreshLayer)
+    grok.context(Tablet)
+    rest.responsecache(60)
+
+    @rest.responsecache(0)
+    def GET(self):
+        carved.append(self.context.text)
+        return str(len(carved)).encode()
+
+
+class TaggedTabletRest(rest.REST):
+    view.layer(TaggedLayer)
+    grok.context(Tablet)
+
+    def etag(self):
+        tagged.append(self.context.text)
+        return self.context.text
+
+    @rest.responsecache(60)
+    def GET(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return self.context.text
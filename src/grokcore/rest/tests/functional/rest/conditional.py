@@ -0,0 +1,136 @@
+"""
+REST views can answer conditional GET requests by telling the entity tag
+and the modification time of the resource they present:
+
+  >>> import datetime
+  >>> root = getRootFolder()
+  >>> root['scroll'] = scroll = Scroll()
+  >>> scroll.version = 3
+  >>> scroll.modified = datetime.datetime(2007, 5, 1, 12, 0)
+
+Both are sent along with the response:
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++conditional/scroll'))
+  HTTP/1.1 200 Ok
+  Content-Length: 14
+  Content-Type: text/plain;charset=utf-8
+  Etag: "v3"
+  Last-Modified: Tue, 01 May 2007 12:00:00 GMT
+  <BLANKLINE>
+  Hello scroll 3
+
+Request parameters are still passed to the method:
+
+  >>> print(http_call(wsgi_app(), 'GET',
+  ...                 '/++rest++conditional/scroll?greeting=Howdy').getBody())
+  b'Howdy scroll 3'
+
+A client having the current version already is told so, and the method
+is not called at all:
+
+  >>> calls = len(Scroll.calls)
+  >>> response = http_call(wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...                      **{'If-None-Match': '"v2", "v3"'})
+  >>> response.getStatus()
+  304
+  >>> response.getHeader('ETag')
+  '"v3"'
+  >>> response.getBody()
+  b''
+  >>> len(Scroll.calls) == calls
+  True
+
+Weak entity tags match as well:
+
+  >>> response = http_call(wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...                      **{'If-None-Match': 'W/"v3"'})
+  >>> response.getStatus()
+  304
+
+An outdated copy is replaced:
+
+  >>> response = http_call(wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...                      **{'If-None-Match': '"v2"'})
+  >>> response.getStatus()
+  200
+  >>> len(Scroll.calls) == calls + 1
+  True
+
+Without an entity tag to compare, the modification time is used:
+
+  >>> response = http_call(
+  ...     wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...     **{'If-Modified-Since': 'Tue, 01 May 2007 12:00:00 GMT'})
+  >>> response.getStatus()
+  304
+
+  >>> response = http_call(
+  ...     wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...     **{'If-Modified-Since': 'Mon, 30 Apr 2007 12:00:00 GMT'})
+  >>> response.getStatus()
+  200
+
+  >>> response = http_call(
+  ...     wsgi_app(), 'GET', '/++rest++conditional/scroll',
+  ...     **{'If-Modified-Since': 'yesterday'})
+  >>> response.getStatus()
+  200
+
+HEAD requests are answered by the GET view, so they get the validators
+as well.  They are always answered in full, though:
+
+  >>> response = http_call(wsgi_app(), 'HEAD', '/++rest++conditional/scroll',
+  ...                      **{'If-None-Match': '"v3"'})
+  >>> response.getStatus()
+  200
+  >>> response.getHeader('ETag')
+  '"v3"'
+
+Other methods are not affected:
+
+  >>> response = http_call(wsgi_app(), 'PUT', '/++rest++conditional/scroll',
+  ...                      **{'If-None-Match': '"v3"'})
+  >>> response.getStatus()
+  200
+
+The methods telling the validators are not published themselves:
+
+  >>> response = http_call(wsgi_app(), 'etag', '/++rest++conditional/scroll',
+  ...                      handle_errors=True)
+  >>> response.getStatus()
+  405
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Scroll(content.Model):
+    calls = []
+
+
+class ConditionalLayer(rest.IRESTLayer):
+    rest.restskin('conditional')
+
+
+class ScrollRest(rest.REST):
+    view.layer(ConditionalLayer)
+    grok.context(Scroll)
+
+    def etag(self):
+        return 'v%s' % self.context.version
+
+    def last_modified(self):
+        return self.context.modified
+
+    def GET(self, greeting='Hello'):
+        Scroll.calls.append('GET')
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return '%s scroll %s' % (greeting, self.context.version)
+
+    def PUT(self):
+        return b''
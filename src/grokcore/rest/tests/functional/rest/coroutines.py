@@ -0,0 +1,81 @@
+"""
+REST methods can be declared with ``async def``.  Their coroutines are
+run on an event loop when the request is published:
+
+  >>> root = getRootFolder()
+  >>> root['owl'] = Owl()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++night/owl').getBody())
+  b'Hoo! Hoo!'
+
+What they return is treated like the results of other REST methods:
+
+  >>> response = http_call(wsgi_app(), 'POST', '/++rest++night/owl',
+  ...                      Accept='application/json')
+  >>> response.getHeader('Content-Type')
+  'application/json'
+  >>> response.getBody()
+  b'{"hoots":2}'
+
+and so are their exceptions:
+
+  >>> print(http_call(wsgi_app(), 'DELETE', '/++rest++night/owl',
+  ...                 handle_errors=True).getStatus())
+  413
+
+Every thread uses the same event loop for all requests:
+
+  >>> from grokcore.rest.coroutines import getEventLoop
+  >>> loops = set(Owl.loops)
+  >>> loops == {getEventLoop()}
+  True
+
+The event loop is closed when its thread ends:
+
+  >>> import threading
+  >>> thread = threading.Thread(target=lambda: loops.add(getEventLoop()))
+  >>> thread.start()
+  >>> thread.join()
+  >>> loop, = loops - {getEventLoop()}
+  >>> loop.is_closed()
+  True
+
+"""
+import asyncio
+
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+from grokcore.rest.requestbody import RequestEntityTooLarge
+
+
+class Owl(content.Model):
+    loops = []
+
+
+class NightLayer(rest.IRESTLayer):
+    rest.restskin('night')
+
+
+class OwlRest(rest.REST):
+    view.layer(NightLayer)
+    grok.context(Owl)
+
+    async def _hoot(self):
+        await asyncio.sleep(0)
+        return 'Hoo!'
+
+    async def GET(self):
+        Owl.loops.append(asyncio.get_running_loop())
+        hoots = await asyncio.gather(self._hoot(), self._hoot())
+        return ' '.join(hoots).encode('ascii')
+
+    async def POST(self):
+        Owl.loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return {'hoots': 2}
+
+    async def DELETE(self):
+        await asyncio.sleep(0)
+        raise RequestEntityTooLarge(self.context, self.request, 0)
@@ -0,0 +1,128 @@
+"""
+REST views can have the request body parsed according to its content
+type:
+
+  >>> root = getRootFolder()
+  >>> root['nest'] = Nest()
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                 data='{"eggs": 3, "bird": "dodo"}',
+  ...                 **{'Content-Type': 'application/json'}).getBody())
+  b"{'bird': 'dodo', 'eggs': 3}"
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                 data='{"eggs": 4}',
+  ...                 **{'Content-Type': 'application/vnd.nest+json'}
+  ...                 ).getBody())
+  b"{'eggs': 4}"
+
+  >>> print(http_call(
+  ...     wsgi_app(), 'POST', '/++rest++deserializers/nest',
+  ...     data='bird=moa&egg=1&egg=2',
+  ...     **{'Content-Type': 'application/x-www-form-urlencoded'}).getBody())
+  b"{'bird': 'moa', 'egg': ['1', '2']}"
+
+Newline delimited JSON is parsed line by line while the handler iterates
+over it:
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                 data='{"eggs": 1}\\n\\n{"eggs": 2}\\n',
+  ...                 **{'Content-Type': 'application/x-ndjson'}).getBody())
+  b'generator: 1, 2'
+
+The body is parsed only once, and not at all if the handler does not
+look at it, so even bodies that cannot be parsed do no harm then:
+
+  >>> print(http_call(wsgi_app(), 'DELETE', '/++rest++deserializers/nest',
+  ...                 data='{"eggs": }',
+  ...                 **{'Content-Type': 'application/json'}).getBody())
+  b'Gone'
+
+Otherwise they are answered with 400 Bad Request.  Bodies of types that
+have no deserializer are answered with 415 Unsupported Media Type:
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                     data='{"eggs": }', handle_errors=True,
+  ...                     **{'Content-Type': 'application/json'}))
+  HTTP/1.1 400 Bad Request
+  Content-Length: 11
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Bad Request
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                     data='<eggs/>', handle_errors=True,
+  ...                     **{'Content-Type': 'text/xml'}))
+  HTTP/1.1 415 Unsupported Media Type
+  Content-Length: 22
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Unsupported Media Type
+
+So are bodies in a charset that is not known:
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                     data='{"eggs": 5}', handle_errors=True,
+  ...                     **{'Content-Type':
+  ...                        'application/json; charset=bogus'}))
+  HTTP/1.1 415 Unsupported Media Type
+  Content-Length: 22
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Unsupported Media Type
+
+JSON in another charset than UTF-8 is decoded according to the
+declared charset first:
+
+  >>> import io
+  >>> from zope.publisher.browser import TestRequest
+  >>> from grokcore.rest.deserializers import JSONDeserializer
+  >>> request = TestRequest(
+  ...     environ={'CONTENT_TYPE': 'application/json; charset=UTF-16'})
+  >>> JSONDeserializer(request).deserialize(
+  ...     io.BytesIO('{"bird": "kiwi"}'.encode('utf-16')))
+  {'bird': 'kiwi'}
+
+Requests without a content type have no parsed body:
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++deserializers/nest',
+  ...                 data='').getBody())
+  b'None'
+
+"""
+import types
+
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Nest(content.Model):
+    pass
+
+
+class DeserializersLayer(rest.IRESTLayer):
+    rest.restskin('deserializers')
+
+
+class NestRest(rest.REST):
+    view.layer(DeserializersLayer)
+    grok.context(Nest)
+
+    def PUT(self):
+        data = self.parsed_body
+        assert self.parsed_body is data
+        if isinstance(data, types.GeneratorType):
+            eggs = ', '.join(str(item['eggs']) for item in data)
+            return ('generator: %s' % eggs).encode()
+        if isinstance(data, dict):
+            data = dict(sorted(data.items()))
+        return repr(data).encode()
+
+    def POST(self):
+        return repr(self.parsed_body).encode()
+
+    def DELETE(self):
+        return b'Gone'
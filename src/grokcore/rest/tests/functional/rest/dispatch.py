@@ -0,0 +1,124 @@
+"""
+The view handling a REST request is normally looked up in the component
+registry for every request.  The dispatch cache can be switched on to
+remember the outcome of these lookups:
+
+  >>> from grokcore.rest.dispatch import setDispatchCacheEnabled
+  >>> from grokcore.rest.dispatch import isDispatchCacheEnabled
+  >>> isDispatchCacheEnabled()
+  False
+  >>> setDispatchCacheEnabled(True)
+
+  >>> root = getRootFolder()
+  >>> root['cave'] = Cave()
+
+Requests are dispatched just like before::
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++dispatch/cave'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  PUT
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++dispatch/cave'))
+  HTTP/1.1 200 Ok
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  PUT
+
+Unregistered methods are still refused::
+
+  >>> print(str_http_call(wsgi_app(), 'DELETE', '/++rest++dispatch/cave',
+  ...                     handle_errors=True))
+  HTTP/1.1 405 Method Not Allowed
+  Allow: OPTIONS, PUT
+  Content-Length: 18
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Method Not Allowed
+
+The cache notices changes to the registry.  When we register a DELETE
+view, it is used right away::
+
+  >>> from zope.security.checker import defineChecker
+  >>> from zope.security.checker import NamesChecker
+  >>> defineChecker(CaveDelete, NamesChecker(['__call__']))
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from zope.interface import Interface
+  >>> gsm = getGlobalSiteManager()
+  >>> gsm.registerAdapter(
+  ...     CaveDelete, (Cave, DispatchLayer), Interface, 'DELETE')
+
+  >>> print(str_http_call(wsgi_app(), 'DELETE', '/++rest++dispatch/cave'))
+  HTTP/1.1 200 Ok
+  Content-Length: 6
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  DELETE
+
+The ``Allow:`` header of the Method Not Allowed response is remembered
+as well, and it is updated just the same::
+
+  >>> print(str_http_call(wsgi_app(), 'POST', '/++rest++dispatch/cave',
+  ...                     handle_errors=True))
+  HTTP/1.1 405 Method Not Allowed
+  Allow: DELETE, OPTIONS, PUT
+  Content-Length: 18
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Method Not Allowed
+
+And it is gone again as soon as it is unregistered::
+
+  >>> gsm.unregisterAdapter(
+  ...     CaveDelete, (Cave, DispatchLayer), Interface, 'DELETE')
+  True
+  >>> print(str_http_call(wsgi_app(), 'DELETE', '/++rest++dispatch/cave',
+  ...                     handle_errors=True))
+  HTTP/1.1 405 Method Not Allowed
+  Allow: OPTIONS, PUT
+  Content-Length: 18
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Method Not Allowed
+
+  >>> from zope.security.checker import undefineChecker
+  >>> undefineChecker(CaveDelete)
+  >>> setDispatchCacheEnabled(False)
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Cave(content.Model):
+    pass
+
+
+class DispatchLayer(rest.IRESTLayer):
+    rest.restskin('dispatch')
+
+
+class CaveRest(rest.REST):
+    view.layer(DispatchLayer)
+    grok.context(Cave)
+
+    def PUT(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return "PUT"
+
+
+class CaveDelete(rest.REST):
+    grok.baseclass()
+
+    def DELETE(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return "DELETE"
@@ -0,0 +1,97 @@
+"""
+REST views answer any HTTP method they define, such as PATCH or
+extension methods of the application:
+
+  >>> root = getRootFolder()
+  >>> root['turtle'] = Turtle()
+  >>> root['rock'] = Rock()
+  >>> print(http_call(wsgi_app(), 'PATCH', '/++rest++shell/turtle',
+  ...                 data='Green').getBody())
+  b'Patched with Green'
+  >>> print(http_call(wsgi_app(), 'PURGE', '/++rest++shell/turtle')
+  ...       .getBody())
+  b'Purged'
+
+The ``Allow:`` header lists them along with the usual methods:
+
+  >>> print(http_call(wsgi_app(), 'OPTIONS', '/++rest++shell/turtle')
+  ...       .getHeader('Allow'))
+  GET, HEAD, OPTIONS, PATCH, PURGE
+  >>> response = http_call(wsgi_app(), 'DELETE', '/++rest++shell/turtle',
+  ...                      handle_errors=True)
+  >>> response.getStatus(), response.getHeader('Allow')
+  (405, 'GET, HEAD, OPTIONS, PATCH, PURGE')
+
+Objects without views for these methods refuse them, as they refuse the
+usual methods:
+
+  >>> response = http_call(wsgi_app(), 'PATCH', '/++rest++shell/rock',
+  ...                      data='Green', handle_errors=True)
+  >>> response.getStatus(), response.getHeader('Allow')
+  (405, 'OPTIONS')
+
+Views for HTTP methods that are not grokked, for instance ones
+registered with ZCML, are listed as well:
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from zope.interface import Interface
+  >>> getGlobalSiteManager().registerAdapter(
+  ...     RockLock, (Rock, ShellLayer), Interface, 'LOCK')
+  >>> print(http_call(wsgi_app(), 'OPTIONS', '/++rest++shell/rock')
+  ...       .getHeader('Allow'))
+  LOCK, OPTIONS
+  >>> getGlobalSiteManager().unregisterAdapter(
+  ...     RockLock, (Rock, ShellLayer), Interface, 'LOCK')
+  True
+
+  >>> from zope.component import getMultiAdapter
+  >>> from zope.publisher.browser import TestRequest
+  >>> request = TestRequest(skin=ShellLayer)
+  >>> for method in 'PUT', 'PATCH', 'PURGE':
+  ...     print(type(getMultiAdapter((Rock(), request), name=method)))
+  <class 'grokcore.rest.rest.NotAllowedREST'>
+  <class 'grokcore.rest.rest.NotAllowedREST'>
+  <class 'grokcore.rest.rest.NotAllowedREST'>
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Turtle(content.Model):
+    pass
+
+
+class Rock(content.Model):
+    pass
+
+
+class ShellLayer(rest.IRESTLayer):
+    rest.restskin('shell')
+
+
+class TurtleRest(rest.REST):
+    view.layer(ShellLayer)
+    grok.context(Turtle)
+
+    def GET(self):
+        return b'Turtle'
+
+    def PATCH(self):
+        return b'Patched with ' + self.body
+
+    def PURGE(self):
+        return b'Purged'
+
+
+class RockLock:
+
+    def __init__(self, context, request):
+        self.context = context
+        self.request = request
+
+    def LOCK(self):
+        return b'Locked'
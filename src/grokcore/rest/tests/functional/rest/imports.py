@@ -0,0 +1,41 @@
+"""
+Importing grokcore.rest imports neither the grokcore packages whose API
+it includes nor the component architecture:
+
+  >>> import subprocess
+  >>> import sys
+  >>> print(subprocess.check_output([sys.executable, '-c', '''
+  ... import sys
+  ... import grokcore.rest
+  ... print(sorted(name for name in sys.modules
+  ...              if name.startswith(('grokcore.', 'zope.', 'martian'))))
+  ... '''], universal_newlines=True))
+  ['grokcore.rest']
+
+The names are imported when they are looked up.  They are those of
+grokcore.component, grokcore.security and grokcore.view, and those of
+grokcore.rest itself:
+
+  >>> import grokcore.component
+  >>> import grokcore.rest
+  >>> import grokcore.view
+  >>> grokcore.rest.Adapter is grokcore.component.Adapter
+  True
+  >>> grokcore.rest.View is grokcore.view.View
+  True
+  >>> from grokcore.rest.components import REST
+  >>> grokcore.rest.REST is REST
+  True
+  >>> grokcore.rest.NoSuchName
+  Traceback (most recent call last):
+  AttributeError: module 'grokcore.rest' has no attribute 'NoSuchName'
+
+The module provides `IREST`, whose names make up ``__all__``:
+
+  >>> from grokcore.rest.interfaces import IREST
+  >>> IREST.providedBy(grokcore.rest)
+  True
+  >>> grokcore.rest.__all__ == list(IREST)
+  True
+
+"""
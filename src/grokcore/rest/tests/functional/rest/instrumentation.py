@@ -0,0 +1,115 @@
+"""
+The time spent in the stages of REST requests is handed to
+`IRESTTimingSink` utilities when instrumentation is enabled:
+
+  >>> import io
+  >>> from zope.component import getGlobalSiteManager
+  >>> from grokcore.rest import IRESTTimingSink
+  >>> from grokcore.rest.instrumentation import StatsDExporter
+  >>> from grokcore.rest.instrumentation import setInstrumentationEnabled
+  >>> sink = Sink()
+  >>> statsd = StatsDExporter(io.StringIO())
+  >>> getGlobalSiteManager().registerUtility(sink, IRESTTimingSink, 'test')
+  >>> getGlobalSiteManager().registerUtility(statsd, IRESTTimingSink)
+
+  >>> root = getRootFolder()
+  >>> root['beaver'] = Beaver()
+
+Nothing is recorded while it is disabled:
+
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++river/beaver').getBody())
+  b'Gnawing'
+  >>> sink.timings
+  []
+
+  >>> setInstrumentationEnabled(True)
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++river/beaver').getBody())
+  b'Gnawing'
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++river/beaver').getBody())
+  b'Damming'
+  >>> print(http_call(wsgi_app(), 'DELETE', '/++rest++river/beaver',
+  ...                 handle_errors=True).getStatus())
+  405
+  >>> for stage, name in sink.timings:
+  ...     print(stage, name)
+  traverse river
+  call grokcore.rest.tests.functional.rest.instrumentation.BeaverRest.GET
+  traverse river
+  lookup grokcore.rest.tests.functional.rest.instrumentation.BeaverRest.PUT
+  call grokcore.rest.tests.functional.rest.instrumentation.BeaverRest.PUT
+  traverse river
+  lookup grokcore.rest.rest.NotAllowedREST.DELETE
+  call grokcore.rest.rest.NotAllowedREST.DELETE
+  not_allowed DELETE
+
+The StatsD exporter writes a timer line for every timing:
+
+  >>> print(statsd.stream.getvalue())
+  grokcore.rest.traverse.river:...|ms
+  grokcore.rest.call.grokcore.rest.tests.functional.rest.instrumentation.BeaverRest.GET:...|ms
+  ...
+  grokcore.rest.not_allowed.DELETE:...|ms
+
+The Prometheus exporter sums the timings up and writes them to a file:
+
+  >>> import os, tempfile
+  >>> from grokcore.rest.instrumentation import PrometheusExporter
+  >>> path = os.path.join(tempfile.mkdtemp(), 'rest.prom')
+  >>> prometheus = PrometheusExporter(path)
+  >>> getGlobalSiteManager().unregisterUtility(statsd, IRESTTimingSink)
+  True
+  >>> getGlobalSiteManager().registerUtility(prometheus, IRESTTimingSink)
+  >>> for i in range(3):
+  ...     _ = http_call(wsgi_app(), 'GET', '/++rest++river/beaver')
+  >>> prometheus.write()
+  >>> with open(path) as f:
+  ...     print(f.read())
+  # HELP grokcore_rest_stage_seconds Time spent in stages of REST requests.
+  # TYPE grokcore_rest_stage_seconds summary
+  grokcore_rest_stage_seconds_count{stage="call",endpoint="...Rest.GET"} 3
+  grokcore_rest_stage_seconds_sum{stage="call",endpoint="...Rest.GET"} ...
+  grokcore_rest_stage_seconds_count{stage="traverse",endpoint="river"} 3
+  grokcore_rest_stage_seconds_sum{stage="traverse",endpoint="river"} ...
+
+  >>> setInstrumentationEnabled(False)
+  >>> getGlobalSiteManager().unregisterUtility(prometheus, IRESTTimingSink)
+  True
+  >>> getGlobalSiteManager().unregisterUtility(sink, IRESTTimingSink, 'test')
+  True
+
+"""
+import grokcore.component as grok
+from zope.interface import implementer
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+@implementer(rest.IRESTTimingSink)
+class Sink:
+
+    def __init__(self):
+        self.timings = []
+
+    def record(self, stage, name, duration):
+        self.timings.append((stage, name))
+
+
+class Beaver(content.Model):
+    pass
+
+
+class RiverLayer(rest.IRESTLayer):
+    rest.restskin('river')
+
+
+class BeaverRest(rest.REST):
+    view.layer(RiverLayer)
+    grok.context(Beaver)
+
+    def GET(self):
+        return b'Gnawing'
+
+    def PUT(self):
+        return b'Damming'
@@ -0,0 +1,170 @@
+"""
+HEAD and OPTIONS requests are answered for every REST view, without
+the need to define them.
+
+  >>> root = getRootFolder()
+  >>> root['igloo'] = Igloo()
+  >>> root['igloo']['tent'] = Tent()
+
+A HEAD request is answered by the GET view.  We get the headers it
+sets, but no body:
+
+  >>> response = http_call(wsgi_app(), 'HEAD', '/++rest++options/igloo')
+  >>> response.getStatus()
+  200
+  >>> response.getHeader('Content-Type')
+  'text/plain;charset=utf-8'
+  >>> response.getHeader('X-Igloo')
+  'cold'
+  >>> response.getBody()
+  b''
+
+The GET view is protected as usual:
+
+  >>> print(str_http_call(wsgi_app(), 'HEAD', '/++rest++cors/igloo',
+  ...                     handle_errors=True))
+  HTTP/1.1 401 Unauthorized
+  ...
+
+If there is no GET view, HEAD is not allowed either:
+
+  >>> print(str_http_call(wsgi_app(), 'HEAD', '/++rest++options/igloo/tent',
+  ...                     handle_errors=True))
+  HTTP/1.1 405 Method Not Allowed
+  Allow: OPTIONS, PUT
+  ...
+
+An OPTIONS request tells which methods are allowed:
+
+  >>> print(str_http_call(wsgi_app(), 'OPTIONS', '/++rest++options/igloo'))
+  HTTP/1.1 200 Ok
+  Allow: GET, HEAD, OPTIONS
+  Content-Length: 0
+  <BLANKLINE>
+
+  >>> print(str_http_call(wsgi_app(), 'OPTIONS',
+  ...                     '/++rest++options/igloo/tent'))
+  HTTP/1.1 200 Ok
+  Allow: OPTIONS, PUT
+  Content-Length: 0
+  <BLANKLINE>
+
+Cross-origin requests are only answered if the layer allows them with
+the `grok.cors()` directive.  The options layer does not:
+
+  >>> print(str_http_call(wsgi_app(), 'OPTIONS', '/++rest++options/igloo',
+  ...                     Origin='https://example.com'))
+  HTTP/1.1 200 Ok
+  Allow: GET, HEAD, OPTIONS
+  Content-Length: 0
+  <BLANKLINE>
+
+The cors layer does, for one origin:
+
+  >>> print(str_http_call(wsgi_app(), 'OPTIONS', '/++rest++cors/igloo',
+  ...                     Origin='https://example.com'))
+  HTTP/1.1 200 Ok
+  Access-Control-Allow-Credentials: true
+  Access-Control-Allow-Headers: Content-Type, Authorization
+  Access-Control-Allow-Methods: GET, HEAD, OPTIONS
+  Access-Control-Allow-Origin: https://example.com
+  Access-Control-Max-Age: 600
+  Allow: GET, HEAD, OPTIONS
+  Content-Length: 0
+  Vary: Origin
+  <BLANKLINE>
+
+  >>> print(str_http_call(wsgi_app(), 'OPTIONS', '/++rest++cors/igloo',
+  ...                     Origin='https://example.org'))
+  HTTP/1.1 200 Ok
+  Allow: GET, HEAD, OPTIONS
+  Content-Length: 0
+  <BLANKLINE>
+
+The actual cross-origin requests get the headers allowing the browser
+to pass on the response, too:
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++cors/igloo/tent',
+  ...                     Origin='https://example.com'))
+  HTTP/1.1 200 Ok
+  Access-Control-Allow-Credentials: true
+  Access-Control-Allow-Origin: https://example.com
+  Content-Length: 3
+  Content-Type: text/plain;charset=utf-8
+  Vary: Origin
+  <BLANKLINE>
+  PUT
+
+``Origin`` is added to the ``Vary:`` header, which may name other
+headers as well, like that choosing the REST skin:
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from grokcore.rest import IRESTSkinSelector
+  >>> from grokcore.rest.skins import RESTSkinSelector
+  >>> selector = RESTSkinSelector(header='X-API-Skin')
+  >>> getGlobalSiteManager().registerUtility(selector, IRESTSkinSelector)
+  >>> response = http_call(wsgi_app(), 'PUT', '/igloo/tent',
+  ...                      Origin='https://example.com',
+  ...                      **{'X-API-Skin': 'cors'})
+  >>> response.getHeader('Access-Control-Allow-Origin')
+  'https://example.com'
+  >>> response.getHeader('Vary')
+  'X-API-Skin, Origin'
+  >>> getGlobalSiteManager().unregisterUtility(selector, IRESTSkinSelector)
+  True
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Igloo(content.Container):
+    pass
+
+
+class Tent(content.Model):
+    pass
+
+
+class OptionsLayer(rest.IRESTLayer):
+    rest.restskin('options')
+
+
+class CORSLayer(OptionsLayer):
+    rest.restskin('cors')
+    rest.cors('https://example.com', headers=['Content-Type', 'Authorization'],
+              max_age=600, credentials=True)
+
+
+class IglooRest(rest.REST):
+    view.layer(OptionsLayer)
+    grok.context(Igloo)
+
+    def GET(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        self.request.response.setHeader('X-Igloo', 'cold')
+        return "Hello Igloo"
+
+
+class ProtectedIglooRest(rest.REST):
+    view.layer(CORSLayer)
+    grok.context(Igloo)
+
+    @security.require('zope.ManageContent')
+    def GET(self):
+        return "Hello Igloo"
+
+
+class TentRest(rest.REST):
+    view.layer(OptionsLayer)
+    grok.context(Tent)
+
+    def PUT(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return "PUT"
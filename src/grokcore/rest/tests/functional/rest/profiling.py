@@ -0,0 +1,114 @@
+"""
+A share of the calls of REST views can be profiled while the process
+is running:
+
+  >>> import tempfile
+  >>> from grokcore.rest.profiling import setProfilingEnabled
+  >>> directory = tempfile.mkdtemp()
+  >>> endpoint = 'grokcore.rest.tests.functional.rest.profiling.OtterRest.GET'
+  >>> setProfilingEnabled(True, directory, {endpoint: 1.0})
+
+  >>> root = getRootFolder()
+  >>> root['otter'] = Otter()
+  >>> for i in range(3):
+  ...     response = http_call(wsgi_app(), 'GET', '/++rest++stream/otter')
+  ...     print(response.getBody())
+  b'Splash'
+  b'Splash'
+  b'Splash'
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++stream/otter').getBody())
+  b'Dive'
+
+The samples of every view are added up in a `pstats` file:
+
+  >>> import os
+  >>> os.listdir(directory)
+  ['grokcore.rest.tests.functional.rest.profiling.OtterRest.GET.pstats']
+
+Managers can fetch the profiles from the ``++profiles++`` namespace:
+
+  >>> manager = {'Authorization': 'Basic mgr:mgrpw'}
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++stream/++profiles++',
+  ...                 handle_errors=True).getStatus())
+  401
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++stream/++profiles++',
+  ...                 **manager).getBody())
+  b'{"grokcore.rest.tests.functional.rest.profiling.OtterRest.GET":3}'
+
+  >>> response = http_call(
+  ...     wsgi_app(), 'GET',
+  ...     '/++rest++stream/++profiles++?endpoint=%s&report=text' % endpoint,
+  ...     **manager)
+  >>> response.getHeader('Content-Type')
+  'text/plain;charset=utf-8'
+  >>> report = response.getBody().decode('utf-8')
+  >>> 'Ordered by: cumulative time' in report, '(splash)' in report
+  (True, True)
+
+  >>> import marshal
+  >>> response = http_call(
+  ...     wsgi_app(), 'GET',
+  ...     '/++rest++stream/++profiles++?endpoint=' + endpoint, **manager)
+  >>> response.getHeader('Content-Type')
+  'application/octet-stream'
+  >>> stats = marshal.loads(response.getBody())
+  >>> [calls for (filename, line, function), (calls, *rest) in stats.items()
+  ...  if function == 'splash']
+  [3]
+
+  >>> print(http_call(
+  ...     wsgi_app(), 'GET',
+  ...     '/++rest++stream/++profiles++?endpoint=' + endpoint[:-3] + 'PUT',
+  ...     handle_errors=True, **manager).getStatus())
+  404
+
+The profiles are kept when profiling is switched off:
+
+  >>> setProfilingEnabled(False)
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++stream/++profiles++',
+  ...                 **manager).getBody())
+  b'{"grokcore.rest.tests.functional.rest.profiling.OtterRest.GET":3}'
+  >>> from grokcore.rest.profiling import readProfile
+  >>> from grokcore.rest.profiling import reportProfile
+  >>> readProfile(endpoint) == response.getBody()
+  True
+  >>> 'Ordered by: cumulative time' in reportProfile(endpoint)
+  True
+
+They are discarded by a DELETE request:
+
+  >>> print(http_call(wsgi_app(), 'DELETE', '/++rest++stream/++profiles++',
+  ...                 **manager).getStatus())
+  200
+  >>> os.listdir(directory)
+  []
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Otter(content.Model):
+    pass
+
+
+class StreamLayer(rest.IRESTLayer):
+    rest.restskin('stream')
+
+
+def splash():
+    return b'Splash'
+
+
+class OtterRest(rest.REST):
+    view.layer(StreamLayer)
+    grok.context(Otter)
+
+    def GET(self):
+        return splash()
+
+    def PUT(self):
+        return b'Dive'
@@ -0,0 +1,117 @@
+"""
+The REST methods of a module are registered together, by a single
+configuration action:
+
+  >>> from zope.configuration.config import ConfigurationMachine
+  >>> from grokcore.component.zcml import do_grok
+  >>> from grokcore.rest.meta import registerRESTMethods
+  >>> config = ConfigurationMachine()
+  >>> do_grok('grokcore.rest.tests.functional.rest.registration', config)
+  >>> len([action for action in config.actions
+  ...      if action['callable'] is registerRESTMethods])
+  1
+
+The action of every method claims the discriminator of its adapter, so
+conflicting registrations are found:
+
+  >>> sorted(action['discriminator'][-1] for action in config.actions
+  ...        if action['discriminator'] is not None
+  ...        and action['discriminator'][0] == 'adapter')
+  ['DELETE', 'GET', 'GET', 'PUT']
+
+and adds the method to the batch registered afterwards.  A method whose
+action is overridden, here by a registration made by an including ZCML
+file, is not registered:
+
+  >>> from zope.configuration.config import resolveConflicts
+  >>> from grokcore.rest.meta import addToBatch
+  >>> config = ConfigurationMachine()
+  >>> config.includepath = ('site.zcml', 'antlers.zcml')
+  >>> do_grok('grokcore.rest.tests.functional.rest.registration', config)
+  >>> config.includepath = ('site.zcml',)
+  >>> config.action(
+  ...     discriminator=('adapter', (Elk, AntlerLayer), Interface, 'GET'),
+  ...     callable=print, args=('Elk overridden',))
+  >>> for action in resolveConflicts(config.actions):
+  ...     if action['callable'] is registerRESTMethods:
+  ...         batch, = action['args']
+  ...         print(sorted((factory.__name__, name)
+  ...                      for factory, view, context, layer, name,
+  ...                      permission in batch))
+  ...     elif action['callable'] in (addToBatch, print):
+  ...         action['callable'](*action['args'])
+  Elk overridden
+  [('ElkRest', 'PUT'), ('MooseRest', 'DELETE'), ('MooseRest', 'GET')]
+
+Views requiring the same permission share their security checker:
+
+  >>> from zope.component import getMultiAdapter
+  >>> from zope.publisher.browser import TestRequest
+  >>> from zope.security.checker import getCheckerForInstancesOf
+  >>> def checker(context, method):
+  ...     view = getMultiAdapter(
+  ...         (context, TestRequest(skin=AntlerLayer)), name=method)
+  ...     return getCheckerForInstancesOf(type(view))
+  >>> checker(Elk(), 'PUT') is checker(Moose(), 'DELETE')
+  True
+  >>> checker(Elk(), 'GET') is checker(Elk(), 'PUT')
+  False
+
+Interfaces without `grok.restskin()` are not taken for REST skins:
+
+  >>> from grokcore.rest.skins import queryRESTSkin
+  >>> queryRESTSkin('antlers') is AntlerLayer
+  True
+  >>> [action['discriminator'] for action in config.actions
+  ...  if action['discriminator'] is not None
+  ...  and action['discriminator'][0] == 'restprotocol']
+  [('restprotocol', 'antlers')]
+
+"""
+import grokcore.component as grok
+from zope.interface import Interface
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Elk(content.Model):
+    pass
+
+
+class Moose(content.Model):
+    pass
+
+
+class IHoofed(Interface):
+    pass
+
+
+class AntlerLayer(rest.IRESTLayer):
+    rest.restskin('antlers')
+
+
+class ElkRest(rest.REST):
+    view.layer(AntlerLayer)
+    grok.context(Elk)
+
+    def GET(self):
+        return b'Elk'
+
+    @security.require('zope.ManageContent')
+    def PUT(self):
+        return b''
+
+
+class MooseRest(rest.REST):
+    view.layer(AntlerLayer)
+    grok.context(Moose)
+
+    def GET(self):
+        return b'Moose'
+
+    @security.require('zope.ManageContent')
+    def DELETE(self):
+        return b''
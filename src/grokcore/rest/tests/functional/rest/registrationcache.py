@@ -0,0 +1,158 @@
+"""
+The REST views and skins of a package can be cached in a directory, so
+later processes need not grok the package again.  We try it on a copy
+of this module, which we are free to change:
+
+  >>> import os
+  >>> import shutil
+  >>> import sys
+  >>> import tempfile
+  >>> modules = tempfile.mkdtemp()
+  >>> path = os.path.join(modules, 'pasture.py')
+  >>> _ = shutil.copy(__file__, path)
+  >>> sys.path.insert(0, modules)
+
+  >>> from zope.configuration.config import ConfigurationMachine
+  >>> from grokcore.rest.registrationcache import grokPackage
+  >>> directory = tempfile.mkdtemp()
+  >>> def grokCached(name):
+  ...     config = ConfigurationMachine()
+  ...     return grokPackage(name, config, directory), config
+
+The first time, the package is grokked and its registrations are
+written to the cache:
+
+  >>> cached, grokked = grokCached('pasture')
+  >>> cached
+  False
+  >>> os.listdir(directory)
+  ['pasture.json']
+
+Afterwards, the same configuration actions are made from the cache.
+`martian` visits the methods of a class in no particular order, so the
+registrations are sorted before they are compared:
+
+  >>> from grokcore.rest.meta import addToBatch
+  >>> def registrations(config):
+  ...     found = []
+  ...     for action in config.actions:
+  ...         if action['callable'] is addToBatch:
+  ...             (factory, view, context, layer, name,
+  ...              permission) = action['args'][1]
+  ...             found.append((
+  ...                 factory.__name__, name, context.__name__,
+  ...                 layer.__name__, permission,
+  ...                 view.__call__.max_body_size,
+  ...                 view.__call__.workpool))
+  ...         if action['discriminator'] is not None and (
+  ...                 action['discriminator'][0] != 'protectName'):
+  ...             found.append(action['discriminator'])
+  ...     return sorted(found, key=repr)
+
+  >>> cached, config = grokCached('pasture')
+  >>> cached
+  True
+  >>> registrations(config)
+  [('HerdRest', 'GET', 'Herd', 'PastureLayer', None, None, 'cpu'),
+   ('HerdRest', 'PUT', 'Herd', 'PastureLayer', 'zope.ManageContent',
+    1024, None),
+   ('adapter', (<class 'pasture.Herd'>, <InterfaceClass pasture.PastureLayer>),
+    <InterfaceClass zope.interface.Interface>, 'GET'),
+   ('adapter', (<class 'pasture.Herd'>, <InterfaceClass pasture.PastureLayer>),
+    <InterfaceClass zope.interface.Interface>, 'PUT'),
+   ('restprotocol', 'pasture')]
+  >>> registrations(config) == registrations(grokked)
+  True
+
+The cache holds plain data:
+
+  >>> import json
+  >>> with open(os.path.join(directory, 'pasture.json')) as stream:
+  ...     data = json.load(stream)
+  >>> sorted(method['factory'] + '.' + method['name']
+  ...        for method in data['methods'])
+  ['pasture:HerdRest.GET', 'pasture:HerdRest.PUT']
+  >>> data['skins']
+  [{'name': 'pasture', 'interface': 'pasture:PastureLayer'}]
+
+The cache is not used once a module of the package changed:
+
+  >>> stat = os.stat(path)
+  >>> os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+  >>> grokCached('pasture')[0]
+  False
+  >>> grokCached('pasture')[0]
+  True
+
+A cache that cannot be read is ignored:
+
+  >>> with open(os.path.join(directory, 'pasture.json'), 'w') as stream:
+  ...     _ = stream.write('{"key": ')
+  >>> grokCached('pasture')[0]
+  False
+  >>> grokCached('pasture')[0]
+  True
+
+Packages registering other components than REST views and skins are
+not cached:
+
+  >>> grokCached('grokcore.rest.serializers')[0]
+  False
+  >>> grokCached('grokcore.rest.serializers')[0]
+  False
+  >>> os.listdir(directory)
+  ['pasture.json']
+
+In ZCML, packages are grokked with a cache by the ``grok:grokcached``
+directive:
+
+  >>> from zope.configuration import xmlconfig
+  >>> config = xmlconfig.string('''
+  ... <configure xmlns="http://namespaces.zope.org/zope"
+  ...            xmlns:grok="http://namespaces.zope.org/grok">
+  ...   <include package="zope.component" file="meta.zcml" />
+  ...   <include package="zope.security" file="meta.zcml" />
+  ...   <include package="zope.app.publication" file="meta.zcml" />
+  ...   <include package="grokcore.rest" file="meta.zcml" />
+  ...   <grok:grokcached package="pasture" directory="%s" />
+  ... </configure>''' % directory, execute=False)
+  >>> [registration for registration in registrations(config)
+  ...  if registration[0] == 'HerdRest']
+  [('HerdRest', 'GET', 'Herd', 'PastureLayer', None, None, 'cpu'),
+   ('HerdRest', 'PUT', 'Herd', 'PastureLayer', 'zope.ManageContent',
+    1024, None)]
+
+  >>> sys.path.remove(modules)
+  >>> del sys.modules['pasture']
+  >>> shutil.rmtree(modules)
+  >>> shutil.rmtree(directory)
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Herd(content.Model):
+    pass
+
+
+class PastureLayer(rest.IRESTLayer):
+    rest.restskin('pasture')
+
+
+class HerdRest(rest.REST):
+    view.layer(PastureLayer)
+    grok.context(Herd)
+
+    @rest.workpool('cpu')
+    def GET(self):
+        return b'Herd'
+
+    @security.require('zope.ManageContent')
+    @rest.max_body_size(1024)
+    def PUT(self):
+        return b''
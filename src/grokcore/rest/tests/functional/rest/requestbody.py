@@ -0,0 +1,122 @@
+"""
+REST views can read the request body while it arrives, instead of
+getting it as a whole from `body`:
+
+  >>> root = getRootFolder()
+  >>> root['chest'] = Chest()
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++upload/chest',
+  ...                     data='x' * 100000))
+  HTTP/1.1 200 Ok
+  Content-Length: 22
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  65536 + 34464 = 100000
+
+`body_file` is a file-like object.  What was read through `body` before
+is read again:
+
+  >>> print(http_call(wsgi_app(), 'POST', '/++rest++upload/chest',
+  ...                 data='Ook ook').getBody())
+  b'Ook ook|Ook|ook'
+
+The size of request bodies can be limited for a whole class or for a
+single method.  Larger bodies are refused without reading them:
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++limited/chest',
+  ...                     data='x' * 11, handle_errors=True))
+  HTTP/1.1 413 Request Entity Too Large
+  Content-Length: 24
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Request Entity Too Large
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++limited/chest',
+  ...                 data='x' * 10).getBody())
+  b'10'
+
+  >>> print(http_call(wsgi_app(), 'POST', '/++rest++limited/chest',
+  ...                 data='x' * 5, handle_errors=True).getStatus())
+  413
+  >>> print(http_call(wsgi_app(), 'POST', '/++rest++limited/chest',
+  ...                 data='x' * 4).getBody())
+  b'4'
+
+The size is given as a number of bytes:
+
+  >>> class BrokenChestRest(rest.REST):
+  ...     rest.max_body_size('10MB')
+  Traceback (most recent call last):
+  martian.error.GrokImportError: The maximum size of request bodies must be
+  a number of bytes or None, not '10MB'.
+  >>> class BrokenChestRest(rest.REST):
+  ...     rest.max_body_size(-1)
+  Traceback (most recent call last):
+  martian.error.GrokImportError: The maximum size of request bodies must be
+  a number of bytes or None, not -1.
+
+If the client does not tell the size of the body, it is refused as soon
+as too much of it was read:
+
+  >>> import io
+  >>> from zope.publisher.http import HTTPRequest
+  >>> from grokcore.rest.requestbody import checkBodySize
+  >>> request = HTTPRequest(io.BytesIO(b'x' * 20), {})
+  >>> chest = ChestRest(Chest(), request)
+  >>> checkBodySize(chest, 10)
+  >>> chest.body_file.read(8)
+  b'xxxxxxxx'
+  >>> chest.body_file.read(8)
+  Traceback (most recent call last):
+  ...
+  grokcore.rest.requestbody.RequestEntityTooLarge: ...
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Chest(content.Model):
+    pass
+
+
+class UploadLayer(rest.IRESTLayer):
+    rest.restskin('upload')
+
+
+class LimitedLayer(rest.IRESTLayer):
+    rest.restskin('limited')
+
+
+class ChestRest(rest.REST):
+    view.layer(UploadLayer)
+    grok.context(Chest)
+
+    def PUT(self):
+        sizes = [len(chunk) for chunk in self.iter_body()]
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return '%s = %s' % (' + '.join(map(str, sizes)), sum(sizes))
+
+    def POST(self):
+        body = self.body
+        first = self.body_file.read(3)
+        self.body_file.read(1)
+        rest = self.body_file.read()
+        return b'|'.join([body, first, rest])
+
+
+class LimitedChestRest(rest.REST):
+    view.layer(LimitedLayer)
+    grok.context(Chest)
+    rest.max_body_size(10)
+
+    def PUT(self):
+        return str(len(self.body_file.read())).encode()
+
+    @rest.max_body_size(4)
+    def POST(self):
+        return str(len(self.body)).encode()
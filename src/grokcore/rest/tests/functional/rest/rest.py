@@ -142,7 +142,7 @@ methods for the requested resource::
 
   >>> print(str_http_call(wsgi_app(), 'POST', '/++rest++b/app', handle_errors=True))
   HTTP/1.1 405 Method Not Allowed
-  Allow: GET, PUT
+  Allow: GET, HEAD, OPTIONS, PUT
   Content-Length: 18
   Content-Type: text/plain;charset=utf-8
   <BLANKLINE>
@@ -150,7 +150,7 @@ methods for the requested resource::
 
   >>> print(str_http_call(wsgi_app(), 'DELETE', '/++rest++b/app', handle_errors=True))
   HTTP/1.1 405 Method Not Allowed
-  Allow: GET, PUT
+  Allow: GET, HEAD, OPTIONS, PUT
   Content-Length: 18
   Content-Type: text/plain;charset=utf-8
   <BLANKLINE>
@@ -158,7 +158,7 @@ methods for the requested resource::
 
   >>> print(str_http_call(wsgi_app(), 'POST', '/++rest++c/app', handle_errors=True))
   HTTP/1.1 405 Method Not Allowed
-  Allow:
+  Allow: OPTIONS
   Content-Length: 18
   Content-Type: text/plain;charset=utf-8
   <BLANKLINE>
@@ -168,7 +168,7 @@ We can also try this with a completely made-up request method, like FROG::
 
   >>> print(str_http_call(wsgi_app(), 'FROG', '/++rest++b/app', handle_errors=True))
   HTTP/1.1 405 Method Not Allowed
-  Allow: GET, PUT
+  Allow: GET, HEAD, OPTIONS, PUT
   Content-Length: 18
   Content-Type: text/plain;charset=utf-8
   <BLANKLINE>
@@ -306,7 +306,7 @@ is none more specifically declared::
 
 Todo:
 
-* Support for OPTIONS, HEAD, other methods?
+* Support for other methods?
 
 * Content-Type header is there for GET/POST, but not for PUT/DELETE...
 """  # noqa: E501 line too long
@@ -0,0 +1,88 @@
+"""
+Every method of a REST view that gets grokked is recorded as a route in
+an index, which is available as a utility:
+
+  >>> from zope.component import getUtility
+  >>> from grokcore.rest.interfaces import IRESTRouteIndex
+  >>> index = getUtility(IRESTRouteIndex)
+
+A route can be looked up by the layer, context and HTTP method it is
+registered for:
+
+  >>> route = index.get(RouteLayer, Totem, 'GET')
+  >>> route
+  <Route GET grokcore.rest.tests.functional.rest.routes.Totem on
+   grokcore.rest.tests.functional.rest.routes.RouteLayer>
+  >>> route.factory is TotemRest
+  True
+  >>> issubclass(route.view, TotemRest)
+  True
+  >>> route.permission
+  'zope.Public'
+
+  >>> index.get(RouteLayer, Totem, 'POST') is None
+  True
+
+It is the very view class that is registered as an adapter:
+
+  >>> from zope.publisher.browser import TestRequest
+  >>> from zope.component import getMultiAdapter
+  >>> request = TestRequest(skin=RouteLayer)
+  >>> view = getMultiAdapter((Totem(), request), name='GET')
+  >>> type(view) is route.view
+  True
+
+We can also query for all routes matching some criteria:
+
+  >>> sorted(route.method for route in index.query(layer=RouteLayer))
+  ['DELETE', 'GET']
+  >>> {route.layer for route in index.query(context=Totem)} == {RouteLayer}
+  True
+
+The default REST views are in the index as well:
+
+  >>> from zope.interface import Interface
+  >>> from grokcore.rest import IRESTLayer
+  >>> len(index.query(layer=IRESTLayer, context=Interface)) >= 4
+  True
+  >>> 'GET' in index.methods()
+  True
+
+Finally, a listing of routes can be obtained, for instance to log it
+on startup:
+
+  >>> print(index.dump(layer=RouteLayer))
+  grokcore.rest.tests.functional.rest.routes.RouteLayer
+  grokcore.rest.tests.functional.rest.routes.Totem DELETE
+  -> grokcore.rest.tests.functional.rest.routes.TotemRest (zope.ManageContent)
+  grokcore.rest.tests.functional.rest.routes.RouteLayer
+  grokcore.rest.tests.functional.rest.routes.Totem GET
+  -> grokcore.rest.tests.functional.rest.routes.TotemRest (zope.Public)
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Totem(content.Model):
+    pass
+
+
+class RouteLayer(rest.IRESTLayer):
+    rest.restskin('routes')
+
+
+class TotemRest(rest.REST):
+    view.layer(RouteLayer)
+    grok.context(Totem)
+
+    def GET(self):
+        return "GET"
+
+    @security.require('zope.ManageContent')
+    def DELETE(self):
+        return "DELETE"
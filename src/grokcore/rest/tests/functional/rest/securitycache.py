@@ -0,0 +1,102 @@
+"""
+The decisions of the security policy on REST views can be cached across
+requests:
+
+  >>> import transaction
+  >>> from grokcore.rest import securitycache
+  >>> securitycache.setSecurityCacheEnabled(True, ttl=60)
+
+  >>> root = getRootFolder()
+  >>> root['herd'] = herd = Herd()
+  >>> herd['lenny'] = Mammoth('lenny')
+  >>> herd['molly'] = Mammoth('molly')
+  >>> transaction.commit()
+
+  >>> from zope.securitypolicy.interfaces import IPrincipalPermissionManager
+  >>> herd_perms = IPrincipalPermissionManager(herd)
+  >>> herd_perms.grantPermissionToPrincipal('herd.Feed', 'zope.anybody')
+  >>> transaction.commit()
+
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++herd/herd/lenny').getBody())
+  b'lenny'
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++herd/herd/molly').getBody())
+  b'molly'
+  >>> len(securitycache._decisions)
+  2
+
+Since the policy does not announce changes of grants, the decisions
+stay in place until they expire:
+
+  >>> herd_perms.denyPermissionToPrincipal('herd.Feed', 'zope.anybody')
+  >>> transaction.commit()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++herd/herd/lenny').getBody())
+  b'lenny'
+
+...or until the cache is invalidated:
+
+  >>> securitycache.invalidateSecurityCache()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++herd/herd/lenny'))
+  Traceback (most recent call last):
+  ...
+  zope.security.interfaces.Unauthorized: \
+  (<grokcore.rest.meta.MammothRest object at 0...>, '__call__', 'herd.Feed')
+
+Refusals are cached as well:
+
+  >>> herd_perms.grantPermissionToPrincipal('herd.Feed', 'zope.anybody')
+  >>> transaction.commit()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++herd/herd/lenny'))
+  Traceback (most recent call last):
+  ...
+  zope.security.interfaces.Unauthorized: \
+  (<grokcore.rest.meta.MammothRest object at 0...>, '__call__', 'herd.Feed')
+
+Decisions expire after the time given when enabling the cache:
+
+  >>> from grokcore.rest.securitycache import SecurityDecisionCache
+  >>> now = [0]
+  >>> cache = SecurityDecisionCache(ttl=5, clock=lambda: now[0])
+  >>> cache.set('key', True)
+  >>> cache.get('key')
+  True
+  >>> now[0] = 5
+  >>> cache.get('key') is None
+  True
+
+  >>> securitycache.setSecurityCacheEnabled(False)
+  >>> transaction.abort()
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import security
+from grokcore import view
+
+
+class Herd(content.Container):
+    pass
+
+
+class Mammoth(content.Model):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class HerdLayer(rest.IRESTLayer):
+    rest.restskin('herd')
+
+
+class FeedMammoth(security.Permission):
+    grok.name('herd.Feed')
+
+
+class MammothRest(rest.REST):
+    view.layer(HerdLayer)
+    grok.context(Mammoth)
+
+    @security.require(FeedMammoth)
+    def GET(self):
+        return self.context.name.encode()
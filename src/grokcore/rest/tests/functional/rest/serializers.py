@@ -0,0 +1,141 @@
+"""
+REST methods can return plain data, which is serialized as JSON by
+default:
+
+  >>> import json
+  >>> root = getRootFolder()
+  >>> root['herd'] = Herd()
+
+  >>> response = http_call(wsgi_app(), 'GET', '/++rest++serializers/herd')
+  >>> response.getHeader('Content-Type')
+  'application/json'
+  >>> response.getHeader('Vary')
+  'Accept'
+  >>> json.loads(response.getBody())
+  [{'name': 'Bolt', 'age': 7}, {'name': 'Tusk', 'age': 12}]
+
+Whichever JSON library is used, data is encoded like the `json` module
+does:
+
+  >>> from grokcore.rest.serializers import dumpJSON
+  >>> dumpJSON({1: 'a'})
+  b'{"1":"a"}'
+  >>> dumpJSON([2**70])
+  b'[1180591620717411303424]'
+
+The client can ask for other formats:
+
+  >>> response = http_call(wsgi_app(), 'GET', '/++rest++serializers/herd',
+  ...                      Accept='text/csv')
+  >>> response.getHeader('Content-Type')
+  'text/csv;charset=utf-8'
+  >>> response.getBody()
+  b'name,age\\r\\nBolt,7\\r\\nTusk,12\\r\\n'
+
+Quality values and wildcards are taken into account.  If nothing that
+the client accepts is available, JSON is sent anyway:
+
+  >>> def content_type(accept):
+  ...     return http_call(wsgi_app(), 'GET', '/++rest++serializers/herd',
+  ...                      Accept=accept).getHeader('Content-Type')
+  >>> content_type('text/csv;q=0.5, application/json')
+  'application/json'
+  >>> content_type('application/json;q=0.5, text/*')
+  'text/csv;charset=utf-8'
+  >>> content_type('text/html, */*;q=0.1')
+  'application/json'
+  >>> content_type('image/png')
+  'application/json'
+
+Applications register more serializers as named adapters of the
+request.  They can be registered for a REST layer only:
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++serializers/herd',
+  ...                     Accept='text/plain'))
+  HTTP/1.1 200 Ok
+  Content-Length: 57
+  Content-Type: text/plain;charset=utf-8
+  Vary: Accept
+  <BLANKLINE>
+  [{'name': 'Bolt', 'age': 7}, {'name': 'Tusk', 'age': 12}]
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++otherserializers/herd',
+  ...                 Accept='text/plain').getHeader('Content-Type'))
+  application/json
+
+HEAD requests get the headers of the serialized data, but the data is
+not serialized:
+
+  >>> ReprSerializer.calls = 0
+  >>> response = http_call(wsgi_app(), 'HEAD', '/++rest++serializers/herd',
+  ...                      Accept='text/plain')
+  >>> response.getHeader('Content-Type'), response.getHeader('Vary')
+  ('text/plain;charset=utf-8', 'Accept')
+  >>> response.getBody()
+  b''
+  >>> ReprSerializer.calls
+  0
+
+Strings are still sent as they are:
+
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++serializers/herd',
+  ...                     Accept='text/csv'))
+  HTTP/1.1 200 Ok
+  Content-Length: 5
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  Thump
+
+"""
+import grokcore.component as grok
+from zope.interface import implementer
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Herd(content.Model):
+    pass
+
+
+class SerializersLayer(rest.IRESTLayer):
+    rest.restskin('serializers')
+
+
+class OtherSerializersLayer(rest.IRESTLayer):
+    rest.restskin('otherserializers')
+
+
+class HerdRest(rest.REST):
+    view.layer(SerializersLayer)
+    grok.context(Herd)
+
+    def GET(self):
+        return [{'name': 'Bolt', 'age': 7}, {'name': 'Tusk', 'age': 12}]
+
+    def PUT(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return 'Thump'
+
+
+class OtherHerdRest(rest.REST):
+    view.layer(OtherSerializersLayer)
+    grok.context(Herd)
+
+    def GET(self):
+        return {'name': 'Bolt'}
+
+
+@implementer(rest.IRESTSerializer)
+class ReprSerializer(grok.Adapter):
+    grok.context(SerializersLayer)
+    grok.provides(rest.IRESTSerializer)
+    grok.name('text/plain')
+
+    media_type = 'text/plain;charset=utf-8'
+    calls = 0
+
+    def serialize(self, data):
+        ReprSerializer.calls += 1
+        return repr(data).encode('utf-8')
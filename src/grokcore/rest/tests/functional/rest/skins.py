@@ -0,0 +1,105 @@
+"""
+REST skins declared with `grok.restskin()` are registered as
+`IRESTSkinType` utilities, which are remembered once they were found:
+
+  >>> from grokcore.rest.skins import queryRESTSkin
+  >>> queryRESTSkin('scales') is ScalesLayer
+  True
+  >>> print(queryRESTSkin('feathers'))
+  None
+
+They are registered as utilities as well:
+
+  >>> from zope.component import getUtility
+  >>> from grokcore.rest import IRESTSkinType
+  >>> getUtility(IRESTSkinType, 'scales') is ScalesLayer
+  True
+
+Applying a skin replaces the skins the request had before, just like
+`applySkin()` does.  The outcome is remembered, so requests starting out
+alike share the very same declaration:
+
+  >>> from zope.interface import providedBy
+  >>> from zope.publisher.browser import TestRequest
+  >>> from zope.publisher.interfaces.browser import IDefaultBrowserLayer
+  >>> from grokcore.rest.skins import applyRESTSkin
+  >>> first = TestRequest()
+  >>> second = TestRequest()
+  >>> applyRESTSkin(first, ScalesLayer)
+  >>> applyRESTSkin(second, ScalesLayer)
+  >>> ScalesLayer.providedBy(second)
+  True
+  >>> IDefaultBrowserLayer.providedBy(second)
+  False
+  >>> providedBy(first) is providedBy(second)
+  True
+
+Subscribers still learn about the change of skin:
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from zope.publisher.interfaces import ISkinChangedEvent
+  >>> events = []
+  >>> getGlobalSiteManager().registerHandler(events.append,
+  ...                                        (ISkinChangedEvent,))
+  >>> applyRESTSkin(TestRequest(), ScalesLayer)
+  >>> len(events)
+  1
+  >>> getGlobalSiteManager().unregisterHandler(events.append,
+  ...                                          (ISkinChangedEvent,))
+  True
+
+REST requests use the recorded skins:
+
+  >>> root = getRootFolder()
+  >>> root['rex'] = Dinosaur()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++scales/rex').getBody())
+  b'Rawr'
+
+A skin of the same name registered in a site is used within the site:
+
+  >>> import transaction
+  >>> sm = root.getSiteManager()
+  >>> sm.registerUtility(FeathersLayer, IRESTSkinType, 'scales')
+  >>> transaction.commit()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++scales/rex').getBody())
+  b'Tweet'
+  >>> sm.unregisterUtility(FeathersLayer, IRESTSkinType, 'scales')
+  True
+  >>> transaction.commit()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++scales/rex').getBody())
+  b'Rawr'
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Dinosaur(content.Model):
+    pass
+
+
+class ScalesLayer(rest.IRESTLayer):
+    rest.restskin('scales')
+
+
+class FeathersLayer(rest.IRESTLayer):
+    pass
+
+
+class DinosaurRest(rest.REST):
+    view.layer(ScalesLayer)
+    grok.context(Dinosaur)
+
+    def GET(self):
+        return b'Rawr'
+
+
+class FeatheredDinosaurRest(rest.REST):
+    view.layer(FeathersLayer)
+    grok.context(Dinosaur)
+
+    def GET(self):
+        return b'Tweet'
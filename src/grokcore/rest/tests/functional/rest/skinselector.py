@@ -0,0 +1,101 @@
+"""
+The REST skin of a request can be chosen without a ``++rest++`` step in
+the URL, by registering an `IRESTSkinSelector` utility:
+
+  >>> root = getRootFolder()
+  >>> root['tortoise'] = Tortoise()
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from grokcore.rest import IRESTSkinSelector
+  >>> from grokcore.rest.skins import RESTSkinSelector
+  >>> selector = RESTSkinSelector(
+  ...     header='X-API-Skin', vendor='application/vnd.shell.',
+  ...     hosts={'api.example.com': 'shellv1'})
+  >>> getGlobalSiteManager().registerUtility(selector, IRESTSkinSelector)
+
+The skin can be named by a header:
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/tortoise',
+  ...                     **{'X-API-Skin': 'shellv2'}))
+  HTTP/1.1 200 Ok
+  Content-Length: 9
+  Content-Type: text/plain;charset=utf-8
+  Vary: X-API-Skin
+  <BLANKLINE>
+  Shell v2!
+
+by a vendor media type the client accepts:
+
+  >>> response = http_call(wsgi_app(), 'GET', '/tortoise',
+  ...                      Accept='application/vnd.shell.shellv1+json')
+  >>> response.getBody()
+  b'Shell v1!'
+  >>> response.getHeader('Vary')
+  'X-API-Skin, Accept'
+
+or by the host name:
+
+  >>> print(http_call(wsgi_app(), 'GET', 'http://api.example.com/tortoise',
+  ...                 Host='api.example.com:8080').getBody())
+  b'Shell v1!'
+
+Other requests are published as before:
+
+  >>> print(http_call(wsgi_app(), 'GET', '/tortoise').getBody())
+  b'Just a tortoise'
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++shellv2/tortoise',
+  ...                 ).getBody())
+  b'Shell v2!'
+
+Unknown skins are ignored:
+
+  >>> print(http_call(wsgi_app(), 'GET', '/tortoise',
+  ...                 **{'X-API-Skin': 'fur'}).getBody())
+  b'Just a tortoise'
+
+  >>> getGlobalSiteManager().unregisterUtility(selector, IRESTSkinSelector)
+  True
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Tortoise(content.Model):
+    pass
+
+
+class ShellV1Layer(rest.IRESTLayer):
+    rest.restskin('shellv1')
+
+
+class ShellV2Layer(rest.IRESTLayer):
+    rest.restskin('shellv2')
+
+
+class Index(view.View):
+    grok.context(Tortoise)
+
+    def render(self):
+        return 'Just a tortoise'
+
+
+class TortoiseV1Rest(rest.REST):
+    view.layer(ShellV1Layer)
+    grok.context(Tortoise)
+
+    def GET(self):
+        return b'Shell v1!'
+
+
+class TortoiseV2Rest(rest.REST):
+    view.layer(ShellV2Layer)
+    grok.context(Tortoise)
+
+    def GET(self):
+        self.request.response.setHeader(
+            'Content-Type', 'text/plain;charset=utf-8')
+        return 'Shell v2!'
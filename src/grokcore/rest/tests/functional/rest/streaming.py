@@ -0,0 +1,127 @@
+"""
+REST methods can return a generator, which is sent while it runs:
+
+  >>> root = getRootFolder()
+  >>> root['quarry'] = Quarry()
+
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++streaming/quarry'))
+  HTTP/1.1 200 Ok
+  Content-Type: text/csv;charset=utf-8
+  <BLANKLINE>
+  stone,0
+  stone,1
+  stone,2
+
+The body is not produced by the publisher, but by the WSGI server
+iterating over the response.  No ``Content-Length:`` is sent, so the
+server can use chunked transfer encoding:
+
+  >>> from webob import Request
+  >>> environ = Request.blank('/++rest++streaming/quarry').environ
+  >>> started = []
+  >>> Quarry.mined = 0
+  >>> body = iter(wsgi_app()(environ, lambda *args: started.append(args)))
+  >>> next(body)
+  b'stone,0\\n'
+  >>> Quarry.mined
+  1
+  >>> status, headers = started[0]
+  >>> status
+  '200 Ok'
+  >>> 'Content-Length' in dict(headers)
+  False
+  >>> list(body)
+  [b'stone,1\\n', b'stone,2\\n']
+
+File-like objects are read in chunks.  Other iterators work as well:
+
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++streaming/quarry',
+  ...                 data='granite').getBody())
+  b'granite'
+  >>> print(http_call(wsgi_app(), 'DELETE',
+  ...                 '/++rest++streaming/quarry').getBody())
+  b'abc'
+
+The file is closed when the server is done with the response:
+
+  >>> print(Quarry.file.closed)
+  True
+
+HEAD requests do not produce the body at all:
+
+  >>> Quarry.mined = 0
+  >>> print(http_call(wsgi_app(), 'HEAD',
+  ...                 '/++rest++streaming/quarry').getHeader('Content-Type'))
+  text/csv;charset=utf-8
+  >>> Quarry.mined
+  0
+
+The database connection of the request stays open until the body is
+sent, so generators can read persistent objects while they run:
+
+  >>> import transaction
+  >>> root['mine'] = Mine()
+  >>> for name in ['coal', 'copper', 'tin']:
+  ...     root['mine'][name] = Quarry()
+  >>> transaction.commit()
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++streaming/mine'))
+  HTTP/1.1 200 Ok
+  Content-Type: text/plain;charset=utf-8
+  <BLANKLINE>
+  coal
+  copper
+  tin
+
+"""
+import io
+
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Quarry(content.Model):
+    mined = 0
+    file = None
+
+
+class Mine(content.Container):
+    pass
+
+
+class StreamingLayer(rest.IRESTLayer):
+    rest.restskin('streaming')
+
+
+class QuarryRest(rest.REST):
+    view.layer(StreamingLayer)
+    grok.context(Quarry)
+
+    def GET(self):
+        def rows():
+            for i in range(3):
+                Quarry.mined += 1
+                yield 'stone,%s\n' % i
+        return rest.StreamingResult(
+            rows(), content_type='text/csv;charset=utf-8')
+
+    def PUT(self):
+        Quarry.file = io.BytesIO(self.body)
+        return Quarry.file
+
+    def DELETE(self):
+        return iter([b'a', b'b', b'c'])
+
+
+class MineRest(rest.REST):
+    view.layer(StreamingLayer)
+    grok.context(Mine)
+
+    def GET(self):
+        def names():
+            for name in self.context.keys():
+                yield name + '\n'
+        return rest.StreamingResult(
+            names(), content_type='text/plain;charset=utf-8')
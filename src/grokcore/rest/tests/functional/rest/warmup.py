@@ -0,0 +1,96 @@
+"""
+Before a server forks its workers, the lookups of REST requests can be
+made for every route and skin:
+
+  >>> from grokcore.rest.dispatch import _dispatch_table
+  >>> from grokcore.rest.dispatch import setDispatchCacheEnabled
+  >>> from grokcore.rest.rest import _allowed_methods
+  >>> from grokcore.rest import skins
+  >>> from grokcore.rest.warmup import warmUp
+  >>> setDispatchCacheEnabled(True)
+  >>> warmUp() > 0
+  True
+
+Requests find the answers to their lookups warmed up, so the tables do
+not grow:
+
+  >>> from grokcore.rest.dispatch import queryMethodView
+  >>> from grokcore.rest.rest import getAllowedMethods
+  >>> from grokcore.rest.warmup import makeRequest
+  >>> def sizes():
+  ...     return (len(_dispatch_table.get()), len(_allowed_methods.get()),
+  ...             len(skins._skinned))
+  >>> def publish(method):
+  ...     request = makeRequest(method)
+  ...     skins.applyRESTSkin(request, StableLayer)
+  ...     view, checker = queryMethodView(Pony(), request, method)
+  ...     return type(view).__name__, getAllowedMethods(Pony(), request)
+
+  >>> warmed = sizes()
+  >>> publish('GET')
+  ('PonyRest', ('GET', 'HEAD', 'OPTIONS', 'PUT'))
+  >>> publish('PUT')
+  ('PonyRest', ('GET', 'HEAD', 'OPTIONS', 'PUT'))
+  >>> publish('DELETE')
+  ('NotAllowedREST', ('GET', 'HEAD', 'OPTIONS', 'PUT'))
+  >>> sizes() == warmed
+  True
+
+Once frozen, the tables are not written to anymore, even by lookups
+that were not warmed up:
+
+  >>> from grokcore.rest.warmup import freeze
+  >>> from grokcore.rest.warmup import isFrozen
+  >>> freeze()
+  >>> isFrozen()
+  True
+  >>> request = makeRequest('GET')
+  >>> skins.applyRESTSkin(request, StableLayer)
+  >>> getAllowedMethods(Pony(), request)
+  ('GET', 'HEAD', 'OPTIONS', 'PUT')
+  >>> class Foal(Pony):
+  ...     pass
+  >>> getAllowedMethods(Foal(), request)
+  ('GET', 'HEAD', 'OPTIONS', 'PUT')
+  >>> sizes() == warmed
+  True
+
+Requests are published as before:
+
+  >>> root = getRootFolder()
+  >>> root['pony'] = Pony()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++stable/pony').getBody())
+  b'Neigh'
+  >>> print(http_call(wsgi_app(), 'DELETE', '/++rest++stable/pony',
+  ...                 handle_errors=True).getHeader('Allow'))
+  GET, HEAD, OPTIONS, PUT
+
+  >>> from grokcore.rest.warmup import thaw
+  >>> thaw()
+  >>> setDispatchCacheEnabled(False)
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Pony(content.Model):
+    pass
+
+
+class StableLayer(rest.IRESTLayer):
+    rest.restskin('stable')
+
+
+class PonyRest(rest.REST):
+    view.layer(StableLayer)
+    grok.context(Pony)
+
+    def GET(self):
+        return b'Neigh'
+
+    def PUT(self):
+        return b''
@@ -0,0 +1,93 @@
+"""
+Expensive REST methods can be limited to a pool with the
+`grok.workpool()` directive:
+
+  >>> from grokcore.rest.workpools import configureWorkPool
+  >>> from grokcore.rest.workpools import getWorkPool
+  >>> configureWorkPool('reports', size=1, queue_size=1, timeout=0.01,
+  ...                   retry_after=30)
+
+  >>> root = getRootFolder()
+  >>> root['ledger'] = Ledger()
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++office/ledger').getBody())
+  b'Report'
+
+While the pool is busy, requests wait for their turn, and are turned
+away when they don't get it in time:
+
+  >>> pool = getWorkPool('reports')
+  >>> pool.acquire()
+  True
+  >>> print(str_http_call(wsgi_app(), 'GET', '/++rest++office/ledger',
+  ...                     handle_errors=True))
+  HTTP/1.1 503 Service Unavailable
+  Content-Length: 19
+  Content-Type: text/plain;charset=utf-8
+  Retry-After: 30
+  <BLANKLINE>
+  Service Unavailable
+
+Methods in other pools, and methods without a pool, are not affected:
+
+  >>> print(http_call(wsgi_app(), 'POST', '/++rest++office/ledger').getBody())
+  b'Filed'
+  >>> print(http_call(wsgi_app(), 'PUT', '/++rest++office/ledger').getBody())
+  b'Uploaded'
+
+  >>> pool.release()
+  >>> pool.running, pool.waiting
+  (0, 0)
+  >>> print(http_call(wsgi_app(), 'GET', '/++rest++office/ledger').getBody())
+  b'Report'
+
+Pools that are not configured are made on first use; the ``cpu`` pool
+runs as many methods as there are processors, the ``io`` pool four
+times as many.  Requests do not wait for them:
+
+  >>> import os
+  >>> pool = getWorkPool('io')
+  >>> pool.size == 4 * (os.cpu_count() or 1), pool.queue_size
+  (True, 0)
+  >>> all(pool.acquire() for i in range(pool.size))
+  True
+  >>> print(str_http_call(wsgi_app(), 'PUT', '/++rest++office/ledger',
+  ...                     handle_errors=True))
+  HTTP/1.1 503 Service Unavailable
+  Content-Length: 19
+  Content-Type: text/plain;charset=utf-8
+  Retry-After: 5
+  <BLANKLINE>
+  Service Unavailable
+  >>> for i in range(pool.size):
+  ...     pool.release()
+
+"""
+import grokcore.component as grok
+
+from grokcore import content
+from grokcore import rest
+from grokcore import view
+
+
+class Ledger(content.Model):
+    pass
+
+
+class OfficeLayer(rest.IRESTLayer):
+    rest.restskin('office')
+
+
+class LedgerRest(rest.REST):
+    view.layer(OfficeLayer)
+    grok.context(Ledger)
+
+    @rest.workpool('reports')
+    def GET(self):
+        return b'Report'
+
+    def POST(self):
+        return b'Filed'
+
+    @rest.workpool('io')
+    def PUT(self):
+        return b'Uploaded'
@@ -0,0 +1,150 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Warming up and freezing the lookup caches of REST requests.
+
+Looking up REST views, the ``Allow:`` header of 405 answers and the
+declarations of skinned requests fills caches the first time a
+combination of object, request and method is seen.  A server forking
+its workers after configuration would have every worker fill them again,
+and writing to them copies the memory pages they share with the parent.
+Instead, the parent calls::
+
+  warmUp()
+  freeze()
+  gc.freeze()
+
+before forking.  `warmUp()` makes the lookups of every route in the
+route index, for the request classes the publisher chooses for its
+method and every REST skin; `freeze()` then keeps the tables of
+`grokcore.rest` from being written to.  Values not warmed up are still
+computed, but no longer remembered.
+
+Routes registered for interfaces rather than classes cannot be warmed
+up, as the lookups are keyed on what objects actually provide.  The
+tables are kept per adapter registry: `site` warms up those of a local
+site manager, which only helps the workers using that very registry
+object.
+
+"""
+import io
+
+from zope import component
+from zope.app.publication.httpfactory import chooseClasses
+from zope.component.hooks import site as currentSite
+from zope.configuration.exceptions import ConfigurationError
+from zope.interface import implementedBy
+from zope.interface import providedBy
+from zope.publisher.interfaces import ISkinnable
+from zope.publisher.skinnable import setDefaultSkin
+
+from grokcore.rest.dispatch import _dispatch_table
+from grokcore.rest.dispatch import warmUpDispatch
+from grokcore.rest.interfaces import IRESTSkinType
+from grokcore.rest.rest import _allowed_methods
+from grokcore.rest.rest import queryAllowedMethods
+from grokcore.rest.routes import routeIndex
+from grokcore.rest.skins import applyRESTSkin
+from grokcore.rest.skins import queryRESTSkin
+from grokcore.rest.skins import setSkinTableFrozen
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+# Methods answered by default views, besides those of the routes.
+DEFAULT_METHODS = ('HEAD', 'OPTIONS')
+
+_frozen = False
+
+
+def warmUp(site=None):
+    """Make the lookups of every REST route and skin.
+
+    Returns the number of combinations of object, request and method
+    looked up.
+    """
+    if site is None:
+        return _warmUp()
+    with currentSite(site):
+        return _warmUp()
+
+
+def _warmUp():
+    methods = sorted(set(routeIndex.methods()).union(DEFAULT_METHODS))
+    skins = [queryRESTSkin(name)
+             for name, skin in component.getUtilitiesFor(IRESTSkinType)]
+    routes = [route for route in routeIndex
+              if isinstance(route.context, type)]
+    count = 0
+    for method in methods:
+        for skin in skins:
+            request = makeRequest(method)
+            if request is None:
+                break
+            applyRESTSkin(request, skin)
+            request_spec = providedBy(request)
+            contexts = {route.context for route in routes
+                        if request_spec.isOrExtends(route.layer)}
+            for context in contexts:
+                context_spec = implementedBy(context)
+                warmUpDispatch(context_spec, request_spec, method)
+                queryAllowedMethods(context_spec, request_spec)
+                count += 1
+    return count
+
+
+def makeRequest(method):
+    """Return a request for `method`, as the publisher would make it.
+
+    Returns `None` if no publisher handles the method.
+    """
+    environment = {'REQUEST_METHOD': method}
+    try:
+        request_class, publication_class = chooseClasses(method, environment)
+    except ConfigurationError:
+        return None
+    request = request_class(io.BytesIO(), environment)
+    if ISkinnable.providedBy(request):
+        setDefaultSkin(request)
+    return request
+
+
+def freeze():
+    """Stop remembering the results of lookups not warmed up."""
+    global _frozen
+    _dispatch_table.freeze()
+    _allowed_methods.freeze()
+    setSkinTableFrozen(True)
+    _frozen = True
+
+
+def thaw():
+    """Remember the results of lookups again."""
+    global _frozen
+    _dispatch_table.thaw()
+    _allowed_methods.thaw()
+    setSkinTableFrozen(False)
+    _frozen = False
+
+
+def isFrozen():
+    return _frozen
+
+
+addCleanUp(thaw)
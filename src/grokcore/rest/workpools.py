@@ -0,0 +1,151 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Bounded pools for expensive REST methods.
+
+REST methods marked with ``grok.workpool('cpu')`` or
+``grok.workpool('io')`` are only run when their pool has room.  A pool
+runs at most `size` of its methods at the same time; up to `queue_size`
+more requests wait for their turn, at most `timeout` seconds.  Requests
+beyond that are answered with 503 Service Unavailable and a
+``Retry-After:`` header, so a burst of slow requests cannot occupy all
+the threads of the server, and the cheap ones keep being answered.
+
+The methods still run in the thread publishing the request, as the
+database connection and the security interaction of the request belong
+to it.
+
+Pools are made on first use with the defaults below and can be
+configured with `configureWorkPool()`.  As the number of threads of the
+server is not known here, requests don't wait for the pools made by
+default: once all their places are taken, further requests are turned
+away at once instead of holding on to a thread of the server.
+
+"""
+import os
+import threading
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ImportError:  # pragma: no cover
+
+    def addCleanUp(x):
+        pass
+
+
+DEFAULT_TIMEOUT = 1
+RETRY_AFTER = 5
+
+
+class ServiceUnavailable(Exception):
+    """The work pool of a REST method is saturated.
+
+    `retry_after` is the number of seconds the client should wait before
+    trying again.
+
+    """
+    status = 503
+    reason = 'Service Unavailable'
+
+    def __init__(self, object, request, pool, retry_after=RETRY_AFTER):
+        self.object = object
+        self.request = request
+        self.pool = pool
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return '{!r}, {!r}, {}'.format(self.object, self.request, self.pool)
+
+
+class WorkPool:
+    """Admits at most `size` calls at a time, and `queue_size` waiting."""
+
+    def __init__(self, name, size, queue_size=0, timeout=DEFAULT_TIMEOUT,
+                 retry_after=RETRY_AFTER):
+        self.name = name
+        self.size = size
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.running = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Take a place in the pool; return whether one was free."""
+        with self._condition:
+            if self.running < self.size:
+                self.running += 1
+                return True
+            if self.waiting >= self.queue_size:
+                return False
+            self.waiting += 1
+            try:
+                admitted = self._condition.wait_for(
+                    lambda: self.running < self.size, self.timeout)
+            finally:
+                self.waiting -= 1
+            if admitted:
+                self.running += 1
+            return admitted
+
+    def release(self):
+        with self._condition:
+            self.running -= 1
+            self._condition.notify()
+
+    def call(self, view, func, *args):
+        """Call `func` with `args` when the pool has room for it.
+
+        Raises `ServiceUnavailable` if it does not get a place in time.
+        """
+        if not self.acquire():
+            raise ServiceUnavailable(
+                view.context, view.request, self.name, self.retry_after)
+        try:
+            return func(*args)
+        finally:
+            self.release()
+
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def _defaults(name):
+    cpus = os.cpu_count() or 1
+    if name == 'cpu':
+        return {'size': cpus}
+    return {'size': 4 * cpus}
+
+
+def configureWorkPool(name, size, queue_size=0, timeout=DEFAULT_TIMEOUT,
+                      retry_after=RETRY_AFTER):
+    """Set up the work pool called `name`."""
+    with _lock:
+        _pools[name] = WorkPool(name, size, queue_size, timeout, retry_after)
+
+
+def getWorkPool(name):
+    """Return the work pool called `name`, making it if needed."""
+    pool = _pools.get(name)
+    if pool is None:
+        with _lock:
+            pool = _pools.get(name)
+            if pool is None:
+                pool = _pools[name] = WorkPool(name, **_defaults(name))
+    return pool
+
+
+addCleanUp(_pools.clear)
@@ -0,0 +1,33 @@
+##############################################################################
+#
+# Copyright (c) 2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""ZCML directives of grokcore.rest."""
+from grokcore.component.zcml import IGrokDirective
+from zope.configuration.fields import Path
+
+from grokcore.rest.registrationcache import grokPackage
+
+
+class IGrokCachedDirective(IGrokDirective):
+    """Grok a package of REST views, caching its registrations."""
+
+    directory = Path(
+        title="Directory",
+        description="The directory the registrations are cached in.",
+        required=True)
+
+
+def grokCachedDirective(_context, package, directory, exclude=None):
+    if not exclude:
+        exclude = None
+    grokPackage(package.__name__, _context, directory, exclude)